@@ -4,26 +4,32 @@ This file contains all the code for the borefield calculations.
 from __future__ import annotations
 
 import copy
+import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from math import pi
 from typing import Tuple, Union
 import logging
 
 import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
 import pygfunction as gt
 
 from numpy.typing import ArrayLike
-from scipy.signal import convolve
+from scipy import optimize
 
-from GHEtool.VariableClasses import FluidData, Borehole, GroundConstantTemperature, ResultsMonthly, ResultsHourly
+from GHEtool.VariableClasses import FluidData, Borehole, GroundConstantTemperature, ResultsMonthly, ResultsHourly, \
+    ResultsMonthlyBatch, ResultsHourlyBatch
 from GHEtool.VariableClasses import CustomGFunction, load_custom_gfunction, GFunction, CalculationSetup, Cluster, \
-    EERCombined
+    EERCombined, FFTConvolution, GFunctionStore, FIXED_POINT_ACCELERATIONS, SizingMemo
 from GHEtool.VariableClasses.LoadData import *
 from GHEtool.VariableClasses.LoadData import _LoadData, _LoadDataBuilding
 from GHEtool.VariableClasses.PipeData import _PipeData
-from GHEtool.VariableClasses.BaseClass import BaseClass, UnsolvableDueToTemperatureGradient, MaximumNumberOfIterations
+from GHEtool.VariableClasses.BaseClass import BaseClass, UnsolvableDueToTemperatureGradient, MaximumNumberOfIterations, \
+    SizingStopped
 from GHEtool.VariableClasses.GroundData._GroundData import _GroundData
+from GHEtool.VariableClasses.SizingMemo import fingerprint
 from GHEtool.logger.ghe_logger import ghe_logger
 from GHEtool.Methods import *
 
@@ -33,11 +39,13 @@ class Borefield(BaseClass):
 
     UPM: float = 730.0  # number of hours per month
     THRESHOLD_BOREHOLE_DEPTH: float = 0.05  # threshold for iteration
+    DEPTH_STEP_L2_BATCH: float = 0.01  # relative distance between the depths of the g-value table in size_L2_batch
 
     # define default values
     DEFAULT_INVESTMENT: list = [35, 0]  # 35 EUR/m
     DEFAULT_LENGTH_PEAK: int = 6  # hours
     THRESHOLD_DEPTH_ERROR: int = 10000  # m
+    MAX_MEMOISED_PEAK_GVALUES: int = 100  # number of depths for which the peak g-values are kept
 
     HOURLY_LOAD_ARRAY: np.ndarray = np.arange(0, 8761, UPM).astype(np.uint32)
 
@@ -109,12 +117,21 @@ class Borefield(BaseClass):
                 'Please use the load classes.')
 
         self.limiting_quadrant: int = 0  # parameter that tells in which quadrant the field is limited
+        # True if a running sizing should stop before its next temperature calculation
+        self.stop_sizing: bool = False
         # m hereafter one needs to chance to fewer boreholes with more depth, because the calculations are no longer
         # that accurate.
         self.THRESHOLD_WARNING_SHALLOW_FIELD: int = 50
 
         self.custom_gfunction: CustomGFunction = custom_gfunction
         self.gfunction_calculation_object: GFunction = GFunction()
+        # convolution object which stores the spectrum of the load, so it is only calculated once during sizing
+        self.convolution_object: FFTConvolution = FFTConvolution()
+        # g-values of the peak durations for every depth, so they are only looked up once during sizing
+        self._peak_gvalues: dict = {}
+        self._peak_gvalues_custom_gfunction: CustomGFunction = None
+        # results of the previous sizings, which are reused when sizing_memo is set in the calculation setup
+        self.sizing_memo: SizingMemo = SizingMemo()
 
         ## params w.r.t. pygfunction
         self.options_pygfunction: dict = {"method": "equivalent"}
@@ -422,7 +439,10 @@ class Borefield(BaseClass):
         self.D = np.average([bor.D for bor in borefield])
         self.r_b = np.average([bor.r_b for bor in borefield])
         self._H = np.average([bor.H for bor in borefield])
-        self.gfunction_calculation_object.remove_previous_data()
+        # the data of another borefield is kept in the cache, setting the same borefield again resets its data
+        self.gfunction_calculation_object.remove_previous_data(
+            store_in_cache=not self.gfunction_calculation_object._check_borefield(borefield))
+        self._peak_gvalues = {}
         unequal_depth = np.any([bor.H != borefield[0].H for bor in borefield])
         if unequal_depth:
             self.gfunction_calculation_object._store_previous_values = not unequal_depth
@@ -441,8 +461,9 @@ class Borefield(BaseClass):
         None
         """
         self._borefield = None
-        self.gfunction_calculation_object.remove_previous_data()
+        self.gfunction_calculation_object.remove_previous_data(store_in_cache=True)
         self.custom_gfunction = None
+        self._peak_gvalues = {}
 
     def _update_borefield_depth(self, H: float) -> None:
         """
@@ -471,7 +492,8 @@ class Borefield(BaseClass):
         Parameters
         ----------
         location : str
-            Path to the location of the custom gfunction file
+            Path to the location of the custom gfunction dataset (a .gvd directory or a .gvalues file from previous
+            versions)
 
         Returns
         -------
@@ -629,8 +651,9 @@ class Borefield(BaseClass):
         # new ground data implies that a new g-function should be loaded
         self.custom_gfunction = None
 
-        # the stored gfunction data should be deleted
-        self.gfunction_calculation_object.remove_previous_data()
+        # the stored gfunction data is moved to the cache, since it is only valid for the previous ground data
+        self.gfunction_calculation_object.remove_previous_data(store_in_cache=True)
+        self._peak_gvalues = {}
 
     def set_ground_parameters(self, data: _GroundData) -> None:
         """
@@ -947,6 +970,9 @@ class Borefield(BaseClass):
         .. [#PeereThesis] Peere, W. (2020) Methode voor economische optimalisatie van geothermische verwarmings- en koelsystemen. Master thesis, Department of Mechanical Engineering, KU Leuven, Belgium.
         """
 
+        # the options can change the way the g-values are calculated
+        self._peak_gvalues = {}
+
         # if calculation_setup is not None, then the sizing setup is set directly
         if calculation_setup is not None:
             self._calculation_setup = calculation_setup
@@ -1019,13 +1045,31 @@ class Borefield(BaseClass):
         if not use_constant_Rb is None:
             self.borehole.use_constant_Rb = use_constant_Rb
 
+        memo = self._calculation_setup.sizing_memo
+        if memo:
+            key, configuration, descriptor = self._sizing_memo_keys()
+            stored = self.sizing_memo.get(key)
+            if H_init is None and stored is None:
+                # start from the depth of the most similar sizing, so the g-values around it can be reused
+                H_init = self.sizing_memo.nearest_depth(configuration, descriptor)
+
         # sizes according to the correct algorithm
-        if self._calculation_setup.L2_sizing:
-            depth = self.size_L2(H_init, self._calculation_setup.quadrant_sizing)
-        if self._calculation_setup.L3_sizing:
-            depth = self.size_L3(H_init, self._calculation_setup.quadrant_sizing)
-        if self._calculation_setup.L4_sizing:
-            depth = self.size_L4(H_init, self._calculation_setup.quadrant_sizing)
+        if memo and stored is not None:
+            depth, self.limiting_quadrant, self.results, load_results = stored
+            self.H = depth
+            if load_results is not None:
+                self.load.set_results(load_results)
+        else:
+            if self._calculation_setup.L2_sizing:
+                depth = self.size_L2(H_init, self._calculation_setup.quadrant_sizing)
+            if self._calculation_setup.L3_sizing:
+                depth = self.size_L3(H_init, self._calculation_setup.quadrant_sizing)
+            if self._calculation_setup.L4_sizing:
+                depth = self.size_L4(H_init, self._calculation_setup.quadrant_sizing)
+            if memo:
+                load_results = self.load.results if isinstance(self.load, _LoadDataBuilding) else None
+                self.sizing_memo.store(key, configuration, descriptor, depth, self.limiting_quadrant, self.results,
+                                       load_results)
 
         # reset initial parameters
         self._calculation_setup.restore_backup()
@@ -1042,6 +1086,33 @@ class Borefield(BaseClass):
 
         return depth
 
+    def _sizing_memo_keys(self) -> Tuple[str, str, np.ndarray]:
+        """
+        This function returns the keys under which a sizing is stored in the sizing memo. The fingerprint of the
+        configuration contains the ground data, the borefield geometry (apart from the borehole depth), the borehole
+        data, the g-function settings and the calculation setup (apart from the initial depth). The fingerprint of the
+        sizing adds the load and the temperature limits to it. The descriptor contains the monthly loads and the
+        temperature limits, with which the most similar sizing of the same configuration is found.
+
+        Returns
+        -------
+        tuple[str, str, np.ndarray]
+            Fingerprint of the sizing, fingerprint of the configuration and descriptor of the load and temperature
+            limits
+        """
+        geometry = [(borehole.x, borehole.y, borehole.D, borehole.r_b, borehole.tilt, borehole.orientation)
+                    for borehole in self.borefield]
+        configuration = fingerprint(self.ground_data, geometry, self.borehole, self.custom_gfunction,
+                                    self.options_pygfunction, self.gfunction_calculation_object.options,
+                                    self._calculation_setup, exclude=('H_init', 'sizing_memo'))
+        key = fingerprint(configuration, self.load, self.Tf_max, self.Tf_min)
+        descriptor = np.concatenate((self.load.monthly_baseload_injection_simulation_period,
+                                     self.load.monthly_baseload_extraction_simulation_period,
+                                     self.load.monthly_peak_injection_simulation_period,
+                                     self.load.monthly_peak_extraction_simulation_period,
+                                     [self.Tf_max, self.Tf_min]))
+        return key, configuration, descriptor
+
     def _select_size(self, size_max_temp: float, size_min_temp: float, hourly: bool = False) -> float:
         """
         This function selects the correct size based on a size for the minimum and maximum temperature.
@@ -1182,6 +1253,252 @@ class Borefield(BaseClass):
 
         return self.H
 
+    def size_L2_batch(self, baseload_extraction: ArrayLike, baseload_injection: ArrayLike,
+                      peak_extraction: ArrayLike, peak_injection: ArrayLike,
+                      peak_extraction_duration: ArrayLike = None, peak_injection_duration: ArrayLike = None,
+                      Tf_max: ArrayLike = None, Tf_min: ArrayLike = None, H_init: float = None,
+                      quadrant_sizing: int = 0) -> np.ndarray:
+        """
+        This function sizes the current borefield for many monthly loads at once with the L2 method, which gives the
+        same depths as size_L2 with a MonthlyGeothermalLoadAbsolute for every load. The sizing parameters of all the
+        loads are calculated with array operations and the iterations of all the loads are done together. The g-values
+        and the equivalent borehole thermal resistance are calculated in a table of depths with a relative distance of
+        DEPTH_STEP_L2_BATCH and linearly interpolated in between, so they are only calculated once for all the loads.
+        The simulation period and the duration of the months are the ones of the load of the borefield.
+        Contrary to size_L2, the depth of the borefield is not changed.
+
+        Parameters
+        ----------
+        baseload_extraction : np.ndarray
+            Monthly baseload extraction of every load, with shape (number of loads, 12) [kWh]
+        baseload_injection : np.ndarray
+            Monthly baseload injection of every load, with shape (number of loads, 12) [kWh]
+        peak_extraction : np.ndarray
+            Monthly peak extraction of every load, with shape (number of loads, 12) [kW]
+        peak_injection : np.ndarray
+            Monthly peak injection of every load, with shape (number of loads, 12) [kW]
+        peak_extraction_duration : float, np.ndarray
+            Duration of the extraction peak for all the loads or for every load [hours].
+            If None, the duration of the load of the borefield is used.
+        peak_injection_duration : float, np.ndarray
+            Duration of the injection peak for all the loads or for every load [hours].
+            If None, the duration of the load of the borefield is used.
+        Tf_max : float, np.ndarray
+            Maximum average fluid temperature for all the loads or for every load [deg C].
+            If None, the maximum temperature of the borefield is used.
+        Tf_min : float, np.ndarray
+            Minimum average fluid temperature for all the loads or for every load [deg C].
+            If None, the minimum temperature of the borefield is used.
+        H_init : float
+            Initial depth from where to start the iteration [m]
+        quadrant_sizing : int
+            If a quadrant is given the sizing is performed for this quadrant else for the relevant
+
+        Returns
+        -------
+        H : np.ndarray
+            Required depth of the borefield for every load [m]. This is NaN when the depth did not converge within
+            the maximum number of iterations or when the load cannot be sized due to the temperature gradient.
+
+        Raises
+        ------
+        ValueError
+            ValueError when no ground data is provided, the quadrant is not in range or the loads do not have 12 months.
+        """
+        # check ground data
+        if not self.ground_data.check_values():
+            raise ValueError("Please provide ground data.")
+        # check quadrants
+        if not quadrant_sizing in range(0, 5):
+            raise ValueError(f"Quadrant {quadrant_sizing} does not exist.")
+
+        loads = [np.atleast_2d(np.asarray(load, dtype=np.float64))
+                 for load in (baseload_extraction, baseload_injection, peak_extraction, peak_injection)]
+        if any(load.shape != loads[0].shape or load.shape[1] != 12 for load in loads):
+            raise ValueError("All the loads should have the shape (number of loads, 12).")
+        baseload_extraction, baseload_injection, peak_extraction, peak_injection = loads
+        n = baseload_extraction.shape[0]
+
+        def per_load(value: ArrayLike, default: float) -> np.ndarray:
+            return np.broadcast_to(np.asarray(default if value is None else value, dtype=np.float64), (n,))
+
+        th_extraction = per_load(peak_extraction_duration, self.load.peak_extraction_duration / 3600) * 3600
+        th_injection = per_load(peak_injection_duration, self.load.peak_injection_duration / 3600) * 3600
+        Tf_max = per_load(Tf_max, self.Tf_max)
+        Tf_min = per_load(Tf_min, self.Tf_min)
+
+        # parameters of the loads, as in _calculate_first_year_params and _calculate_last_year_params
+        injection_power = baseload_injection / self.load.UPM
+        extraction_power = baseload_extraction / self.load.UPM
+        peak_injection = np.maximum(peak_injection, injection_power)
+        peak_extraction = np.maximum(peak_extraction, extraction_power)
+        average_power = injection_power - extraction_power
+        # sum of the average power of the previous months
+        previous_power = np.cumsum(average_power, axis=1) - average_power
+        imbalance = np.sum(baseload_injection - baseload_extraction, axis=1)
+        qa = imbalance / 8760. * 1000
+        max_peak_injection = np.max(peak_injection, axis=1) * 1000.
+        max_peak_extraction = np.max(peak_extraction, axis=1) * 1000.
+        time_L3 = self.load.time_L3
+        rows = np.arange(n)
+
+        def month_index(peak_load: np.ndarray, avg_load: np.ndarray) -> np.ndarray:
+            # last month with the highest peak load, or with the highest average load if all the peaks are equal
+            values = np.where(np.all(peak_load == peak_load[:, :1], axis=1)[:, np.newaxis], avg_load, peak_load)
+            return 11 - np.argmax(values[:, ::-1], axis=1)
+
+        def first_year(extraction: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+            if extraction:
+                index = month_index(peak_extraction, extraction_power)
+                th, qh, qm = th_extraction, max_peak_extraction, -average_power[rows, index] * 1000.
+            else:
+                index = month_index(peak_injection, injection_power)
+                th, qh, qm = th_injection, max_peak_injection, average_power[rows, index] * 1000.
+            qpm = previous_power[rows, index] * 1000 / (index + 1)
+            time_steps = np.column_stack((th, th + self.load.tm, time_L3[index] + th))
+            return time_steps, np.column_stack((qh, qm, qpm)), qh
+
+        def last_year(extraction: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+            if extraction:
+                index = month_index(peak_extraction, baseload_extraction)
+                th, qh, qm, qy = th_extraction, max_peak_extraction, -average_power[rows, index] * 1000., -qa
+            else:
+                index = month_index(peak_injection, injection_power)
+                th, qh, qm, qy = th_injection, max_peak_injection, average_power[rows, index] * 1000., qa
+            time_steps = np.column_stack((th, th + self.load.tm, self.load.ty + self.load.tm + th))
+            return time_steps, np.column_stack((qh, qm, qy)), qh
+
+        quadrants = {1: (first_year, False, Tf_max), 2: (last_year, False, Tf_max),
+                     3: (first_year, True, Tf_min), 4: (last_year, True, Tf_min)}
+        if quadrant_sizing != 0:
+            masks = {quadrant_sizing: np.full(n, True)}
+        else:
+            # the relevant quadrants, as in size_L2
+            extraction_dominated = imbalance <= 0
+            masks = {1: extraction_dominated & (max_peak_injection != 0), 2: ~extraction_dominated,
+                     3: ~extraction_dominated & (max_peak_extraction != 0), 4: extraction_dominated}
+        params = {quadrant: tuple(value[mask] for value in quadrants[quadrant][0](quadrants[quadrant][1]))
+                  for quadrant, mask in masks.items() if np.any(mask)}
+        # the g-values of all the quadrants are calculated at the same time values, so the g-function object can
+        # interpolate between the depths
+        time_values = np.unique(np.concatenate([time_steps.ravel() for time_steps, _, _ in params.values()]))
+        H_init = H_init if H_init is not None else self._calculation_setup.H_init
+        H_backup = self.H
+        table = {}
+        sizes = {quadrant: np.zeros(n) for quadrant in range(1, 5)}
+        try:
+            for quadrant, (time_steps, coefficients, qh) in params.items():
+                sizes[quadrant][masks[quadrant]] = self._size_L2_batch_quadrant(
+                    time_steps, coefficients, qh, quadrants[quadrant][2][masks[quadrant]], H_init, time_values, table)
+            if quadrant_sizing != 0:
+                return sizes[quadrant_sizing]
+            size_max_temp = sizes[1] + sizes[2]
+            size_min_temp = sizes[3] + sizes[4]
+            depths = np.maximum(size_max_temp, size_min_temp)
+            if self.ground_data.variable_Tg:
+                # check, as in _select_size, whether the sizing by the minimum temperature does not cross the maximum
+                # temperature
+                load_backup, results_backup, Tf_max_backup = self.load, self.results, self.Tf_max
+                try:
+                    for i in np.where(size_min_temp > size_max_temp)[0]:
+                        load = MonthlyGeothermalLoadAbsolute(baseload_extraction[i], baseload_injection[i],
+                                                             peak_extraction[i], peak_injection[i],
+                                                             load_backup.simulation_period)
+                        load.peak_extraction_duration = th_extraction[i] / 3600
+                        load.peak_injection_duration = th_injection[i] / 3600
+                        self.load = load
+                        self.Tf_max = Tf_max[i]
+                        try:
+                            self.calculate_temperatures(size_min_temp[i])
+                        except UnsolvableDueToTemperatureGradient:
+                            depths[i] = np.nan
+                            continue
+                        if np.max(self.results.peak_injection) > Tf_max[i]:
+                            depths[i] = np.nan
+                finally:
+                    self.load, self.Tf_max = load_backup, Tf_max_backup
+                    self.results = results_backup
+            return depths
+        finally:
+            self.H = H_backup
+
+    def _size_L2_batch_quadrant(self, time_steps: np.ndarray, coefficients: np.ndarray, qh: np.ndarray,
+                                Tf: np.ndarray, H_init: float, time_values: np.ndarray, table: dict) -> np.ndarray:
+        """
+        This function iterates the depths of many loads in one quadrant of the L2 sizing at once. The total borehole
+        length is the one of _Carcel and _Ahmadfard, which can both be written as
+        (c0 g(t0) + c1 (g(t1) - g(t0)) + c2 (g(t2) - g(t1))) / (2 pi k_s) + qh Rb, divided by the temperature
+        difference between the fluid and the ground.
+
+        Parameters
+        ----------
+        time_steps : np.ndarray
+            Time steps t0, t1 and t2 of every load, with shape (number of loads, 3) [s]
+        coefficients : np.ndarray
+            Coefficients c0, c1 and c2 of every load, with shape (number of loads, 3) [W]
+        qh : np.ndarray
+            Peak load of every load [W]
+        Tf : np.ndarray
+            Temperature limit of the fluid for every load [deg C]
+        H_init : float
+            Initial depth from where to start the iteration [m]
+        time_values : np.ndarray
+            Sorted time values at which the g-values are calculated, which contain all the time steps [s]
+        table : dict
+            Table with the g-values at the time values and the equivalent borehole thermal resistance for every
+            calculated depth index, which is shared between the quadrants
+
+        Returns
+        -------
+        H : np.ndarray
+            Required borehole depth of every load, NaN if it did not converge [m]
+        """
+        time_indices = np.searchsorted(time_values, time_steps)
+        log_step = np.log1p(self.DEPTH_STEP_L2_BATCH)
+
+        def gvalues_and_Rb(depths: np.ndarray, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            # linear interpolation between the depths exp(index * log_step) of the table
+            index = np.floor(np.log(depths) / log_step).astype(int)
+            nodes, inverse = np.unique(np.concatenate((index, index + 1)), return_inverse=True)
+            for node in nodes:
+                if node not in table:
+                    depth = np.exp(node * log_step)
+                    try:
+                        gvalues = self.gfunction(time_values, depth)
+                    except UnsolvableDueToTemperatureGradient:
+                        gvalues = np.full(time_values.shape, np.nan)
+                    table[node] = gvalues, self.borehole.get_Rb(depth, self.D, self.r_b,
+                                                                self.ground_data.k_s)
+            gvalues = np.array([table[node][0] for node in nodes])
+            Rb = np.array([table[node][1] for node in nodes])
+            lower, upper = inverse[:len(depths)], inverse[len(depths):]
+            weight = (depths - np.exp(index * log_step)) / (np.exp((index + 1) * log_step) - np.exp(index * log_step))
+            g = (1 - weight[:, np.newaxis]) * np.take_along_axis(gvalues[lower], time_indices[rows], axis=1) + \
+                weight[:, np.newaxis] * np.take_along_axis(gvalues[upper], time_indices[rows], axis=1)
+            return g, (1 - weight) * Rb[lower] + weight * Rb[upper]
+
+        H = np.full(len(qh), 50. if H_init < 1 else H_init, dtype=np.float64)
+        H_prev = np.zeros(len(qh))
+        active = np.full(len(qh), True)
+        atol, rtol = self._calculation_setup.atol, self._calculation_setup.rtol
+        for _ in range(self._calculation_setup.max_nb_of_iterations):
+            g, Rb = gvalues_and_Rb(np.maximum(1, H[active]), np.where(active)[0])
+            k_s = self.ground_data.k_s(H[active])
+            resistances = np.column_stack((g[:, 0], g[:, 1] - g[:, 0], g[:, 2] - g[:, 1])) / (2 * pi * k_s)[:, np.newaxis]
+            L = (np.sum(coefficients[active] * resistances, axis=1) + qh[active] * Rb) / \
+                np.abs(Tf[active] - self.ground_data.calculate_Tg(H[active]))
+            H_prev[active] = H[active]
+            H[active] = L / self.number_of_boreholes
+            # as in _check_convergence
+            converged = (np.abs(H - H_prev) <= atol if atol is not False else True) & \
+                        (np.abs(H - H_prev) / H_prev <= rtol if rtol is not False else True)
+            # loads that cannot be sized due to the temperature gradient stay NaN
+            active &= ~converged & ~np.isnan(H)
+            if not np.any(active):
+                return H
+        H[active] = np.nan
+        return H
+
     def size_L3(self, H_init: float = None, quadrant_sizing: int = 0) -> float:
         """
         This function sizes the borefield based on a monthly (L3) method.
@@ -1219,6 +1536,8 @@ class Borefield(BaseClass):
             # size according to a specific quadrant
             self.H, _ = self._size_based_on_temperature_profile(quadrant_sizing)
             return self.H
+        elif self._calculation_setup.concurrent_quadrants and (os.cpu_count() or 1) > 1:
+            return self._size_quadrants_concurrently()
         else:
             try:
                 max_temp, sized = self._size_based_on_temperature_profile(10,
@@ -1288,6 +1607,8 @@ class Borefield(BaseClass):
             # size according to a specific quadrant
             self.H, _ = self._size_based_on_temperature_profile(quadrant_sizing, hourly=True)
             return self.H
+        elif self._calculation_setup.concurrent_quadrants and (os.cpu_count() or 1) > 1:
+            return self._size_quadrants_concurrently(hourly=True)
         else:
             try:
                 max_temp, sized = (
@@ -1324,6 +1645,83 @@ class Borefield(BaseClass):
                 return min_temp
             raise UnsolvableDueToTemperatureGradient
 
+    def _size_quadrants_concurrently(self, hourly: bool = False) -> float:
+        """
+        This function sizes the borefield for the maximum and the minimum temperature at the same time, each in its own
+        thread on a copy of the borefield. The copies share the g-function object, so the g-values calculated in one
+        thread can be used in the other. The depth is selected in the same way as in the sequential sizing of size_L3
+        and size_L4: the depth for the maximum temperature is used when it satisfies the minimum temperature as well,
+        otherwise the depth for the minimum temperature is used when it satisfies the maximum temperature.
+        In the first case, the sizing for the minimum temperature is not needed, so it is stopped before its next
+        temperature calculation. This function does not wait for this, so the sizing for the minimum temperature can
+        still finish its current temperature (or g-function) calculation in the background after this function has
+        returned.
+
+        Parameters
+        ----------
+        hourly : bool
+            True if an hourly resolution should be used
+
+        Returns
+        -------
+        H : float
+            Required depth of the borefield [m]
+
+        Raises
+        ------
+        UnsolvableDueToTemperatureGradient
+           When the field cannot be sized due to the temperature gradient.
+        """
+
+        def size_max_temp(borefield: Borefield) -> Tuple[float, bool]:
+            if hourly and not np.any(borefield.load.hourly_injection_load):
+                return 0, False
+            try:
+                return borefield._size_based_on_temperature_profile(
+                    10, hourly=hourly, deep_sizing=borefield._calculation_setup.force_deep_sizing)
+            except MaximumNumberOfIterations as e:
+                # no convergence with normal method, but perhaps with deep_sizing enabled
+                if borefield._calculation_setup.deep_sizing and borefield.ground_data.variable_Tg:
+                    return borefield._size_based_on_temperature_profile(10, hourly=hourly, deep_sizing=True)
+                raise e
+
+        def size_min_temp(borefield: Borefield) -> Tuple[float, bool]:
+            if hourly and not np.any(borefield.load.hourly_extraction_load):
+                return 0, False
+            return borefield._size_based_on_temperature_profile(20, hourly=hourly)
+
+        # the g-function object is not copied, so its cache is shared by both threads
+        copies = [copy.deepcopy(self, {id(self.gfunction_calculation_object): self.gfunction_calculation_object,
+                                       id(self.sizing_memo): self.sizing_memo}) for _ in range(2)]
+        for borefield in copies:
+            # there is only one background process for the prefetch in the shared g-function object
+            borefield._calculation_setup.prefetch_gfunctions = False
+        executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            max_temp_future = executor.submit(size_max_temp, copies[0])
+            min_temp_future = executor.submit(size_min_temp, copies[1])
+
+            # errors of the sizing for the minimum temperature are only raised when its result is needed
+            max_temp, sized = max_temp_future.result()
+            if sized:
+                borefield, quadrant = copies[0], 1 if self.load.imbalance <= 0 else 2
+            else:
+                min_temp, sized = min_temp_future.result()
+                if not sized:
+                    raise UnsolvableDueToTemperatureGradient
+                borefield, quadrant = copies[1], 4 if self.load.imbalance <= 0 else 3
+        finally:
+            # the sizing for the minimum temperature is not waited for when it is not needed
+            copies[1].stop_sizing = True
+            executor.shutdown(wait=False)
+
+        self.H = max_temp if quadrant in (1, 2) else min_temp
+        self.results = borefield.results
+        if isinstance(self.load, _LoadDataBuilding) and not isinstance(borefield.load.results, tuple):
+            self.load.set_results(borefield.load.results)
+        self.limiting_quadrant = quadrant
+        return self.H
+
     def calculate_next_depth_deep_sizing(self, current_depth: float) -> float:
         """
         This method is a slower but more robust way of calculating the next depth in the sizing iteration when the
@@ -1379,7 +1777,15 @@ class Borefield(BaseClass):
             Required depth of the borefield [m]
         Sized : bool
             True if the required depth also satisfies the other temperature constraint [m]
+
+        Raises
+        ------
+        SizingStopped
+            SizingStopped if stop_sizing is set during the sizing
         """
+        if self._calculation_setup.bracketed_sizing and not deep_sizing:
+            return self._size_based_on_temperature_profile_bracketed(quadrant, hourly)
+
         # initiate iteration
         H_prev = 0
 
@@ -1393,50 +1799,34 @@ class Borefield(BaseClass):
         # Iterates as long as there is no convergence
         # (convergence if difference between depth in iterations is smaller than THRESHOLD_BOREHOLE_DEPTH)
         i = 0
-        while not self._check_convergence(self.H, H_prev, i):
-            if hourly:
-                self._calculate_temperature_profile(self.H, hourly=True)
-            else:
-                self._calculate_temperature_profile(self.H, hourly=False)
-            H_prev = self.H
-            if not deep_sizing:
-                if quadrant == 1:
-                    # maximum temperature
-                    # convert back to required length
-                    self.H = (np.max(self.results.peak_injection[: 8760 if hourly else 12]) - self._Tg()) / (
-                            self.Tf_max - self._Tg()) * H_prev
-                elif quadrant == 2:
-                    # maximum temperature
-                    # convert back to required length
-                    self.H = (np.max(self.results.peak_injection[-8760 if hourly else -12:]) - self._Tg()) / (
-                            self.Tf_max - self._Tg()) * H_prev
-                elif quadrant == 3:
-                    # minimum temperature
-                    # convert back to required length
-                    self.H = (np.min(self.results.peak_extraction[: 8760 if hourly else 12]) - self._Tg()) / (
-                            self.Tf_min - self._Tg()) * H_prev
-                elif quadrant == 4:
-                    # minimum temperature
-                    # convert back to required length
-                    self.H = (np.min(self.results.peak_extraction[-8760 if hourly else -12:]) - self._Tg()) / (
-                            self.Tf_min - self._Tg()) * H_prev
-                elif quadrant == 10:
-                    # over all years
-                    # maximum temperature
-                    # convert back to required length
-                    self.H = (np.max(self.results.peak_injection) - self._Tg()) / (self.Tf_max - self._Tg()) * H_prev
-                elif quadrant == 20:
-                    # over all years
-                    # minimum temperature
+        step = 0.
+        try:
+            while not self._check_convergence(self.H, H_prev, i):
+                if self.stop_sizing:
+                    raise SizingStopped
+                if hourly:
+                    self._calculate_temperature_profile(self.H, hourly=True)
+                else:
+                    self._calculate_temperature_profile(self.H, hourly=False)
+                H_prev = self.H
+                if not deep_sizing:
                     # convert back to required length
-                    self.H = (np.min(self.results.peak_extraction) - self._Tg()) / (self.Tf_min - self._Tg()) * H_prev
-            elif self.ground_data.variable_Tg:
-                # for when the temperature gradient is active and it is injection
-                self.H = self.calculate_next_depth_deep_sizing(H_prev)
-            if self.H < 0:
-                return 0, False
-
-            i += 1
+                    temperature_limit = self.Tf_max if quadrant in (1, 2, 10) else self.Tf_min
+                    self.H = (self._get_quadrant_temperature(quadrant, hourly) - self._Tg()) / (
+                            temperature_limit - self._Tg()) * H_prev
+                elif self.ground_data.variable_Tg:
+                    # for when the temperature gradient is active and it is injection
+                    self.H = self.calculate_next_depth_deep_sizing(H_prev)
+                if self.H < 0:
+                    return 0, False
+
+                if self._calculation_setup.prefetch_gfunctions:
+                    self._prefetch_gfunctions(self.H - H_prev, step, hourly)
+                step = self.H - H_prev
+                i += 1
+        finally:
+            if self._calculation_setup.prefetch_gfunctions:
+                self.gfunction_calculation_object.stop_prefetch()
 
         return self.H, (np.max(self.results.peak_injection) <= self.Tf_max + 0.05 or (
                 quadrant == 10 or quadrant == 1 or quadrant == 2)) and (
@@ -1444,6 +1834,179 @@ class Borefield(BaseClass):
                                quadrant == 20 or quadrant == 3 or quadrant == 4)
                        )
 
+    def _prefetch_gfunctions(self, step: float, previous_step: float, hourly: bool = False) -> None:
+        """
+        This function predicts the depth of the next iteration of the sizing and starts the calculation of the
+        g-values at a depth just beyond it in a background process. The next depth can then be interpolated between
+        this depth and the current one. The next step is predicted by assuming that the steps decrease at the same
+        rate as in the previous iteration (or, in the first iteration, that they are halved).
+
+        Parameters
+        ----------
+        step : float
+            Difference between the new and the previous depth [m]
+        previous_step : float
+            Difference between the previous depth and the one before [m] (0 in the first iteration)
+        hourly : bool
+            True if the sizing is done with an hourly resolution
+
+        Returns
+        -------
+        None
+        """
+        ratio = step / previous_step if previous_step != 0 else 0.5
+        predicted_step = step * min(max(ratio, 0.), 1.)
+        if abs(predicted_step) < 0.5:
+            # the previous g-values are used when the depth differs less than 1 m
+            return
+        # the depth is chosen beyond the predicted depth, so the latter lies in between the two depths, but close
+        # enough to the current depth to interpolate
+        distance = min(2 * abs(predicted_step),
+                       0.9 * self.gfunction_calculation_object.threshold_depth_interpolation * self.H)
+        depth = self.H + np.sign(predicted_step) * distance
+        if depth < 1:
+            return
+
+        time_value = self.load.time_L4 if hourly else self.load.time_L3
+        if self._calculation_setup.use_precalculated_dataset and self.custom_gfunction is not None and \
+                self.custom_gfunction.within_range(time_value, depth):
+            return
+        self.gfunction_calculation_object.prefetch(time_value, self.borefield, self.ground_data.alpha(self.H),
+                                                   [depth])
+
+    def _get_quadrant_temperature(self, quadrant: int, hourly: bool = False) -> float:
+        """
+        This function returns the extreme fluid temperature of the current results that is limiting for a certain
+        quadrant. This is the maximum peak injection temperature for quadrants 1, 2 and 10 and the minimum peak
+        extraction temperature for quadrants 3, 4 and 20.
+
+        Parameters
+        ----------
+        quadrant : int
+            Quadrant for which the temperature should be returned
+        hourly : bool
+            True if the results have an hourly resolution
+
+        Returns
+        -------
+        float
+            Limiting fluid temperature [deg C]
+        """
+        if quadrant == 1:
+            # maximum temperature in the first year
+            return np.max(self.results.peak_injection[: 8760 if hourly else 12])
+        if quadrant == 2:
+            # maximum temperature in the last year
+            return np.max(self.results.peak_injection[-8760 if hourly else -12:])
+        if quadrant == 3:
+            # minimum temperature in the first year
+            return np.min(self.results.peak_extraction[: 8760 if hourly else 12])
+        if quadrant == 4:
+            # minimum temperature in the last year
+            return np.min(self.results.peak_extraction[-8760 if hourly else -12:])
+        if quadrant == 10:
+            # maximum temperature over all years
+            return np.max(self.results.peak_injection)
+        # minimum temperature over all years
+        return np.min(self.results.peak_extraction)
+
+    def _size_based_on_temperature_profile_bracketed(self, quadrant: int, hourly: bool = False) -> (float, bool):
+        """
+        This function sizes based on the temperature profile, by finding the depth at which the limiting temperature
+        of the quadrant equals the temperature limit. Since the temperature difference with the ground is more or less
+        inversely proportional to the depth, the root is searched for in terms of 1/H. The first step is the
+        fixed-point update of _size_based_on_temperature_profile, followed by secant steps until the solution is
+        bracketed, after which Brent's method is used. Since the solution is bracketed, this converges as well when
+        there is a temperature gradient in the ground.
+
+        Parameters
+        ----------
+        quadrant : int
+            Differs from 0 when a sizing in a certain quadrant is desired.
+            Quadrants are developed by (Peere et al., 2021) [#PeereBS]_, [#PeereThesis]_
+        hourly : bool
+            True if an hourly resolution should be used
+
+        Returns
+        -------
+        Depth : float
+            Required depth of the borefield [m]
+        Sized : bool
+            True if the required depth also satisfies the other temperature constraint [m]
+
+        Raises
+        ------
+        MaximumNumberOfIterations
+            MaximumNumberOfIterations if the temperature profile is calculated more than the max number of iterations
+        SizingStopped
+            SizingStopped if stop_sizing is set during the sizing
+        """
+        injection = quadrant in (1, 2, 10)
+        temperature_limit = self.Tf_max if injection else self.Tf_min
+        # residuals and results for every calculated depth, so no depth is calculated twice
+        evaluations = {}
+
+        def residual(depth: float) -> float:
+            # positive if the borefield is too short
+            if depth not in evaluations:
+                if self.stop_sizing:
+                    raise SizingStopped
+                if len(evaluations) + 1 > self._calculation_setup.max_nb_of_iterations:
+                    raise MaximumNumberOfIterations(self._calculation_setup.max_nb_of_iterations)
+                self.H = depth
+                self._calculate_temperature_profile(depth, hourly=hourly)
+                difference = self._get_quadrant_temperature(quadrant, hourly) - temperature_limit
+                evaluations[depth] = (difference if injection else -difference, self.results)
+            return evaluations[depth][0]
+
+        if self.H < 1:
+            self.H = 50
+
+        def fixed_point_update(depth: float) -> float:
+            # depth according to the fixed-point update, based on the last calculated temperature profile
+            return (self._get_quadrant_temperature(quadrant, hourly) - self._Tg()) / (
+                    temperature_limit - self._Tg()) * depth
+
+        # first step with the fixed-point update
+        H_a = self.H
+        residual_a = residual(H_a)
+        H_b = fixed_point_update(H_a)
+        if H_b < 0:
+            return 0, False
+        residual_b = residual(H_b)
+
+        # secant steps in 1/H until the solution is bracketed
+        while residual_a * residual_b > 0 and not self._check_convergence(H_b, H_a, 0):
+            if residual_b > 0 and fixed_point_update(H_b) < 0:
+                # the ground temperature itself exceeds the temperature limit
+                return 0, False
+            H_new = 1 / (1 / H_b - residual_b * (1 / H_b - 1 / H_a) / (residual_b - residual_a)) \
+                if residual_b != residual_a else -1
+            # safeguard so that the next depth is in the right direction and not too far away
+            if residual_b > 0:
+                H_new = min(H_new, 4 * H_b) if H_new > H_b else 2 * H_b
+            else:
+                H_new = max(H_new, H_b / 4) if 0 < H_new < H_b else H_b / 2
+            H_a, residual_a = H_b, residual_b
+            H_b = H_new
+            residual_b = residual(H_b)
+
+        if residual_a * residual_b <= 0 and residual_b != 0 and not self._check_convergence(H_b, H_a, 0):
+            H_min, H_max = min(H_a, H_b), max(H_a, H_b)
+            x_tol = self._calculation_setup.atol / H_max ** 2 if self._calculation_setup.atol else 1e-12
+            r_tol = self._calculation_setup.rtol if self._calculation_setup.rtol else 1e-9
+            H_b = 1 / optimize.brentq(lambda x: residual(1 / x), 1 / H_max, 1 / H_min, xtol=x_tol, rtol=r_tol,
+                                      maxiter=self._calculation_setup.max_nb_of_iterations)
+
+        self.H = H_b
+        if H_b in evaluations:
+            self.results = evaluations[H_b][1]
+        else:
+            self._calculate_temperature_profile(H_b, hourly=hourly)
+
+        return self.H, (np.max(self.results.peak_injection) <= self.Tf_max + 0.05 or injection) and (
+                np.min(self.results.peak_extraction) >= self.Tf_min - 0.05 or not injection)
+
     @property
     def investment_cost(self) -> float:
         """
@@ -1474,6 +2037,100 @@ class Borefield(BaseClass):
         """
         self._calculate_temperature_profile(H=depth, hourly=hourly)
 
+    def calculate_temperatures_batch(self, depths: ArrayLike, hourly: bool = False) -> Union[ResultsMonthlyBatch,
+                                                                                              ResultsHourlyBatch]:
+        """
+        Calculate the temperatures for multiple depths at once. The g-function values are looked up once per depth
+        and the convolutions for all the depths are done in one vectorised operation, using the stored spectrum
+        of the load. Contrary to calculate_temperatures, the results are returned and self.results is not changed.
+
+        Parameters
+        ----------
+        depths : list, np.ndarray
+            Depths for which the temperature profile should be calculated [m]
+        hourly : bool
+            True when the temperatures should be calculated based on hourly data
+
+        Returns
+        -------
+        ResultsMonthlyBatch or ResultsHourlyBatch
+            Results with one row for every depth
+
+        Raises
+        ------
+        ValueError
+            When hourly results are requested but there is no hourly load
+        """
+        depths = np.array(depths, dtype=np.float64).ravel()
+
+        if hourly and not self.load._hourly:
+            raise ValueError("There is no hourly resolution available!")
+
+        if isinstance(self.load, _LoadDataBuilding):
+            # the geothermal load depends on the fluid temperatures, so every depth is calculated separately
+            results_backup = self.results
+            results = []
+            for depth in depths:
+                self._calculate_temperature_profile(depth, hourly=hourly)
+                results.append(self.results)
+            self.results = results_backup
+            if isinstance(self.load, _LoadDataBuilding):
+                # restore the load to the state of the stored results
+                if len(results_backup.Tb):
+                    self.load.set_results(results_backup)
+                else:
+                    self.load.reset_results(self.Tf_min, self.Tf_max)
+            if hourly:
+                return ResultsHourlyBatch(depths,
+                                          np.array([result.Tb for result in results]),
+                                          np.array([result.Tf for result in results]))
+            return ResultsMonthlyBatch(depths,
+                                       np.array([result.Tb for result in results]),
+                                       np.array([result.peak_extraction for result in results]),
+                                       np.array([result.peak_injection for result in results]),
+                                       np.array([result.monthly_extraction for result in results]),
+                                       np.array([result.monthly_injection for result in results]))
+
+        # depth dependent parameters as column vectors, so they broadcast over the time axis
+        k_s = self.ground_data.k_s(depths)[:, np.newaxis]
+        Rb = np.array([self.borehole.get_Rb(depth, self.D, self.r_b, self.ground_data.k_s(self.H))
+                       for depth in depths])[:, np.newaxis]
+        Tg = np.broadcast_to(self.ground_data.calculate_Tg(depths), depths.shape)[:, np.newaxis]
+        length = depths[:, np.newaxis] * self.number_of_boreholes
+
+        if hourly:
+            hourly_load = self.load.hourly_net_resulting_injection_power
+            g_values = np.array([self.gfunction(self.load.time_L4, depth) for depth in depths])
+
+            # convolution for all the depths at once
+            results = self.convolution_object.convolve(hourly_load, np.diff(g_values, prepend=0)) * 1000
+            Tb = results / (2 * pi * k_s) / length + Tg
+            return ResultsHourlyBatch(depths, Tb, Tb + hourly_load * 1000 * Rb / length)
+
+        g_values, g_value_peak_injection, g_value_peak_extraction = \
+            (np.array(values) for values in zip(*[self._monthly_gvalues(depth) for depth in depths]))
+        g_value_peak_injection = g_value_peak_injection[:, np.newaxis]
+        g_value_peak_extraction = g_value_peak_extraction[:, np.newaxis]
+
+        # convolution for all the depths at once
+        results = self.convolution_object.convolve(self.load.monthly_average_injection_power_simulation_period,
+                                                   np.diff(g_values, prepend=0)) * 1000
+        Tb = results / (2 * pi * k_s) / length + Tg
+
+        baseload_injection = self.load.monthly_baseload_injection_power_simulation_period
+        baseload_extraction = self.load.monthly_baseload_extraction_power_simulation_period
+        results_month_injection = Tb + baseload_injection * 1000 * Rb / length
+        results_month_extraction = Tb - baseload_extraction * 1000 * Rb / length
+        results_peak_injection = results_month_injection + (
+                self.load.monthly_peak_injection_simulation_period - baseload_injection) * 1000 * (
+                                         g_value_peak_injection / k_s / 2 / pi + Rb) / length
+        results_peak_extraction = results_month_extraction - (
+                self.load.monthly_peak_extraction_simulation_period - baseload_extraction) * 1000 * (
+                                          g_value_peak_extraction / k_s / 2 / pi + Rb) / length
+
+        return ResultsMonthlyBatch(depths, Tb, results_peak_extraction, results_peak_injection,
+                                   results_month_extraction, results_month_injection)
+
     def print_temperature_profile(self, legend: bool = True, plot_hourly: bool = False) -> None:
         """
         This function plots the temperature profile for the calculated depth.
@@ -1615,24 +2272,17 @@ class Borefield(BaseClass):
 
             if not hourly:
                 # self.g-function is a function that uses the precalculated data to interpolate the correct values of the
-                # g-function. This dataset is checked over and over again and is correct
-                g_values = self.gfunction(self.load.time_L3, H)
-
-                # the g-function value of the peak with length_peak hours
-                g_value_peak_injection = self.gfunction(self.load.peak_injection_duration, H)[0]
-                if self.load.peak_injection_duration == self.load.peak_extraction_duration:
-                    g_value_peak_extraction = g_value_peak_injection
-                else:
-                    g_value_peak_extraction = self.gfunction(self.load.peak_extraction_duration, H)[0]
+                # g-function. This dataset is checked over and over again and is correct.
+                # The g-function values of the peaks with length_peak hours are requested at the same time.
+                g_values, g_value_peak_injection, g_value_peak_extraction = self._monthly_gvalues(H)
 
                 # calculation of needed differences of the g-function values. These are the weight factors in the calculation
                 # of Tb.
                 g_value_differences = np.diff(g_values, prepend=0)
 
                 # convolution to get the monthly results
-                results = convolve(self.load.monthly_average_injection_power_simulation_period * 1000,
-                                   g_value_differences)[
-                          : 12 * self.simulation_period]
+                results = self.convolution_object.convolve(
+                    self.load.monthly_average_injection_power_simulation_period, g_value_differences) * 1000
 
                 # calculation the borehole wall temperature for every month i
                 k_s = self.ground_data.k_s(H)
@@ -1689,8 +2339,8 @@ class Borefield(BaseClass):
                 # of Tb.
                 g_value_differences = np.diff(g_values, prepend=0)
 
-                # convolution to get the monthly results
-                results = convolve(hourly_load * 1000, g_value_differences)[: len(hourly_load)]
+                # convolution to get the hourly results
+                results = self.convolution_object.convolve(hourly_load, g_value_differences) * 1000
 
                 # calculation the borehole wall temperature for every month i
                 Tb = results / (2 * pi * self.ground_data.k_s(H)) / (H * self.number_of_boreholes) + self._Tg(H)
@@ -1705,11 +2355,32 @@ class Borefield(BaseClass):
             return results
 
         def calculate_difference(results_old: Union[ResultsMonthly, ResultsHourly],
-                                 result_new: Union[ResultsMonthly, ResultsHourly]) -> float:
+                                 result_new: Union[ResultsMonthly, ResultsHourly], absolute: bool = False) -> float:
+            if absolute:
+                # accelerated iterates can over- and undershoot the solution
+                return max(
+                    np.max(np.abs(result_new.peak_injection - results_old.peak_injection)),
+                    np.max(np.abs(result_new.peak_extraction - results_old.peak_extraction)))
             return max(
                 np.max(result_new.peak_injection - results_old.peak_injection),
                 np.max(result_new.peak_extraction - results_old.peak_extraction))
 
+        def to_vector(results: Union[ResultsMonthly, ResultsHourly]) -> np.ndarray:
+            # the fluid temperatures on which the load depends
+            if isinstance(results, ResultsHourly):
+                return results.Tf
+            return np.concatenate((results.peak_extraction, results.peak_injection, results.monthly_extraction,
+                                   results.monthly_injection))
+
+        def from_vector(vector: np.ndarray,
+                        results: Union[ResultsMonthly, ResultsHourly]) -> Union[ResultsMonthly, ResultsHourly]:
+            if isinstance(results, ResultsHourly):
+                return ResultsHourly(borehole_wall_temp=results.Tb, temperature_fluid=vector)
+            peak_extraction, peak_injection, monthly_extraction, monthly_injection = np.split(vector, 4)
+            return ResultsMonthly(borehole_wall_temp=results.Tb, peak_extraction=peak_extraction,
+                                  peak_injection=peak_injection, monthly_extraction=monthly_extraction,
+                                  monthly_injection=monthly_injection)
+
         if isinstance(self.load, _LoadDataBuilding):
             # when building load is given, the load should be updated after each temperature calculation.
             # check if active_passive, because then, threshold should be taken
@@ -1721,12 +2392,19 @@ class Borefield(BaseClass):
             self.load.set_results(results_old)
             results = calculate_temperatures(H, hourly=hourly)
 
+            acceleration = self._calculation_setup.fixed_point_acceleration
+            accelerator = FIXED_POINT_ACCELERATIONS[acceleration]()
+
             # safety
             i = 0
-            while calculate_difference(results_old,
-                                       results) > self._calculation_setup.atol and i < self._calculation_setup.max_nb_of_iterations:
-                results_old = results
-                self.load.set_results(results)
+            while calculate_difference(results_old, results, acceleration != 'none') > self._calculation_setup.atol \
+                    and i < self._calculation_setup.max_nb_of_iterations:
+                if acceleration == 'none':
+                    results_old = results
+                else:
+                    # the next fluid temperatures are extrapolated from the previous iterations
+                    results_old = from_vector(accelerator(to_vector(results_old), to_vector(results)), results)
+                self.load.set_results(results_old)
                 results = calculate_temperatures(H, hourly=hourly)
                 i += 1
             self.results = results
@@ -1751,6 +2429,24 @@ class Borefield(BaseClass):
         None
         """
         self.gfunction_calculation_object.set_options_gfunction_calculation(options)
+        self._peak_gvalues = {}
+
+    def set_gfunction_store(self, directory: Union[str, os.PathLike, None]) -> None:
+        """
+        This function sets a persistent store for the calculated g-functions. Before calculating a g-function with
+        pygfunction, it is looked up in this directory and afterwards, it is written to it, so other processes can
+        reuse it. Multiple processes can use the same directory at the same time.
+
+        Parameters
+        ----------
+        directory : str, os.PathLike, None
+            Directory of the store. If None, no store is used.
+
+        Returns
+        -------
+        None
+        """
+        self.gfunction_calculation_object.store = GFunctionStore(directory) if directory is not None else None
 
     def gfunction(self, time_value: ArrayLike, H: float = None) -> np.ndarray:
         """
@@ -1811,8 +2507,69 @@ class Borefield(BaseClass):
         ## 3 calculate g-function jit
         return jit_gfunction_calculation()
 
+    def gfunction_batch(self, time_values: list, H: float = None) -> list:
+        """
+        This function returns the gfunction values for multiple requests of time values at once.
+        All the time values are merged in one request, so the g-values are only calculated or interpolated once,
+        and afterwards the result is split again over the different requests.
+
+        Parameters
+        ----------
+        time_values : list
+            List with the time value(s) in seconds of every request
+        H : float
+            Depth [m] at which the gfunctions should be calculated.
+            If no depth is given, the current depth is taken.
+
+        Returns
+        -------
+        gvalues : list
+            List with a 1D array with the g-values for every request
+        """
+        time_values = [np.atleast_1d(np.asarray(time_value, dtype=np.float64)) for time_value in time_values]
+        merged_time_values, indices = np.unique(np.concatenate(time_values), return_inverse=True)
+        gvalues = self.gfunction(merged_time_values, H)[indices.ravel()]
+        return np.split(gvalues, np.cumsum([time_value.size for time_value in time_values])[:-1])
+
+    def _monthly_gvalues(self, H: float = None) -> Tuple[np.ndarray, float, float]:
+        """
+        This function returns the g-values needed for the monthly temperature calculation, i.e. the g-values at the
+        monthly time steps and at the durations of the injection and extraction peak. When the peak g-values are not
+        yet known for this depth, all these time values are requested at once. The peak g-values are memoised per
+        depth, so afterwards only the monthly g-values are requested.
+
+        Parameters
+        ----------
+        H : float
+            Depth [m] at which the gfunctions should be calculated.
+            If no depth is given, the current depth is taken.
+
+        Returns
+        -------
+        g_values, g_value_peak_injection, g_value_peak_extraction : np.ndarray, float, float
+            g-values at the monthly time steps and at the durations of the injection and extraction peak
+        """
+        H = H if H is not None else self.H
+        if self._peak_gvalues_custom_gfunction is not self.custom_gfunction:
+            # the custom gfunction is changed
+            self._peak_gvalues = {}
+            self._peak_gvalues_custom_gfunction = self.custom_gfunction
+
+        key = (H, self.ground_data.alpha(H), self.load.peak_injection_duration, self.load.peak_extraction_duration)
+        if key in self._peak_gvalues:
+            return (self.gfunction(self.load.time_L3, H),) + self._peak_gvalues[key]
+
+        g_values, g_value_peak_injection, g_value_peak_extraction = self.gfunction_batch(
+            [self.load.time_L3, self.load.peak_injection_duration, self.load.peak_extraction_duration], H)
+
+        if len(self._peak_gvalues) >= Borefield.MAX_MEMOISED_PEAK_GVALUES:
+            # remove the oldest depth
+            del self._peak_gvalues[next(iter(self._peak_gvalues))]
+        self._peak_gvalues[key] = (g_value_peak_injection[0], g_value_peak_extraction[0])
+        return g_values, g_value_peak_injection[0], g_value_peak_extraction[0]
+
     def create_custom_dataset(self, time_array: ArrayLike = None, depth_array: ArrayLike = None,
-                              options: dict = {}) -> None:
+                              options: dict = {}, workers: int = None) -> None:
         """
         This function makes a datafile for a given custom borefield and sets it for the borefield object.
         It automatically sets this datafile in the current borefield object, so it can be used as a source for
@@ -1826,6 +2583,9 @@ class Borefield(BaseClass):
             List or arrays of depths for which the datafile should be created
         options : dict
             Options for the g-function calculation (check pygfunction.gfunction.gFunction() for more information)
+        workers : int
+            Number of processes in which the g-functions for the different depths are calculated.
+            If None or 1, all depths are calculated one after the other.
 
         Returns
         -------
@@ -1847,7 +2607,7 @@ class Borefield(BaseClass):
             raise ValueError("No ground data is set for which the gfunctions should be calculated")
 
         self.custom_gfunction = CustomGFunction(time_array, depth_array, options)
-        self.custom_gfunction.create_custom_dataset(self.borefield, self.ground_data.alpha)
+        self.custom_gfunction.create_custom_dataset(self.borefield, self.ground_data.alpha, workers)
 
     @property
     def Re(self) -> float:
@@ -1955,6 +2715,89 @@ class Borefield(BaseClass):
         self.load = borefield_load
         return borefield_load, external_load
 
+    def optimise_load_profile_lp(
+            self,
+            building_load: Union[HourlyBuildingLoad, HourlyBuildingLoadMultiYear],
+            depth: float = None,
+            max_peak_heating: float = None,
+            max_peak_cooling: float = None
+    ) -> tuple[HourlyBuildingLoadMultiYear, HourlyBuildingLoadMultiYear]:
+        """
+        This function optimises the load for maximum energy extraction and injection based on the given borefield and
+        the given hourly building load. Contrary to optimise_load_profile_energy, the monthly peaks and energies are
+        found with a single linear program on the thermal response of the borefield.
+
+        Parameters
+        ----------
+        building_load : HourlyBuildingLoad | HourlyBuildingLoadMultiYear
+            Load data used for the optimisation
+        depth : float
+            Depth of the boreholes in the borefield [m]
+        max_peak_heating : float
+            The maximum peak power for heating (building side) [kW]
+        max_peak_cooling : float
+            The maximum peak power for cooling (building side) [kW]
+
+        Returns
+        -------
+        tuple [HourlyBuildingLoadMultiYear, HourlyBuildingLoadMultiYear]
+            borefield load, external load
+
+        Raises
+        ------
+        ValueError
+            ValueError if no correct load data is given or if the temperature limits cannot be met
+        """
+        borefield_load, external_load = optimise_load_profile_lp(
+            self, building_load, depth, max_peak_heating, max_peak_cooling)
+        self.load = borefield_load
+        return borefield_load, external_load
+
+    def optimise_borefield_configuration(
+            self,
+            length: float,
+            width: float,
+            spacings: list,
+            max_depth: float,
+            min_depth: float = None,
+            shapes: list = ('rectangle',),
+            nb_of_candidates: int = 5
+    ) -> pd.DataFrame:
+        """
+        This function searches the borefield configuration with the lowest investment cost that fits on a plot of
+        length x width and sets it as the borefield. The candidates are first sized with the quick L2 method and only
+        the cheapest ones are sized with the current calculation setup.
+
+        Parameters
+        ----------
+        length : float
+            Length of the plot [m]
+        width : float
+            Width of the plot [m]
+        spacings : list[float]
+            Borehole spacings that should be considered [m]
+        max_depth : float
+            Maximum borehole depth [m]
+        min_depth : float
+            Minimum borehole depth [m]. If None, the threshold for a shallow field is used.
+        shapes : list[str]
+            Shapes of the borefields that should be considered ('rectangle', 'L', 'U', 'box' and/or 'circle')
+        nb_of_candidates : int
+            Number of the cheapest configurations after the quick sizing that are sized with the calculation setup
+
+        Returns
+        -------
+        pd.DataFrame
+            Table with all the sized candidates, with the shortlist first and sorted by their cost
+
+        Raises
+        ------
+        ValueError
+            ValueError if a shape is unknown or if no configuration meets the depth limits
+        """
+        return optimise_borefield_configuration(self, length, width, spacings, max_depth, min_depth, shapes,
+                                                nb_of_candidates)
+
     def calculate_quadrant(self) -> int:
         """
         This function returns the borefield quadrant (as defined by Peere et al., 2021 [#PeereEtAl]_)
@@ -2008,6 +2851,31 @@ class Borefield(BaseClass):
             return 3
         return 2
 
+    def __setstate__(self, state: dict) -> None:
+        """
+        This function restores a (pickled) Borefield object. Objects that were pickled with an older version of GHEtool
+        do not have all the attributes, so these are initialised with their default values.
+
+        Parameters
+        ----------
+        state : dict
+            Dictionary with the attributes of the pickled object
+
+        Returns
+        -------
+        None
+        """
+        self.__dict__.update(state)
+        if 'convolution_object' not in state:
+            self.convolution_object = FFTConvolution()
+        if '_peak_gvalues' not in state:
+            self._peak_gvalues = {}
+            self._peak_gvalues_custom_gfunction = None
+        if 'sizing_memo' not in state:
+            self.sizing_memo = SizingMemo()
+        if 'stop_sizing' not in state:
+            self.stop_sizing = False
+
     def __repr__(self):
         return f'Maximum average fluid temperature [°C]: {self.Tf_max}\n' \
                f'Minimum average fluid temperature [°C]: {self.Tf_min}\n' \
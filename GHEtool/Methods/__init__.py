@@ -1 +1,3 @@
 from .optimise_load_profile import optimise_load_profile_power, optimise_load_profile_energy
+from .optimise_load_profile_lp import optimise_load_profile_lp
+from .optimise_borefield_configuration import optimise_borefield_configuration
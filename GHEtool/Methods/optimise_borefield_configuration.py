@@ -0,0 +1,226 @@
+"""
+This file contains the functionality to search the cheapest borefield configuration that fits on a plot.
+"""
+from __future__ import annotations
+
+from math import floor, pi, sin
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+import pygfunction as gt
+
+from GHEtool.VariableClasses.BaseClass import UnsolvableDueToTemperatureGradient, MaximumNumberOfIterations
+from GHEtool.VariableClasses.LoadData import _LoadDataBuilding
+
+# functions of pygfunction that create the borefields with two numbers of boreholes N_1 and N_2
+_FIELDS: Dict[str, Callable] = {'rectangle': gt.boreholes.rectangle_field,
+                                'L': gt.boreholes.L_shaped_field,
+                                'U': gt.boreholes.U_shaped_field,
+                                'box': gt.boreholes.box_shaped_field}
+SHAPES: Tuple[str, ...] = ('rectangle', 'L', 'U', 'box', 'circle')
+
+
+def _candidate_families(length: float, width: float, spacings: List[float], shapes: List[str]) -> List[List[dict]]:
+    """
+    This function creates all the candidate configurations that fit on the plot. The candidates are grouped in
+    families with the same shape, borehole spacing and (apart from the circular fields) number of boreholes N_1.
+    Within a family, the candidates are sorted by their number of boreholes.
+
+    Parameters
+    ----------
+    length : float
+        Length of the plot [m]
+    width : float
+        Width of the plot [m]
+    spacings : list[float]
+        Borehole spacings that should be considered [m]
+    shapes : list[str]
+        Shapes of the borefields that should be considered
+
+    Returns
+    -------
+    list[list[dict]]
+        Families of candidates
+    """
+    families = []
+    for shape in shapes:
+        for B in spacings:
+            if shape == 'circle':
+                # N boreholes on a circle with a distance B between neighbouring boreholes
+                family = []
+                N = 3
+                while 2 * B / (2 * sin(pi / N)) <= min(length, width):
+                    family.append({'shape': shape, 'N_1': N, 'N_2': None, 'B': B,
+                                   'R': B / (2 * sin(pi / N)), 'nb_of_boreholes': N})
+                    N += 1
+                if family:
+                    families.append(family)
+                continue
+            max_N_1 = floor(length / B) + 1
+            max_N_2 = floor(width / B) + 1
+            # the other shapes are only different from a rectangle (or a line) with enough boreholes
+            min_N = 1 if shape == 'rectangle' else 3 if shape == 'box' else 2
+            for N_1 in range(min_N, max_N_1 + 1):
+                family = []
+                for N_2 in range(min_N, max_N_2 + 1):
+                    # rectangles and boxes that are rotated have the same g-function
+                    if shape in ('rectangle', 'box') and N_2 < N_1 and N_1 <= max_N_2 and N_2 <= max_N_1:
+                        continue
+                    family.append({'shape': shape, 'N_1': N_1, 'N_2': N_2, 'B': B, 'R': None,
+                                   'nb_of_boreholes': len(_FIELDS[shape](N_1, N_2, B, B, 100, 1, 0.075))})
+                if family:
+                    families.append(family)
+    return families
+
+
+def _create_field(candidate: dict, H: float, D: float, r_b: float) -> List[gt.boreholes.Borehole]:
+    """
+    This function creates the borefield of a candidate configuration.
+
+    Parameters
+    ----------
+    candidate : dict
+        Candidate configuration
+    H : float
+        Borehole depth [m]
+    D : float
+        Borehole buried depth [m]
+    r_b : float
+        Borehole radius [m]
+
+    Returns
+    -------
+    list[pygfunction.boreholes.Borehole]
+        Borefield of the candidate
+    """
+    if candidate['shape'] == 'circle':
+        return gt.boreholes.circle_field(int(candidate['N_1']), candidate['R'], H, D, r_b)
+    return _FIELDS[candidate['shape']](int(candidate['N_1']), int(candidate['N_2']), candidate['B'], candidate['B'], H,
+                                       D, r_b)
+
+
+def optimise_borefield_configuration(
+        borefield,
+        length: float,
+        width: float,
+        spacings: List[float],
+        max_depth: float,
+        min_depth: float = None,
+        shapes: List[str] = ('rectangle',),
+        nb_of_candidates: int = 5
+) -> pd.DataFrame:
+    """
+    This function searches the borefield configuration with the lowest investment cost that fits on a plot of
+    length x width. All the candidate configurations (shape, spacing and number of boreholes) are first sized with the
+    quick L2 method (L3 for building loads), where configurations that need boreholes deeper than max_depth or
+    shallower than min_depth are pruned. The depth of a configuration decreases when boreholes are added to it, so
+    within a family of configurations that only differ in N_2 (or N for circular fields), the smallest candidate that
+    is not too shallow is found with a bisection and the search stops at the first candidate that is too deep.
+    Only the nb_of_candidates configurations with the lowest cost are sized again with the sizing method of the
+    calculation setup of the borefield. All the sizings use the g-function object of the borefield, so the g-values of
+    previous candidates are reused.
+    At the end, the cheapest configuration is set as the borefield with its depth.
+
+    Parameters
+    ----------
+    borefield : Borefield
+        Borefield object with the ground data, load, temperature limits and calculation setup
+    length : float
+        Length of the plot [m]
+    width : float
+        Width of the plot [m]
+    spacings : list[float]
+        Borehole spacings that should be considered [m]
+    max_depth : float
+        Maximum borehole depth [m]
+    min_depth : float
+        Minimum borehole depth [m]. If None, the threshold for a shallow field of the borefield is used.
+    shapes : list[str]
+        Shapes of the borefields that should be considered ('rectangle', 'L', 'U', 'box' and/or 'circle')
+    nb_of_candidates : int
+        Number of the cheapest configurations after the quick sizing that are sized with the calculation setup
+
+    Returns
+    -------
+    pd.DataFrame
+        Table with all the sized candidates, with the shortlist first and sorted by their cost, with the columns 'shape', 'N_1', 'N_2', 'B',
+        'nb_of_boreholes', 'depth_L2' (the depth of the quick sizing [m]), 'depth' (the depth of the sizing with the
+        calculation setup [m], NaN if the candidate was not on the shortlist) and 'cost' (the investment cost)
+
+    Raises
+    ------
+    ValueError
+        ValueError if a shape is unknown or if no configuration meets the depth limits
+    """
+    for shape in shapes:
+        if shape not in SHAPES:
+            raise ValueError(f'The shape {shape} is not in {SHAPES}.')
+    if min_depth is None:
+        min_depth = borefield.THRESHOLD_WARNING_SHALLOW_FIELD
+    D, r_b = borefield.D, borefield.r_b
+    quadrant_sizing = borefield._calculation_setup.quadrant_sizing
+    building_load = isinstance(borefield.load, _LoadDataBuilding)
+    size_quick = borefield.size_L3 if building_load else borefield.size_L2
+
+    def size(candidate: dict, sizing: Callable, H_init: float) -> float:
+        borefield.borefield = _create_field(candidate, H_init, D, r_b)
+        try:
+            return sizing(H_init, quadrant_sizing)
+        except (UnsolvableDueToTemperatureGradient, MaximumNumberOfIterations):
+            # these fields are too small for the load
+            return np.inf
+
+    candidates = []
+    for family in _candidate_families(length, width, spacings, shapes):
+        depths = {}
+
+        def depth(index: int) -> float:
+            if index not in depths:
+                previous = [depths[i] for i in depths if np.isfinite(depths[i])]
+                H_init = min(max(previous[-1], min_depth), max_depth) if previous else max_depth
+                depths[index] = size(family[index], size_quick, H_init)
+            return depths[index]
+
+        # bisection for the last candidate that is not too shallow
+        low, high = 0, len(family) - 1
+        if depth(low) < min_depth:
+            continue
+        while low < high:
+            middle = (low + high + 1) // 2
+            if depth(middle) >= min_depth:
+                low = middle
+            else:
+                high = middle - 1
+        # smaller candidates are deeper, so stop at the first candidate that is too deep
+        for index in range(low, -1, -1):
+            if depth(index) > max_depth:
+                break
+            candidates.append(dict(family[index], depth_L2=depth(index)))
+
+    if not candidates:
+        raise ValueError('There is no borefield configuration on the plot that meets the depth limits.')
+    results = pd.DataFrame(candidates)
+    results['depth'] = np.nan
+    results['cost'] = np.polyval(borefield.cost_investment, results['depth_L2'] * results['nb_of_boreholes'])
+    results = results.sort_values('cost', ignore_index=True)
+
+    # size the shortlist with the calculation setup
+    if borefield._calculation_setup.L2_sizing and not building_load:
+        results.loc[:nb_of_candidates - 1, 'depth'] = results.loc[:nb_of_candidates - 1, 'depth_L2']
+    else:
+        sizing = lambda H_init, quadrant: borefield.size(H_init, quadrant_sizing=quadrant)
+        for index in range(min(nb_of_candidates, len(results))):
+            candidate = results.loc[index]
+            H = size(candidate, sizing, candidate['depth_L2'])
+            results.loc[index, 'depth'] = H
+            results.loc[index, 'cost'] = np.polyval(borefield.cost_investment, H * candidate['nb_of_boreholes'])
+
+    results['shortlist'] = results.index < nb_of_candidates
+    results = results.sort_values(['shortlist', 'cost'], ascending=[False, True], ignore_index=True)
+    feasible = results[(results['depth'] >= min_depth) & (results['depth'] <= max_depth)]
+    if feasible.empty:
+        raise ValueError('There is no borefield configuration on the plot that meets the depth limits.')
+    best = results.loc[feasible.index[0]]
+    borefield.borefield = _create_field(best, best['depth'], D, r_b)
+    return results.drop(columns=['R', 'shortlist'])
@@ -1,8 +1,299 @@
 import copy
 import numpy as np
 
-from typing import Union
+from math import pi
+from typing import Callable, Tuple, Union
 from GHEtool.VariableClasses import HourlyBuildingLoad, MonthlyBuildingLoadMultiYear, HourlyBuildingLoadMultiYear
+from GHEtool.VariableClasses.BaseClass import MaximumNumberOfIterations
+from GHEtool.VariableClasses.Result import ResultsMonthly
+
+# minimum peak limit [kW]
+_MIN_PEAK_LIMIT: float = 0.1
+
+
+class _MonthlyTemperatureSuperposition:
+    """
+    This class calculates the monthly fluid temperatures for optimise_load_profile_energy, where the load of a single
+    month is changed at a time. Since the borehole wall temperature is linear in the load, a change in the load of
+    month i only adds a shifted step response to the borehole wall temperature of month i and the months thereafter.
+    Therefore, only this tail of the results is updated, instead of convolving the load of the whole simulation
+    period again. The temperatures of month i do not depend on the later months, so the temperature dependency of the
+    efficiencies only has to be iterated for month i.
+    """
+
+    def __init__(self, borefield, depth: float):
+        """
+
+        Parameters
+        ----------
+        borefield : Borefield
+            Borefield object with a monthly building load
+        depth : float
+            Depth of the boreholes in the borefield [m]
+        """
+        self.borefield = borefield
+        # the same parameters as in Borefield._calculate_temperature_profile
+        k_s = borefield.ground_data.k_s(depth)
+        Rb = borefield.borehole.get_Rb(depth, borefield.D, borefield.r_b, borefield.ground_data.k_s(borefield.H))
+        g_values, g_value_peak_injection, g_value_peak_extraction = borefield._monthly_gvalues(depth)
+
+        # temperature differences per kW
+        factor = 1000 / borefield.number_of_boreholes / depth
+        self._step_response = np.diff(g_values, prepend=0) / (2 * pi * k_s) * factor
+        self._resistance = Rb * factor
+        self._peak_injection_resistance = (g_value_peak_injection / k_s / 2 / pi + Rb) * factor
+        self._peak_extraction_resistance = (g_value_peak_extraction / k_s / 2 / pi + Rb) * factor
+
+        # the efficiencies are initialised with the temperatures of the whole simulation period
+        borefield.calculate_temperatures(depth)
+        self._load = borefield.load.monthly_average_injection_power_simulation_period.copy()
+        Tb = borefield.convolution_object.convolve(self._load, self._step_response) + borefield._Tg(depth)
+        self.results = ResultsMonthly(Tb, *(np.array(temperature) for temperature in (
+            borefield.results.peak_extraction, borefield.results.peak_injection,
+            borefield.results.monthly_extraction, borefield.results.monthly_injection)))
+        self._update_fluid_temperatures(0)
+        borefield.results = self.results
+
+    def _update_fluid_temperatures(self, month: int) -> None:
+        """
+        This function calculates the fluid temperatures from the borehole wall temperature, for the given month and
+        the months thereafter.
+
+        Parameters
+        ----------
+        month : int
+            Index of the first month that is updated
+
+        Returns
+        -------
+        None
+        """
+        load = self.borefield.load
+        tail = slice(month, None)
+        baseload_injection = load.monthly_baseload_injection_power_simulation_period[tail]
+        baseload_extraction = load.monthly_baseload_extraction_power_simulation_period[tail]
+        self.results.monthly_injection[tail] = self.results.Tb[tail] + baseload_injection * self._resistance
+        self.results.monthly_extraction[tail] = self.results.Tb[tail] - baseload_extraction * self._resistance
+        self.results.peak_injection[tail] = self.results.monthly_injection[tail] + (
+                load.monthly_peak_injection_simulation_period[tail] - baseload_injection) * \
+            self._peak_injection_resistance
+        self.results.peak_extraction[tail] = self.results.monthly_extraction[tail] - (
+                load.monthly_peak_extraction_simulation_period[tail] - baseload_extraction) * \
+            self._peak_extraction_resistance
+
+    def update(self, month: int) -> None:
+        """
+        This function updates the results after the load of the given month (or of the months before) has changed.
+        Only the results of the changed months up to the given month are converged with respect to the temperature
+        dependency of the efficiencies, since the later months do not influence these temperatures.
+
+        Parameters
+        ----------
+        month : int
+            Index of the last month of which the load has changed
+
+        Returns
+        -------
+        None
+        """
+        load = self.borefield.load
+        calculation_setup = self.borefield._calculation_setup
+        first = month
+        for _ in range(calculation_setup.max_nb_of_iterations + 1):
+            deltas = load.monthly_average_injection_power_simulation_period[:month + 1] - self._load[:month + 1]
+            changed = np.nonzero(deltas)[0]
+            for index in changed:
+                # superpose the step response of the load difference on the current and later months
+                self._load[index] += deltas[index]
+                self.results.Tb[index:] += deltas[index] * self._step_response[:len(self._load) - index]
+            if changed.size:
+                first = min(first, changed[0])
+            previous = self._month_temperatures(first, month)
+            self._update_fluid_temperatures(first)
+            # update the efficiencies with the new temperatures
+            load.set_results(self.results)
+            if np.max(np.abs(self._month_temperatures(first, month) - previous)) <= calculation_setup.atol:
+                return
+
+    def _month_temperatures(self, first: int, last: int) -> np.ndarray:
+        """
+        This function returns the fluid temperatures from the first up to the last month.
+
+        Parameters
+        ----------
+        first : int
+            Index of the first month
+        last : int
+            Index of the last month
+
+        Returns
+        -------
+        np.ndarray
+            Peak extraction, peak injection, monthly extraction and monthly injection temperatures
+        """
+        months = slice(first, last + 1)
+        return np.concatenate((self.results.peak_extraction[months], self.results.peak_injection[months],
+                               self.results.monthly_extraction[months], self.results.monthly_injection[months]))
+
+
+def _peak_limit_ok(margin: float, peak: float, max_peak: float, temperature_threshold: float) -> bool:
+    """
+    This function checks if a peak limit is converged. This is the case when the fluid temperature is within the
+    temperature threshold of its limit, when the peak limit is at its maximum without reaching the temperature limit,
+    or when the temperature limit cannot be met even at the minimum peak limit.
+
+    Parameters
+    ----------
+    margin : float
+        Margin between the fluid temperature and its limit, which is negative when the limit is exceeded [deg C]
+    peak : float
+        Peak limit [kW]
+    max_peak : float
+        Maximum peak limit [kW]
+    temperature_threshold : float
+        The maximum allowed temperature difference between the fluid temperature and its limit [deg C]
+
+    Returns
+    -------
+    bool
+        True if the peak limit is converged
+    """
+    return abs(margin) <= temperature_threshold or (margin > 0 and peak >= max_peak) or \
+        (margin < 0 and peak <= _MIN_PEAK_LIMIT)
+
+
+def _find_peak_limit(margins: Callable[[float], Tuple[float, float]], index: int, peak: float,
+                     current_margins: Tuple[float, float], max_peak: float,
+                     temperature_threshold: float) -> Tuple[float, Tuple[float, float]]:
+    """
+    This function searches the peak limit for which the fluid temperature is within the temperature threshold of its
+    limit. Since the margin between the fluid temperature and its limit decreases with the peak limit, the peak limit
+    is bracketed and the bracket is reduced with the Illinois variant of the regula falsi method. This converges
+    superlinearly and, since a bisection step is taken when three steps did not halve the bracket, the number of
+    evaluations grows at most logarithmically with the required accuracy.
+
+    Parameters
+    ----------
+    margins : Callable
+        Function that returns the margins of the minimum and the maximum fluid temperature for a given peak limit
+    index : int
+        Index of the margin that corresponds to the peak limit (0 for heating, 1 for cooling)
+    peak : float
+        Current peak limit [kW]
+    current_margins : tuple
+        Margins for the current peak limit [deg C]
+    max_peak : float
+        Maximum peak limit [kW]
+    temperature_threshold : float
+        The maximum allowed temperature difference between the fluid temperature and its limit [deg C]
+
+    Returns
+    -------
+    float, tuple
+        Peak limit [kW] and the margins for this peak limit [deg C]
+    """
+    if _peak_limit_ok(current_margins[index], peak, max_peak, temperature_threshold):
+        return peak, current_margins
+
+    # bracket the peak limit, where the margin is positive at the lower and negative at the upper bound
+    if current_margins[index] > 0:
+        lower, lower_margins = peak, current_margins
+        upper, upper_margins = max_peak, margins(max_peak)
+    else:
+        upper, upper_margins = peak, current_margins
+        lower, lower_margins = _MIN_PEAK_LIMIT, margins(_MIN_PEAK_LIMIT)
+    for bound, bound_margins in ((upper, upper_margins), (lower, lower_margins)):
+        if _peak_limit_ok(bound_margins[index], bound, max_peak, temperature_threshold):
+            return bound, bound_margins
+
+    # Illinois algorithm
+    lower_margin, upper_margin = lower_margins[index], upper_margins[index]
+    side = 0
+    width = upper - lower
+    iteration = 0
+    while upper - lower > _MIN_PEAK_LIMIT * 1e-3:
+        iteration += 1
+        if iteration % 3 == 0 and upper - lower > width / 2:
+            # the last secant steps did not halve the bracket, so a bisection step is taken
+            peak = (lower + upper) / 2
+        else:
+            peak = (lower * upper_margin - upper * lower_margin) / (upper_margin - lower_margin)
+        current_margins = margins(peak)
+        margin = current_margins[index]
+        if abs(margin) <= temperature_threshold:
+            return peak, current_margins
+        if margin > 0:
+            lower, lower_margin = peak, margin
+            if side == 1:
+                # the upper bound is kept twice, so its margin is halved
+                upper_margin /= 2
+            side = 1
+        else:
+            upper, upper_margin = peak, margin
+            if side == -1:
+                lower_margin /= 2
+            side = -1
+        if iteration % 3 == 0:
+            width = upper - lower
+    # the margin is discontinuous, so the lower bound is taken, which does not exceed the temperature limit
+    return lower, margins(lower)
+
+
+def _find_peak_limits(margins: Callable[[float, float], Tuple[float, float]], peak_heat_load: float,
+                      peak_cool_load: float, temperature_threshold: float,
+                      max_nb_of_iterations: int) -> Tuple[float, float]:
+    """
+    This function searches the peak limits for heating and cooling. The heating and cooling peaks are searched one
+    after the other, with the other peak fixed, since they only slightly influence each other's temperature limit.
+    A peak limit of which the bracket collapsed at a discontinuity of the margin is converged as well, as long as the
+    other peak limit does not change, since searching it again would give the same result.
+
+    Parameters
+    ----------
+    margins : Callable
+        Function that returns the margins of the minimum and the maximum fluid temperature for a given peak limit for
+        heating and cooling
+    peak_heat_load : float
+        Initial and maximum peak limit for heating [kW]
+    peak_cool_load : float
+        Initial and maximum peak limit for cooling [kW]
+    temperature_threshold : float
+        The maximum allowed temperature difference between the fluid temperature and its limit [deg C]
+    max_nb_of_iterations : int
+        Maximum number of times the heating and cooling peak limits are searched
+
+    Returns
+    -------
+    float, float
+        Peak limit for heating and cooling [kW]
+
+    Raises
+    ------
+    MaximumNumberOfIterations
+        MaximumNumberOfIterations if the peak limits do not converge within the maximum number of iterations
+    """
+    max_peak_heating, max_peak_cooling = peak_heat_load, peak_cool_load
+    heat_margin, cool_margin = margins(peak_heat_load, peak_cool_load)
+    heat_converged = _peak_limit_ok(heat_margin, peak_heat_load, max_peak_heating, temperature_threshold)
+    cool_converged = _peak_limit_ok(cool_margin, peak_cool_load, max_peak_cooling, temperature_threshold)
+    iteration = 0
+    while not heat_converged or not cool_converged:
+        if iteration == max_nb_of_iterations:
+            raise MaximumNumberOfIterations(max_nb_of_iterations)
+        iteration += 1
+        peak_heat_load, (heat_margin, cool_margin) = _find_peak_limit(
+            lambda peak: margins(peak, peak_cool_load), 0, peak_heat_load, (heat_margin, cool_margin),
+            max_peak_heating, temperature_threshold)
+        previous_peak_cool_load = peak_cool_load
+        peak_cool_load, (heat_margin, cool_margin) = _find_peak_limit(
+            lambda peak: margins(peak_heat_load, peak), 1, peak_cool_load, (heat_margin, cool_margin),
+            max_peak_cooling, temperature_threshold)
+        # the cooling peak limit is converged for the current heating peak limit, even when its bracket collapsed,
+        # and so is the heating peak limit, unless the cooling peak limit changed its margin
+        cool_converged = True
+        heat_converged = peak_cool_load == previous_peak_cool_load or \
+            _peak_limit_ok(heat_margin, peak_heat_load, max_peak_heating, temperature_threshold)
+    return peak_heat_load, peak_cool_load
 
 
 def optimise_load_profile_power(
@@ -80,14 +371,24 @@ def optimise_load_profile_power(
     if max_peak_cooling is not None:
         init_peak_cooling = min(init_peak_cooling, max_peak_cooling)
 
-    # peak loads for iteration
-    peak_heat_load: float = init_peak_heating
-    peak_cool_load: float = init_peak_cooling
+    def margins(peak_heat_load: float, peak_cool_load: float) -> Tuple[float, float]:
+        """
+        This function limits the primary geothermal extraction and injection load to peak_heat_load and
+        peak_cool_load and returns the margins between the fluid temperatures and their limits.
 
-    # set iteration criteria
-    cool_ok, heat_ok = False, False
-    while not cool_ok or not heat_ok:
-        # limit the primary geothermal extraction and injection load to peak_heat_load and peak_cool_load
+        Parameters
+        ----------
+        peak_heat_load : float
+            Peak limit for the heating [kW]
+        peak_cool_load : float
+            Peak limit for the cooling [kW]
+
+        Returns
+        -------
+        float, float
+            Margin between the minimum fluid temperature and Tf_min and between Tf_max and the maximum fluid
+            temperature [deg C]
+        """
         borefield.load.set_hourly_cooling_load(
             np.minimum(peak_cool_load, building_load.hourly_cooling_load
             if isinstance(borefield.load, HourlyBuildingLoad) else building_load.hourly_cooling_load_simulation_period))
@@ -97,32 +398,12 @@ def optimise_load_profile_power(
 
         # calculate temperature profile, just for the results
         borefield.calculate_temperatures(depth=depth, hourly=use_hourly_resolution)
+        return np.min(borefield.results.peak_extraction) - borefield.Tf_min, \
+            borefield.Tf_max - np.max(borefield.results.peak_injection)
 
-        # deviation from minimum temperature
-        if abs(min(borefield.results.peak_extraction) - borefield.Tf_min) > temperature_threshold:
-            # check if it goes below the threshold
-            if min(borefield.results.peak_extraction) < borefield.Tf_min:
-                peak_heat_load = max(0.1, peak_heat_load - 1 * max(1, 10 * (
-                        borefield.Tf_min - min(borefield.results.peak_extraction))))
-            else:
-                peak_heat_load = min(init_peak_heating, peak_heat_load * 1.01)
-                if peak_heat_load == init_peak_heating:
-                    heat_ok = True
-        else:
-            heat_ok = True
-
-        # deviation from maximum temperature
-        if abs(np.max(borefield.results.peak_injection) - borefield.Tf_max) > temperature_threshold:
-            # check if it goes above the threshold
-            if np.max(borefield.results.peak_injection) > borefield.Tf_max:
-                peak_cool_load = max(0.1, peak_cool_load - 1 * max(1, 10 * (
-                        -borefield.Tf_max + np.max(borefield.results.peak_injection))))
-            else:
-                peak_cool_load = min(init_peak_cooling, peak_cool_load * 1.01)
-                if peak_cool_load == init_peak_cooling:
-                    cool_ok = True
-        else:
-            cool_ok = True
+    # the load of the borefield is set by the last evaluation of the margins, which is the one of the found peaks
+    _find_peak_limits(margins, init_peak_heating, init_peak_cooling, temperature_threshold,
+                      borefield._calculation_setup.max_nb_of_iterations)
 
     # calculate external load
     external_load = HourlyBuildingLoad(simulation_period=building_load.simulation_period)
@@ -227,11 +508,15 @@ def optimise_load_profile_energy(
     heating_peak_bl = np.zeros((nb_points, 12 * building_load.simulation_period))
     cooling_peak_bl = np.zeros((nb_points, 12 * building_load.simulation_period))
 
-    for idx in range(nb_points):
-        heating_peak_bl[idx] = building_load.resample_to_monthly(
-            np.minimum(power_heating_range[idx], building_load.hourly_heating_load_simulation_period))[1]
-        cooling_peak_bl[idx] = building_load.resample_to_monthly(
-            np.minimum(power_cooling_range[idx], building_load.hourly_cooling_load_simulation_period))[1]
+    # the peak limits are resampled in chunks, so the stacked hourly profiles do not take too much memory
+    chunk = 10
+    for idx in range(0, nb_points, chunk):
+        heating_peak_bl[idx:idx + chunk] = building_load.resample_to_monthly(
+            np.minimum(power_heating_range[idx:idx + chunk, np.newaxis],
+                       building_load.hourly_heating_load_simulation_period))[1]
+        cooling_peak_bl[idx:idx + chunk] = building_load.resample_to_monthly(
+            np.minimum(power_cooling_range[idx:idx + chunk, np.newaxis],
+                       building_load.hourly_cooling_load_simulation_period))[1]
 
     # create monthly multi-load
     monthly_load = \
@@ -251,13 +536,16 @@ def optimise_load_profile_energy(
     peak_heating = copy.copy(monthly_load.monthly_peak_heating_simulation_period)
     peak_cooling = copy.copy(monthly_load.monthly_peak_cooling_simulation_period)
 
+    # the temperatures are updated incrementally, since only the load of month i changes
+    temperatures = _MonthlyTemperatureSuperposition(borefield, depth)
+
     for i in range(12 * borefield.load.simulation_period):
         # set iteration criteria
         cool_ok, heat_ok = False, False
 
         while not cool_ok or not heat_ok:
-            # calculate temperature profile, just for the results
-            borefield.calculate_temperatures(depth)
+            # update the temperature profile, just for the results
+            temperatures.update(i)
 
             # deviation from minimum temperature
             if abs(borefield.results.peak_extraction[i] - borefield.Tf_min) > temperature_threshold:
@@ -272,6 +560,8 @@ def optimise_load_profile_energy(
                         heat_ok = True
                 borefield.load._peak_heating[i], borefield.load._baseload_heating[i] = \
                     current_heating_peak, np.interp(current_heating_peak, power_heating_range, heating_peak_bl[:, i])
+                # the load arrays are modified in place
+                borefield.load.clear_cache()
             else:
                 heat_ok = True
 
@@ -288,6 +578,8 @@ def optimise_load_profile_energy(
                         cool_ok = True
                 borefield.load._peak_cooling[i], borefield.load._baseload_cooling[i] = \
                     current_cooling_peak, np.interp(current_cooling_peak, power_cooling_range, cooling_peak_bl[:, i])
+                # the load arrays are modified in place
+                borefield.load.clear_cache()
             else:
                 cool_ok = True
 
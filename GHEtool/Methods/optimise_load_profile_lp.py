@@ -0,0 +1,287 @@
+import copy
+import numpy as np
+
+from math import pi
+from typing import Union
+from scipy import optimize, sparse
+from scipy.linalg import toeplitz
+from GHEtool.VariableClasses import HourlyBuildingLoad, MonthlyBuildingLoadMultiYear, HourlyBuildingLoadMultiYear, \
+    EERCombined
+
+# number of points on the relation between the monthly peak and the monthly energy
+_NB_OF_POINTS: int = 100
+
+
+def _energy_constraints(peak_range: np.ndarray, energy: np.ndarray) -> (sparse.csr_matrix, np.ndarray):
+    """
+    This function returns the constraints that limit the monthly energy to the energy that can be delivered below the
+    monthly peak. Since this relation is concave, it is described by the chords between the given points:
+    energy - slope * peak <= energy_k - slope * peak_k for every chord k.
+
+    Parameters
+    ----------
+    peak_range : np.ndarray
+        Peak loads at which the energy is given [kW]
+    energy : np.ndarray
+        Monthly energy below every peak load, with a row for every peak load and a column for every month [kWh]
+
+    Returns
+    -------
+    sparse.csr_matrix, np.ndarray
+        Constraint matrix for the variables [peak, energy] and the upper bounds
+    """
+    nb_of_months = energy.shape[1]
+    if peak_range[-1] <= 0:
+        # there is no load, so the energy is zero
+        return sparse.hstack((sparse.csr_matrix((nb_of_months, nb_of_months)), sparse.identity(nb_of_months))), \
+            np.zeros(nb_of_months)
+    slopes = np.diff(energy, axis=0) / np.diff(peak_range)[:, np.newaxis]
+    offsets = energy[:-1] - slopes * peak_range[:-1, np.newaxis]
+    # the chords above the maximum load of a month are horizontal, so only the first one is kept
+    keep = np.ones(slopes.shape, dtype=bool)
+    keep[1:] = slopes[:-1] > 0
+    chord, month = np.nonzero(keep)
+    rows = np.arange(len(month))
+    matrix = sparse.csr_matrix(
+        (np.concatenate((-slopes[chord, month], np.ones(len(month)))),
+         (np.concatenate((rows, rows)), np.concatenate((month, nb_of_months + month)))),
+        shape=(len(month), 2 * nb_of_months))
+    return matrix, offsets[chord, month]
+
+
+def _peak_for_energy(hourly_load: np.ndarray, hours: np.ndarray, energy: np.ndarray) -> np.ndarray:
+    """
+    This function returns, for every month, the peak limit for which the hourly load below this limit has the given
+    monthly energy.
+
+    Parameters
+    ----------
+    hourly_load : np.ndarray
+        Hourly load for the whole simulation period [kW]
+    hours : np.ndarray
+        Number of hours in every month of the simulation period
+    energy : np.ndarray
+        Monthly energy for the whole simulation period [kWh]
+
+    Returns
+    -------
+    np.ndarray
+        Monthly peak limits [kW]
+    """
+    peaks = np.zeros(len(hours))
+    for month, load in enumerate(np.split(hourly_load, np.cumsum(hours)[:-1])):
+        load = np.sort(load)
+        # energy below a peak limit equal to every hourly value
+        energy_at_load = np.cumsum(load) + load * np.arange(len(load) - 1, -1, -1)
+        if energy[month] >= energy_at_load[-1]:
+            peaks[month] = load[-1]
+            continue
+        index = np.searchsorted(energy_at_load, energy[month])
+        below = energy_at_load[index - 1] if index > 0 else 0.
+        lower = load[index - 1] if index > 0 else 0.
+        peaks[month] = lower + (energy[month] - below) / (len(load) - index)
+    return peaks
+
+
+def optimise_load_profile_lp(
+        borefield,
+        building_load: Union[HourlyBuildingLoad, HourlyBuildingLoadMultiYear],
+        depth: float = None,
+        max_peak_heating: float = None,
+        max_peak_cooling: float = None
+) -> tuple[HourlyBuildingLoadMultiYear, HourlyBuildingLoadMultiYear]:
+    """
+    This function optimises the load for maximum energy extraction and injection based on the given borefield and
+    the given hourly building load, like optimise_load_profile_energy. Since the monthly fluid temperatures are an
+    affine function of the monthly loads, the response of the borefield is calculated once and the monthly peak
+    and energy of the geothermal heating and cooling are found with a single linear program.
+    The energy that can be delivered below a monthly peak is a concave function of this peak, which is described by
+    the chords between 100 points. When the efficiencies depend on the temperature or the part load, they are
+    evaluated at the temperatures and loads of the previous solution and the linear program is solved again, until the
+    temperatures do not change anymore.
+
+    Parameters
+    ----------
+    borefield : Borefield
+        Borefield object
+    building_load : HourlyBuildingLoad | HourlyBuildingLoadMultiYear
+        Load data used for the optimisation
+    depth : float
+        Depth of the boreholes in the borefield [m]
+    max_peak_heating : float
+        The maximum peak power for heating (building side) [kW]
+    max_peak_cooling : float
+        The maximum peak power for cooling (building side) [kW]
+
+    Returns
+    -------
+    tuple [HourlyBuildingLoadMultiYear, HourlyBuildingLoadMultiYear]
+        borefield load, external load
+
+    Raises
+    ------
+    ValueError
+        ValueError if no correct load data is given or if the temperature limits cannot be met, even without
+        geothermal heating and cooling
+    """
+    # copy borefield
+    borefield = copy.deepcopy(borefield)
+
+    # check if hourly load is given
+    if not isinstance(building_load, (HourlyBuildingLoad, HourlyBuildingLoadMultiYear)):
+        raise ValueError("The building load should be of the class HourlyBuildingLoad or HourlyBuildingLoadMultiYear!")
+
+    # set depth
+    if depth is None:
+        depth = borefield.H
+
+    # since the depth does not change, the Rb* value is constant
+    borefield.Rb = borefield.borehole.get_Rb(depth, borefield.D, borefield.r_b, borefield.ground_data.k_s(depth))
+
+    building_load_copy = copy.deepcopy(building_load)
+
+    # if building load is not a multi-year load, convert to multiyear
+    if isinstance(building_load, HourlyBuildingLoad):
+        building_load = HourlyBuildingLoadMultiYear(building_load.hourly_heating_load_simulation_period,
+                                                    building_load.hourly_cooling_load_simulation_period,
+                                                    building_load._cop,
+                                                    building_load._eer,
+                                                    building_load.hourly_dhw_load_simulation_period,
+                                                    building_load._cop_dhw)
+    hourly_heating = building_load.hourly_heating_load_simulation_period
+    hourly_cooling = building_load.hourly_cooling_load_simulation_period
+
+    # relationship between the peak load and the corresponding monthly load
+    max_heating = building_load.max_peak_heating if max_peak_heating is None else \
+        min(max_peak_heating, building_load.max_peak_heating)
+    max_cooling = building_load.max_peak_cooling if max_peak_cooling is None else \
+        min(max_peak_cooling, building_load.max_peak_cooling)
+    power_heating_range = np.linspace(0, max_heating, _NB_OF_POINTS)
+    power_cooling_range = np.linspace(0, max_cooling, _NB_OF_POINTS)
+    heating_peak_bl = building_load.resample_to_monthly(np.minimum(power_heating_range[:, np.newaxis],
+                                                                   hourly_heating))[1]
+    cooling_peak_bl = building_load.resample_to_monthly(np.minimum(power_cooling_range[:, np.newaxis],
+                                                                   hourly_cooling))[1]
+
+    # create monthly multi-load
+    monthly_load = \
+        MonthlyBuildingLoadMultiYear(
+            baseload_heating=building_load.monthly_baseload_heating_simulation_period,
+            baseload_cooling=building_load.monthly_baseload_cooling_simulation_period,
+            peak_heating=building_load.monthly_peak_heating_simulation_period,
+            peak_cooling=building_load.monthly_peak_cooling_simulation_period,
+            efficiency_heating=building_load._cop,
+            efficiency_cooling=building_load._eer,
+            dhw=building_load.monthly_baseload_dhw_simulation_period,
+            efficiency_dhw=building_load._cop_dhw)
+    borefield.load = monthly_load
+    nb_of_months = 12 * monthly_load.simulation_period
+    hours = np.tile(monthly_load.UPM, monthly_load.simulation_period)
+
+    # thermal response of the borefield, the same as in Borefield._calculate_temperature_profile
+    k_s = borefield.ground_data.k_s(depth)
+    Rb = borefield.borehole.get_Rb(depth, borefield.D, borefield.r_b, borefield.ground_data.k_s(borefield.H))
+    g_values, g_value_peak_injection, g_value_peak_extraction = borefield._monthly_gvalues(depth)
+    factor = 1000 / borefield.number_of_boreholes / depth
+    step_response = np.diff(g_values, prepend=0) / (2 * pi * k_s) * factor
+    response = toeplitz(step_response, np.zeros(nb_of_months))
+    resistance = Rb * factor
+    peak_injection_resistance = (g_value_peak_injection / k_s / 2 / pi + Rb) * factor
+    peak_extraction_resistance = (g_value_peak_extraction / k_s / 2 / pi + Rb) * factor
+    Tg = borefield._Tg(depth)
+
+    # the variables are the peak heating, heating energy, peak cooling and cooling energy (building side) of every month
+    heating_matrix, heating_bounds = _energy_constraints(power_heating_range, heating_peak_bl)
+    cooling_matrix, cooling_bounds = _energy_constraints(power_cooling_range, cooling_peak_bl)
+    energy_matrix = sparse.block_diag((heating_matrix, cooling_matrix))
+    bounds = [(0, max_heating)] * nb_of_months + [(0, None)] * nb_of_months + \
+             [(0, max_cooling)] * nb_of_months + [(0, None)] * nb_of_months
+    objective = np.concatenate((np.zeros(nb_of_months), -np.ones(nb_of_months),
+                                np.zeros(nb_of_months), -np.ones(nb_of_months)))
+
+    def ratio(geothermal: np.ndarray, building: np.ndarray) -> np.ndarray:
+        # conversion factor from the building to the geothermal load
+        return np.divide(geothermal, building, out=np.zeros(nb_of_months), where=building > 0)
+
+    # the efficiencies are evaluated at the temperature limits first
+    if isinstance(monthly_load.eer, EERCombined) and monthly_load.eer.threshold_temperature is not None:
+        monthly_load.reset_results(borefield.Tf_min, monthly_load.eer.threshold_temperature)
+    else:
+        monthly_load.reset_results(borefield.Tf_min, borefield.Tf_max)
+
+    previous_factors = None
+    for _ in range(borefield._calculation_setup.max_nb_of_iterations):
+        factors = np.array([
+            ratio(monthly_load._monthly_peak_extraction_heating_simulation_period,
+                  monthly_load.monthly_peak_heating_simulation_period),
+            ratio(monthly_load._monthly_baseload_extraction_heating_simulation_period,
+                  monthly_load.monthly_baseload_heating_simulation_period),
+            ratio(monthly_load.monthly_peak_injection_simulation_period,
+                  monthly_load.monthly_peak_cooling_simulation_period),
+            ratio(monthly_load.monthly_baseload_injection_simulation_period,
+                  monthly_load.monthly_baseload_cooling_simulation_period)])
+        if previous_factors is not None and np.allclose(factors, previous_factors):
+            break
+        previous_factors = factors
+
+        # the DHW is not optimised
+        dhw_extraction = monthly_load.monthly_baseload_extraction_simulation_period - \
+            monthly_load._monthly_baseload_extraction_heating_simulation_period
+        dhw_peak = monthly_load.monthly_peak_extraction_simulation_period - \
+            monthly_load._monthly_peak_extraction_heating_simulation_period
+
+        # extraction and injection power per kWh of heating and cooling energy
+        extraction = factors[1] / hours
+        injection = factors[3] / hours
+        Tb = Tg - response @ (dhw_extraction / hours)
+
+        # peak extraction temperature >= Tf_min
+        peak_extraction = np.hstack((
+            -np.diag(factors[0] * peak_extraction_resistance),
+            -response * extraction + np.diag((peak_extraction_resistance - resistance) * extraction),
+            np.zeros((nb_of_months, nb_of_months)),
+            response * injection))
+        peak_extraction_constant = Tb + (peak_extraction_resistance - resistance) * dhw_extraction / hours - \
+            peak_extraction_resistance * dhw_peak
+        # peak injection temperature <= Tf_max
+        peak_injection = np.hstack((
+            np.zeros((nb_of_months, nb_of_months)),
+            -response * extraction,
+            np.diag(factors[2] * peak_injection_resistance),
+            response * injection + np.diag((resistance - peak_injection_resistance) * injection)))
+
+        solution = optimize.linprog(
+            objective,
+            A_ub=sparse.vstack((energy_matrix, sparse.csr_matrix(-peak_extraction), sparse.csr_matrix(peak_injection))),
+            b_ub=np.concatenate((heating_bounds, cooling_bounds, peak_extraction_constant - borefield.Tf_min,
+                                 borefield.Tf_max - Tb)),
+            bounds=bounds, method="highs")
+        if not solution.success:
+            raise ValueError(f"The temperature limits cannot be met: {solution.message}")
+        heating_energy = np.maximum(0, solution.x[nb_of_months:2 * nb_of_months])
+        cooling_energy = np.maximum(0, solution.x[3 * nb_of_months:])
+
+        # the lowest peaks with the optimal energy
+        peak_heating = _peak_for_energy(hourly_heating, hours, heating_energy)
+        peak_cooling = _peak_for_energy(hourly_cooling, hours, cooling_energy)
+
+        # update the efficiencies with the temperatures of the solution
+        monthly_load.peak_heating, monthly_load.baseload_heating = peak_heating, heating_energy
+        monthly_load.peak_cooling, monthly_load.baseload_cooling = peak_cooling, cooling_energy
+        borefield.calculate_temperatures(depth)
+
+    # calculate hourly load
+    borefield_load = copy.deepcopy(building_load)
+    borefield_load.hourly_heating_load = np.minimum(hourly_heating, np.repeat(peak_heating, hours))
+    borefield_load.hourly_cooling_load = np.minimum(hourly_cooling, np.repeat(peak_cooling, hours))
+
+    # calculate external load
+    external_load = HourlyBuildingLoadMultiYear()
+    external_load.set_hourly_heating_load(
+        np.maximum(0,
+                   building_load_copy.hourly_heating_load_simulation_period - borefield_load.hourly_heating_load_simulation_period))
+    external_load.set_hourly_cooling_load(
+        np.maximum(0,
+                   building_load_copy.hourly_cooling_load_simulation_period - borefield_load.hourly_cooling_load_simulation_period))
+
+    return borefield_load, external_load
@@ -0,0 +1,201 @@
+"""
+This file contains the functionality to size many borefields at once, distributed over multiple processes.
+"""
+from __future__ import annotations
+
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pygfunction as gt
+
+from GHEtool.Borefield import Borefield
+from GHEtool.VariableClasses import CalculationSetup, FluidData, GFunction, GFunctionStore
+from GHEtool.VariableClasses.BaseClass import UnsolvableDueToTemperatureGradient, MaximumNumberOfIterations
+from GHEtool.VariableClasses.GroundData._GroundData import _GroundData
+from GHEtool.VariableClasses.LoadData import _LoadData
+from GHEtool.VariableClasses.PipeData import _PipeData
+
+# g-function object of the current (worker) process, which is shared by all the scenarios it sizes, so the g-values
+# of previous scenarios with the same geometry are reused
+_GFUNCTION: GFunction = None
+
+
+class SizingScenario:
+    """
+    Lightweight description of a borefield that should be sized with size_many. It only contains the data that is
+    needed to create the Borefield object, so it is cheap to send to another process.
+    """
+
+    __slots__ = 'borefield', 'ground_data', 'load', 'calculation_setup', 'Rb', 'fluid_data', 'pipe_data', \
+        'Tf_max', 'Tf_min'
+
+    def __init__(self, borefield: List[gt.boreholes.Borehole], ground_data: _GroundData, load: _LoadData,
+                 calculation_setup: CalculationSetup = None, Rb: float = None, fluid_data: FluidData = None,
+                 pipe_data: _PipeData = None, Tf_max: float = 16., Tf_min: float = 0.):
+        """
+
+        Parameters
+        ----------
+        borefield : list[pygfunction.boreholes.Borehole]
+            Geometry of the borefield
+        ground_data : GroundData
+            Ground data
+        load : _LoadData
+            Load of the borefield
+        calculation_setup : CalculationSetup
+            Settings of the sizing. If None, the default settings are used.
+        Rb : float
+            Constant equivalent borehole thermal resistance [mK/W]. If None, the default value or the value calculated
+            with the fluid and pipe data is used.
+        fluid_data : FluidData
+            Fluid data
+        pipe_data : PipeData
+            Pipe data
+        Tf_max : float
+            Maximum average fluid temperature [deg C]
+        Tf_min : float
+            Minimum average fluid temperature [deg C]
+        """
+        self.borefield: List[gt.boreholes.Borehole] = borefield
+        self.ground_data: _GroundData = ground_data
+        self.load: _LoadData = load
+        self.calculation_setup: CalculationSetup = calculation_setup
+        self.Rb: float = Rb
+        self.fluid_data: FluidData = fluid_data
+        self.pipe_data: _PipeData = pipe_data
+        self.Tf_max: float = Tf_max
+        self.Tf_min: float = Tf_min
+
+    def create_borefield(self, gfunction: GFunction = None) -> Borefield:
+        """
+        This function creates the Borefield object of this scenario.
+
+        Parameters
+        ----------
+        gfunction : GFunction
+            g-function object that should be used by the borefield. If None, the borefield has its own g-function
+            object.
+
+        Returns
+        -------
+        Borefield
+            Borefield object of this scenario
+        """
+        borefield = Borefield()
+        if gfunction is not None:
+            borefield.gfunction_calculation_object = gfunction
+        borefield.set_ground_parameters(self.ground_data)
+        borefield.set_borefield(self.borefield)
+        borefield.load = self.load
+        if self.calculation_setup is not None:
+            borefield.calculation_setup(self.calculation_setup)
+        if self.fluid_data is not None:
+            borefield.set_fluid_parameters(self.fluid_data)
+        if self.pipe_data is not None:
+            borefield.set_pipe_parameters(self.pipe_data)
+        if self.Rb is not None:
+            borefield.set_Rb(self.Rb)
+        borefield.set_max_avg_fluid_temperature(self.Tf_max)
+        borefield.set_min_avg_fluid_temperature(self.Tf_min)
+        return borefield
+
+
+def _initialise_process(gfunction_store: Union[str, os.PathLike, None]) -> None:
+    """
+    This function creates the g-function object of the current process.
+
+    Parameters
+    ----------
+    gfunction_store : str, os.PathLike, None
+        Directory of the persistent store of g-functions. If None, no store is used.
+
+    Returns
+    -------
+    None
+    """
+    global _GFUNCTION
+    _GFUNCTION = GFunction()
+    _GFUNCTION.store = GFunctionStore(gfunction_store) if gfunction_store is not None else None
+
+
+def _size_chunk(scenarios: List[SizingScenario]) -> List[Tuple[float, str, float]]:
+    """
+    This function sizes a chunk of scenarios in the current process, with the g-function object of this process.
+
+    Parameters
+    ----------
+    scenarios : list[SizingScenario]
+        Scenarios that should be sized
+
+    Returns
+    -------
+    list[tuple[float, str, float]]
+        For every scenario, the depth [m] (NaN if the sizing failed), the name of the error (None if the sizing
+        succeeded) and the time of the sizing [s]
+    """
+    results = []
+    for scenario in scenarios:
+        start = time.perf_counter()
+        try:
+            depth, error = scenario.create_borefield(_GFUNCTION).size(), None
+        except (UnsolvableDueToTemperatureGradient, MaximumNumberOfIterations) as exception:
+            depth, error = np.nan, type(exception).__name__
+        results.append((depth, error, time.perf_counter() - start))
+    return results
+
+
+def size_many(scenarios: List[SizingScenario], workers: int = None, chunksize: int = None,
+              gfunction_store: Union[str, os.PathLike] = None) -> pd.DataFrame:
+    """
+    This function sizes many borefields. The scenarios are split in chunks of consecutive scenarios, which are
+    distributed over a pool of processes. Every process reuses its g-function object for all the scenarios it sizes,
+    so the g-values of scenarios with the same geometry are only calculated once per process. Since the g-values can be
+    interpolated from the ones of previous scenarios, the resulting depths can differ from a sizing of the scenario on
+    its own (and between different numbers of processes) within the tolerance of the sizing.
+    Sizings that fail due to the temperature gradient or the maximum number of iterations do not stop the other
+    sizings, but are reported in the resulting table.
+
+    Parameters
+    ----------
+    scenarios : list[SizingScenario]
+        Scenarios that should be sized
+    workers : int
+        Number of processes in which the scenarios are sized.
+        If None or 1, all scenarios are sized one after the other in the current process.
+    chunksize : int
+        Number of consecutive scenarios that are sent to a process at once. If None, every process gets about four
+        chunks, which limits the communication between the processes while still balancing the work between them.
+    gfunction_store : str, os.PathLike
+        Directory of a persistent store of g-functions, which is shared by all the processes. If None, no store is used.
+
+    Returns
+    -------
+    pd.DataFrame
+        Table with a row for every scenario, in the order of the scenarios, with the columns 'depth' (the resulting
+        borehole depth [m], NaN if the sizing failed), 'error' (the name of the error if the sizing failed, None
+        otherwise) and 'time' (the time of the sizing [s])
+    """
+    global _GFUNCTION
+    scenarios = list(scenarios)
+    if workers is None or workers <= 1:
+        _initialise_process(gfunction_store)
+        try:
+            results = _size_chunk(scenarios)
+        finally:
+            # do not keep the g-values in memory after the sizing in the current process
+            _GFUNCTION = None
+    else:
+        if chunksize is None:
+            chunksize = max(1, math.ceil(len(scenarios) / (4 * workers)))
+        chunks = [scenarios[i:i + chunksize] for i in range(0, len(scenarios), chunksize)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_initialise_process,
+                                 initargs=(gfunction_store,)) as executor:
+            # map returns the chunks in the order in which they were submitted
+            results = [result for chunk in executor.map(_size_chunk, chunks) for result in chunk]
+
+    return pd.DataFrame(results, columns=['depth', 'error', 'time'])
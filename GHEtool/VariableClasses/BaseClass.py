@@ -60,3 +60,11 @@ class MaximumNumberOfIterations(RuntimeError):
     """
     def __init__(self, iter: int):
         super().__init__(f'The maximum number of iterations {iter} is crossed. There is no size convergence.')
+
+
+class SizingStopped(Exception):
+    """
+    This Exception occurs when a sizing is stopped before it is converged, because its result is no longer needed.
+    """
+    def __init__(self):
+        super().__init__('The sizing is stopped since its result is no longer needed.')
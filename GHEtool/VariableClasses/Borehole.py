@@ -2,13 +2,110 @@
 This document contains all the information of the borehole class.
 """
 
+import threading
+
 from GHEtool.VariableClasses.BaseClass import BaseClass
 from GHEtool.VariableClasses.FluidData import FluidData
 from GHEtool.VariableClasses.PipeData import _PipeData, MultipleUTube
-from typing import Union
+from GHEtool.VariableClasses.SizingMemo import fingerprint
+from typing import Callable, Union
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pygfunction as gt
+from scipy.interpolate import CubicSpline
+
+# calculated equivalent borehole thermal resistances and Rb*(H) surrogates, shared by all the boreholes
+_RB_CACHE: dict = {}
+_RB_SURROGATES: dict = {}
+_RB_CACHE_SIZE: int = 4096
+# the caches are used by the threads of the concurrent sizing, so the removal and insertion of values is locked
+_RB_CACHE_LOCK: threading.Lock = threading.Lock()
+
+
+def _store(cache: dict, key: tuple, value):
+    """
+    This function stores a value in one of the Rb* caches. When the cache is full, the oldest value is removed.
+    This is thread safe.
+
+    Parameters
+    ----------
+    cache : dict
+        Cache
+    key : tuple
+        Key of the value
+    value
+        Value to be stored
+
+    Returns
+    -------
+    Value
+        Stored value
+    """
+    with _RB_CACHE_LOCK:
+        if len(cache) >= _RB_CACHE_SIZE:
+            cache.pop(next(iter(cache)), None)
+        cache[key] = value
+    return value
+
+
+class RbSurrogate:
+    """
+    Cubic spline of the equivalent borehole thermal resistance in function of the borehole depth, for a fixed burial
+    depth, borehole radius, ground thermal conductivity, fluid and pipe. The spline is refined by halving its node
+    spacing until the largest difference with the exact resistance halfway between the nodes is below the tolerance.
+    """
+
+    def __init__(self, Rb: Callable[[float], float], H_min: float = 10., H_max: float = 1000.,
+                 tolerance: float = 1e-4, max_nb_of_refinements: int = 6):
+        """
+
+        Parameters
+        ----------
+        Rb : callable
+            Function that calculates the exact equivalent borehole thermal resistance [mK/W] for a borehole depth [m]
+        H_min : float
+            Minimal borehole depth of the surrogate [m]
+        H_max : float
+            Maximal borehole depth of the surrogate [m]
+        tolerance : float
+            Maximal error on the equivalent borehole thermal resistance [mK/W]
+        max_nb_of_refinements : int
+            Maximal number of times the node spacing is halved
+        """
+        self.H_min: float = H_min
+        self.H_max: float = H_max
+        nodes = np.linspace(H_min, H_max, 9)
+        values = np.array([Rb(H) for H in nodes])
+        for _ in range(max_nb_of_refinements + 1):
+            midpoints = (nodes[1:] + nodes[:-1]) / 2
+            exact = np.array([Rb(H) for H in midpoints])
+            self.error: float = float(np.max(np.abs(CubicSpline(nodes, values)(midpoints) - exact)))
+            # the midpoints are used as extra nodes, so the resulting spline is more accurate than the error estimate
+            nodes = np.insert(nodes, np.arange(1, nodes.size), midpoints)
+            values = np.insert(values, np.arange(1, values.size), exact)
+            if self.error <= tolerance:
+                break
+        self._spline = CubicSpline(nodes, values)
+
+    def __contains__(self, H: float) -> bool:
+        return self.H_min <= H <= self.H_max
+
+    def __call__(self, H: float) -> float:
+        """
+        This function returns the equivalent borehole thermal resistance at the borehole depth H.
+
+        Parameters
+        ----------
+        H : float
+            Borehole depth [m]
+
+        Returns
+        -------
+        Rb* : float
+            Equivalent borehole thermal resistance [mK/W]
+        """
+        return float(self._spline(H))
 
 
 class Borehole(BaseClass):
@@ -17,7 +114,8 @@ class Borehole(BaseClass):
     borehole thermal resistance and contains a fluid and pipe class object.
     """
 
-    __slots__ = '_fluid_data', '_pipe_data', '_Rb', 'use_constant_Rb', 'borehole_internal_model'
+    __slots__ = '_fluid_data', '_pipe_data', '_Rb', 'use_constant_Rb', 'borehole_internal_model', \
+                'Rb_surrogate_tolerance'
 
     def __init__(self, fluid_data: FluidData = None, pipe_data: _PipeData = None):
         """
@@ -34,6 +132,8 @@ class Borehole(BaseClass):
         self._Rb: float = 0.12
         self.use_constant_Rb: bool = True
         self.borehole_internal_model: gt.pipes._BasePipe = None
+        # when not None, get_Rb interpolates in an Rb*(H) surrogate with this maximal error [mK/W]
+        self.Rb_surrogate_tolerance: float = None
         if not fluid_data is None:
             self.fluid_data = fluid_data
         if not pipe_data is None:
@@ -171,6 +271,8 @@ class Borehole(BaseClass):
     def calculate_Rb(self, H: float, D: float, r_b: float, k_s: Union[float, callable]) -> float:
         """
         This function calculates the equivalent borehole thermal resistance.
+        The calculated resistances are cached, so they are only calculated once for the same borehole, ground, fluid
+        and pipe parameters.
 
         Parameters
         ----------
@@ -198,17 +300,75 @@ class Borehole(BaseClass):
             print("Please make sure you set al the pipe and fluid data.")
             raise ValueError
 
+        k_s = k_s if isinstance(k_s, (float, int)) else k_s(H)
+        # the fingerprint changes as well when the fluid or pipe data is altered in place
+        key = (H, D, r_b, k_s, fingerprint(self.fluid_data, self.pipe_data))
+        # the value is looked up once, since it can be removed by another thread in the meantime
+        Rb = _RB_CACHE.get(key)
+        if Rb is not None:
+            return Rb
+
         # initiate temporary borefield
         borehole = gt.boreholes.Borehole(H, D, r_b, 0, 0)
         # initiate pipe
-        pipe = self.pipe_data.pipe_model(self.fluid_data, k_s if isinstance(k_s, (float, int)) else k_s(H), borehole)
+        pipe = self.pipe_data.pipe_model(self.fluid_data, k_s, borehole)
+
+        Rb = pipe.effective_borehole_thermal_resistance(self.fluid_data.mfr, self.fluid_data.Cp)
+        return _store(_RB_CACHE, key, Rb)
+
+    def Rb_surrogate(self, D: float, r_b: float, k_s: float, tolerance: float = 1e-4) -> RbSurrogate:
+        """
+        This function returns the surrogate of the equivalent borehole thermal resistance in function of the
+        borehole depth for the current fluid and pipe data. The surrogate is only created once for the same
+        parameters.
 
-        return pipe.effective_borehole_thermal_resistance(self.fluid_data.mfr, self.fluid_data.Cp)
+        Parameters
+        ----------
+        D : float
+            Borehole burial depth [m]
+        r_b : float
+            Borehole radius [m]
+        k_s : float
+            Ground thermal conductivity [mk/W]
+        tolerance : float
+            Maximal error on the equivalent borehole thermal resistance [mK/W]
+
+        Returns
+        -------
+        RbSurrogate
+            Surrogate of Rb*(H)
+
+        Raises
+        ------
+        ValueError
+            ValueError when the pipe and/or fluid data is not set correctly.
+        """
+        key = (D, r_b, k_s, tolerance, fingerprint(self.fluid_data, self.pipe_data))
+        surrogate = _RB_SURROGATES.get(key)
+        if surrogate is None:
+            surrogate = _store(_RB_SURROGATES, key,
+                               RbSurrogate(lambda H: self.calculate_Rb(H, D, r_b, k_s), tolerance=tolerance))
+        return surrogate
+
+    @staticmethod
+    def clear_Rb_cache() -> None:
+        """
+        This function removes all the cached equivalent borehole thermal resistances and Rb*(H) surrogates.
+
+        Returns
+        -------
+        None
+        """
+        with _RB_CACHE_LOCK:
+            _RB_CACHE.clear()
+            _RB_SURROGATES.clear()
 
     def get_Rb(self, H: float, D: float, r_b: float, k_s: Union[callable, float]) -> float:
         """
         This function returns the equivalent borehole thermal resistance.
         If use_constant_Rb is True, self._Rb is returned, otherwise the resistance is calculated.
+        When Rb_surrogate_tolerance is set and the ground thermal conductivity does not depend on the depth,
+        the resistance is interpolated in the Rb*(H) surrogate instead.
 
         Parameters
         ----------
@@ -229,8 +389,32 @@ class Borehole(BaseClass):
         if self.use_constant_Rb:
             return self.Rb
 
+        if self.Rb_surrogate_tolerance is not None and isinstance(k_s, (int, float)):
+            surrogate = self.Rb_surrogate(D, r_b, k_s, self.Rb_surrogate_tolerance)
+            if H in surrogate:
+                return surrogate(H)
+
         return self.calculate_Rb(H, D, r_b, k_s if isinstance(k_s, (int, float)) else k_s(H))
 
+    def __setstate__(self, state: tuple) -> None:
+        """
+        This function restores a (pickled or copied) Borehole object. Objects that were pickled with an older
+        version of GHEtool do not have all the attributes, so these are initialised with their default values.
+
+        Parameters
+        ----------
+        state : tuple
+            Tuple with the dictionary and the slots of the pickled object
+
+        Returns
+        -------
+        None
+        """
+        slots = state[1] if isinstance(state, tuple) else state
+        default = Borehole()
+        for var in self.__slots__:
+            setattr(self, var, slots[var] if var in slots else getattr(default, var))
+
     def __eq__(self, other):
         if not isinstance(other, Borehole):
             return False
@@ -16,14 +16,18 @@ class CalculationSetup(BaseClass):
 
     __slots__ = '_L2_sizing', '_L3_sizing', '_L4_sizing', 'quadrant_sizing', '_backup', \
                 'atol', 'rtol', 'max_nb_of_iterations', 'interpolate_gfunctions', 'H_init',\
-                'use_precalculated_dataset', 'deep_sizing', 'force_deep_sizing'
+                'use_precalculated_dataset', 'deep_sizing', 'force_deep_sizing', \
+                'bracketed_sizing', 'prefetch_gfunctions', 'fixed_point_acceleration', 'concurrent_quadrants', \
+                'sizing_memo'
 
     def __init__(self, quadrant_sizing: int = 0,
                  L2_sizing: bool = None, L3_sizing: bool = None, L4_sizing: bool = None,
                  atol: float = 0.05, rtol: float = 0.005, max_nb_of_iterations: int = 40,
                  interpolate_gfunctions: bool = None, H_init: float = 100.,
                  use_precalculated_dataset: bool = True, deep_sizing: bool = False,
-                 force_deep_sizing: bool = False):
+                 force_deep_sizing: bool = False, bracketed_sizing: bool = False,
+                 prefetch_gfunctions: bool = False, fixed_point_acceleration: str = 'none',
+                 concurrent_quadrants: bool = False, sizing_memo: bool = False):
         """
 
         Parameters
@@ -61,6 +65,34 @@ class CalculationSetup(BaseClass):
             sizing is done again with this other methodology.
         force_deep_sizing : bool
             True when deep_sizing should be done always
+        bracketed_sizing : bool
+            True if the depth should be found by bracketing the solution and using Brent's method on the difference
+            between the limiting fluid temperature and the temperature limit, instead of with the fixed-point
+            iteration. This needs fewer temperature calculations and also converges with a temperature gradient.
+        prefetch_gfunctions : bool
+            True if, during the iterative sizing, the depth of the next iteration should be predicted and the g-values
+            at a depth just beyond it should be calculated in a background process, so the next depth can be
+            interpolated instead of calculated. This is useful for large borefields on a computer with multiple cores.
+            The background process is started at the first sizing and reused for the next ones, until
+            stop_prefetch(shutdown=True) is called on the g-function object.
+        fixed_point_acceleration : str
+            Method to accelerate the iteration between the fluid temperatures and the efficiency of a building load.
+            This can be 'none' for a plain iteration, 'anderson' for Anderson mixing over the previous iterations or
+            'aitken' for Aitken's delta-squared method. The acceleration needs fewer temperature calculations when the
+            efficiency depends strongly on the fluid temperature.
+        concurrent_quadrants : bool
+            True if, in the L3 and L4 sizing, the sizings for the maximum and the minimum temperature should be
+            performed at the same time in two threads, which share the g-function object of the borefield. Otherwise,
+            the sizing for the minimum temperature is only performed when the sizing for the maximum temperature does
+            not satisfy the minimum temperature. The sizing for the minimum temperature is stopped when it turns out
+            not to be needed, but it can still finish its current calculation in the background after the sizing has
+            returned. Since both sizings compete for the same core otherwise, the sizings are always performed one
+            after the other on a computer with a single core.
+        sizing_memo : bool
+            True if the results of the sizings should be remembered by the borefield. A sizing with exactly the same
+            ground data, borefield geometry, borehole data, load, temperature limits and settings returns the
+            remembered result immediately, whereas a sizing with another load or other temperature limits starts from
+            the depth of the remembered sizing with the most similar load and temperature limits.
 
         References
         ----------
@@ -81,6 +113,11 @@ class CalculationSetup(BaseClass):
         self.use_precalculated_dataset: bool = use_precalculated_dataset
         self.deep_sizing: bool = deep_sizing
         self.force_deep_sizing: bool = force_deep_sizing
+        self.bracketed_sizing: bool = bracketed_sizing
+        self.prefetch_gfunctions: bool = prefetch_gfunctions
+        self.fixed_point_acceleration: str = fixed_point_acceleration
+        self.concurrent_quadrants: bool = concurrent_quadrants
+        self.sizing_memo: bool = sizing_memo
 
         self._backup: CalculationSetup = None
 
@@ -121,7 +158,8 @@ class CalculationSetup(BaseClass):
         Raises
         ------
         ValueError
-            When there is a problematic value like two sizing methods or a quadrant not in (0, 4)
+            When there is a problematic value like two sizing methods, a quadrant not in (0, 4) or an unknown
+            fixed-point acceleration
         """
         variables = self.__slots__
         sizing_vars = set(["L2_sizing", "L3_sizing", "L4_sizing"])
@@ -141,6 +179,8 @@ class CalculationSetup(BaseClass):
                 if val is not None:
                     if key == "quadrant_sizing" and val not in (0, 1, 2, 3, 4):
                         raise ValueError(f'The quadrant {val} does not exist!')
+                    if key == "fixed_point_acceleration" and val not in ('none', 'anderson', 'aitken'):
+                        raise ValueError(f'The fixed-point acceleration {val} does not exist!')
                     self.__setattr__(key, val)
             elif key != 'self' and key not in sizing_vars:
                 raise ValueError(f'The variable {key} is not a valid options!')
@@ -266,6 +306,25 @@ class CalculationSetup(BaseClass):
             kwargs[var] = self._backup.__getattribute__(var)
         self._set_sizing_setup(kwargs)
 
+    def __setstate__(self, state: tuple) -> None:
+        """
+        This function restores a (pickled or copied) CalculationSetup object. Objects that were pickled with an older
+        version of GHEtool do not have all the attributes, so these are initialised with their default values.
+
+        Parameters
+        ----------
+        state : tuple
+            Tuple with the dictionary and the slots of the pickled object
+
+        Returns
+        -------
+        None
+        """
+        slots = state[1] if isinstance(state, tuple) else state
+        default = CalculationSetup()
+        for var in self.__slots__:
+            setattr(self, var, slots[var] if var in slots else getattr(default, var))
+
     def __eq__(self, other):
         if not isinstance(other, CalculationSetup):
             return False
@@ -2,14 +2,18 @@
 This file contains both the CustomGFunction class and all the relevant information w.r.t. custom gfunctions.
 """
 import copy
+import json
+import os
 import pickle
 import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import List, Union
 
 import numpy as np
 import pygfunction as gt
-from scipy import interpolate
 from GHEtool.logger.ghe_logger import ghe_logger
+from GHEtool.VariableClasses.GFunctionInterpolator import GFunctionInterpolator
+from GHEtool.VariableClasses.GFunctionStore import GFunctionStore, _write_atomic
 
 
 def _time_values(dt=3600., t_max=100. * 8760 * 3600.) -> np.array:
@@ -39,6 +43,38 @@ def _time_values(dt=3600., t_max=100. * 8760 * 3600.) -> np.array:
     return gt.load_aggregation.ClaessonJaved(dt, t_max).get_times_for_simulation()
 
 
+def _calculate_gvalues(borefield: List[gt.boreholes.Borehole], alpha: float, time_array: np.ndarray, options: dict,
+                       H: float) -> np.ndarray:
+    """
+    This function calculates the g-function for uniform borehole wall temperature at a certain depth.
+    It is defined on module level, so it can be used in a process pool.
+
+    Parameters
+    ----------
+    borefield : list[pygfunction.boreholes.Borehole]
+        Borefield object for which the g-function should be calculated
+    alpha : float
+        Ground thermal diffusivity [m2/s]
+    time_array : np.ndarray
+        Time values [s] at which the g-function should be calculated
+    options : dict
+        Dictionary with options for the gFunction class of pygfunction
+    H : float
+        Depth of the boreholes [m]
+
+    Returns
+    -------
+    np.ndarray
+        g-function values
+    """
+    borefield = copy.deepcopy(borefield)
+    # set borehole depth in borefield
+    for borehole in borefield:
+        borehole.H = H
+
+    return gt.gfunction.gFunction(borefield, alpha, time_array, options=options, method=options["method"]).gFunc
+
+
 class CustomGFunction:
 
     """
@@ -48,6 +84,10 @@ class CustomGFunction:
     DEFAULT_DEPTH_ARRAY: np.ndarray = np.arange(0, 351, 25)  # m
     DEFAULT_DEPTH_ARRAY[0] = 10  # m
     DEFAULT_TIME_ARRAY: np.ndarray = _time_values()  # sec
+    FORMAT_VERSION: int = 1  # version of the format of dump_custom_dataset
+
+    # hash of the geometry of the borefield of the dataset (neglecting the depth)
+    geometry_hash: str = None
 
     def __init__(self, time_array: np.ndarray = None, depth_array: np.ndarray = None, options: dict = None):
         """
@@ -69,6 +109,8 @@ class CustomGFunction:
         self.max_t: float = 0.
         self.min_t: float = 0.
 
+        self._interpolator: GFunctionInterpolator = GFunctionInterpolator()
+
         self.time_array = CustomGFunction.DEFAULT_TIME_ARRAY
         self.depth_array = CustomGFunction.DEFAULT_DEPTH_ARRAY
 
@@ -133,13 +175,7 @@ class CustomGFunction:
         if check and not self.within_range(time_value, H):
             return False
 
-        if not isinstance(time_value, (float, int)):
-            # multiple values are requested
-            g_value = interpolate.interpn((self.depth_array, self.time_array), self.gvalues_array, np.array([[H, t] for t in time_value]))
-        else:
-            # only one value is requested
-            g_value = interpolate.interpn((self.depth_array, self.time_array), self.gvalues_array, np.array([H, time_value]))
-        return g_value
+        return self._interpolator(self.depth_array, self.time_array, self.gvalues_array, H, time_value)
 
     def within_range(self, time_value: Union[list, float, np.ndarray], H: float) -> bool:
         """
@@ -191,7 +227,8 @@ class CustomGFunction:
 
         return True
 
-    def create_custom_dataset(self, borefield: List[gt.boreholes.Borehole], alpha: Union[float, callable]) -> None:
+    def create_custom_dataset(self, borefield: List[gt.boreholes.Borehole], alpha: Union[float, callable],
+                              workers: int = None) -> None:
         """
         This function creates the custom dataset.
 
@@ -201,6 +238,9 @@ class CustomGFunction:
             Borefield object for which the custom dataset should be created
         alpha : float or callable
             Ground thermal diffusivity [m2/s] or function to calculate it at a certain depth
+        workers : int
+            Number of processes in which the g-functions for the different depths are calculated.
+            If None or 1, all depths are calculated one after the other in the current process.
 
         Returns
         -------
@@ -210,24 +250,33 @@ class CustomGFunction:
         if not "method" in self.options:
             self.options["method"] = "equivalent"
 
-        for idx, H in enumerate(self.depth_array):
-            ghe_logger.info(f'Start H: {H}')
-
-            # Calculate the g-function for uniform borehole wall temperature
-            borefield = copy.deepcopy(borefield)
-            # set borehole depth in borefield
-            for borehole in borefield:
-                borehole.H = H
-
-            gfunc_uniform_T = gt.gfunction.gFunction(borefield, alpha if isinstance(alpha, float) else alpha(H),
-                                                     self.time_array, options=self.options,
-                                                     method=self.options["method"])
-
-            self.gvalues_array[idx] = gfunc_uniform_T.gFunc
-
-    def dump_custom_dataset(self, path: str, name: str) -> None:
+        self.geometry_hash = GFunctionStore.geometry_hash(borefield)
+        alphas = [alpha if isinstance(alpha, float) else alpha(H) for H in self.depth_array]
+        nb_of_depths = self.depth_array.size
+
+        if workers is None or workers <= 1:
+            for idx, H in enumerate(self.depth_array):
+                ghe_logger.info(f'Start H: {H}')
+                self.gvalues_array[idx] = _calculate_gvalues(borefield, alphas[idx], self.time_array, self.options, H)
+                ghe_logger.info(f'Finished H: {H} ({idx + 1}/{nb_of_depths})')
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_calculate_gvalues, borefield, alphas[idx], self.time_array, self.options, H):
+                       idx for idx, H in enumerate(self.depth_array)}
+            for nb_finished, future in enumerate(as_completed(futures)):
+                idx = futures[future]
+                self.gvalues_array[idx] = future.result()
+                ghe_logger.info(f'Finished H: {self.depth_array[idx]} ({nb_finished + 1}/{nb_of_depths})')
+
+    def dump_custom_dataset(self, path: str, name: str, legacy: bool = False) -> None:
         """
         This function dumps the current custom dataset.
+        The dataset is saved in a directory 'name.gvd' with a .npy file for the time values, the depths and
+        the g-values, which can be memory mapped, and a metadata.json file with the version of the format,
+        the options of the g-function calculation and the hash of the borefield geometry.
+        Every file is written to a temporary file first and then moved in place, so an existing dataset that is
+        memory mapped by another object or process is not overwritten while it is read.
 
         Parameters
         ----------
@@ -235,13 +284,36 @@ class CustomGFunction:
             Location where the dataset should be saved
         name : str
             Name under which the dataset should be saved
+        legacy : bool
+            True if the dataset should be pickled to a 'name.gvalues' file, as in previous versions
 
         Returns
         -------
         None
+
+        Raises
+        ------
+        ValueError
+            When an option of the g-function calculation cannot be saved in the metadata
         """
-        with open(path + name + '.gvalues', 'wb') as f:
-            pickle.dump(self, f)
+        if legacy:
+            _write_atomic(os.path.abspath(path + name + '.gvalues'), lambda f: pickle.dump(self, f))
+            return
+
+        metadata = json.dumps({'version': CustomGFunction.FORMAT_VERSION, 'options': self.options,
+                               'geometry_hash': self.geometry_hash}, indent=1, default=_encode_option)
+
+        directory = os.path.abspath(path + name + '.gvd')
+        os.makedirs(directory, exist_ok=True)
+        # the metadata is removed first and written last, so an incomplete dataset cannot be loaded
+        try:
+            os.remove(os.path.join(directory, 'metadata.json'))
+        except FileNotFoundError:
+            pass
+        for file, array in (('time.npy', self.time_array), ('depth.npy', self.depth_array),
+                            ('gvalues.npy', self.gvalues_array)):
+            _write_atomic(os.path.join(directory, file), lambda f: np.save(f, array))
+        _write_atomic(os.path.join(directory, 'metadata.json'), lambda f: f.write(metadata.encode()))
 
     def set_options_gfunction_calculation(self, options: dict) -> None:
         """
@@ -270,10 +342,22 @@ class CustomGFunction:
         """
         self.gvalues_array = np.array([])
 
+    def __getstate__(self) -> dict:
+        # the stored brackets of the interpolator are not part of the dataset
+        state = self.__dict__.copy()
+        state.pop('_interpolator', None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._interpolator = GFunctionInterpolator()
+
     def __eq__(self, other):
         if not isinstance(other, CustomGFunction):
             return False
         for i in iter(self.__dict__):
+            if i == '_interpolator':
+                continue
             if isinstance(getattr(self, i), np.ndarray) or isinstance(getattr(self, i), list):
                 if not np.array_equal(getattr(self, i), getattr(other, i)):
                     return False
@@ -283,9 +367,57 @@ class CustomGFunction:
         return True
 
 
+def _encode_option(value) -> Union[dict, int, float, bool]:
+    """
+    This function converts an option of the g-function calculation that is not supported by json. Numpy arrays are
+    converted to a dictionary with their values and dtype, so they can be restored when the dataset is loaded.
+
+    Parameters
+    ----------
+    value
+        Value of the option
+
+    Returns
+    -------
+    dict, int, float, bool
+        Value that is supported by json
+
+    Raises
+    ------
+    ValueError
+        When the option cannot be saved
+    """
+    if isinstance(value, np.ndarray):
+        return {'__ndarray__': value.tolist(), 'dtype': str(value.dtype)}
+    if isinstance(value, np.generic):
+        return value.item()
+    raise ValueError(f'The option {value!r} of the g-function calculation cannot be saved in the dataset.')
+
+
+def _decode_option(value: dict) -> Union[dict, np.ndarray]:
+    """
+    This function restores the numpy arrays in the options of the g-function calculation.
+
+    Parameters
+    ----------
+    value : dict
+        Dictionary from the metadata
+
+    Returns
+    -------
+    dict, np.ndarray
+        Dictionary or restored numpy array
+    """
+    if '__ndarray__' in value:
+        return np.array(value['__ndarray__'], dtype=value['dtype'])
+    return value
+
+
 def load_custom_gfunction(path: str) -> CustomGFunction:
     """
-    This function loads a custom gfunction dataset.
+    This function loads a custom gfunction dataset. This can either be a directory created with dump_custom_dataset,
+    in which case the arrays are memory mapped and only read when needed, or a pickled .gvalues file from
+    previous versions.
 
     Parameters
     ----------
@@ -296,5 +428,56 @@ def load_custom_gfunction(path: str) -> CustomGFunction:
     -------
     CustomGFunction
         Dataset with the custom gfunction data
+
+    Raises
+    ------
+    ValueError
+        When the dataset is incomplete or has a newer version of the format
+    """
+    if not os.path.isdir(path):
+        # legacy format
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+    try:
+        with open(os.path.join(path, 'metadata.json')) as f:
+            metadata = json.load(f, object_hook=_decode_option)
+    except FileNotFoundError:
+        raise ValueError(f'The dataset {path} has no metadata, so it is incomplete.')
+    if metadata['version'] > CustomGFunction.FORMAT_VERSION:
+        raise ValueError(f'The dataset {path} has version {metadata["version"]}, which is not supported by this '
+                         f'version of GHEtool.')
+
+    # the object is created without the init function, since this would allocate a new array for the g-values
+    custom_gfunction = CustomGFunction.__new__(CustomGFunction)
+    custom_gfunction._time_array = np.load(os.path.join(path, 'time.npy'), mmap_mode='r')
+    custom_gfunction._depth_array = np.load(os.path.join(path, 'depth.npy'), mmap_mode='r')
+    custom_gfunction.gvalues_array = np.load(os.path.join(path, 'gvalues.npy'), mmap_mode='r')
+    custom_gfunction.max_t = custom_gfunction._time_array[-1]
+    custom_gfunction.min_t = custom_gfunction._time_array[0]
+    custom_gfunction.max_H = custom_gfunction._depth_array[-1]
+    custom_gfunction.min_H = custom_gfunction._depth_array[0]
+    custom_gfunction.options = metadata['options']
+    custom_gfunction.geometry_hash = metadata['geometry_hash']
+    custom_gfunction._interpolator = GFunctionInterpolator()
+    return custom_gfunction
+
+
+def convert_custom_gfunction(location: str, path: str, name: str) -> None:
+    """
+    This function converts a pickled .gvalues file from previous versions to the current format.
+
+    Parameters
+    ----------
+    location : str
+        Location of the pickled .gvalues file
+    path : str
+        Location where the converted dataset should be saved
+    name : str
+        Name under which the converted dataset should be saved
+
+    Returns
+    -------
+    None
     """
-    return pickle.load(open(path, 'rb'))
+    load_custom_gfunction(location).dump_custom_dataset(path, name)
@@ -0,0 +1,94 @@
+"""
+This file contains the FFTConvolution class which is used to superimpose the load on the g-function differences.
+"""
+import numpy as np
+
+from scipy import fft
+
+
+class FFTConvolution:
+    """
+    This class calculates the convolution between a load profile and the differences of the g-function values
+    using a Fast Fourier Transform. The padded spectrum of every load profile is stored, so that during a sizing
+    (where only the g-function changes between iterations) the load-side transform is only calculated once.
+    """
+
+    def __init__(self):
+        # stored load profiles and their spectra, with the padded length as key
+        self._loads: dict = {}
+        self._spectra: dict = {}
+
+    @staticmethod
+    def padded_length(length: int) -> int:
+        """
+        This function returns the length to which the load profile should be padded, so that the first 'length'
+        values of the circular convolution are equal to those of the linear convolution.
+
+        Parameters
+        ----------
+        length : int
+            Length of the load profile
+
+        Returns
+        -------
+        int
+            Padded length
+        """
+        return fft.next_fast_len(2 * length - 1, real=True)
+
+    def load_spectrum(self, load: np.ndarray) -> np.ndarray:
+        """
+        This function returns the spectrum of the padded load profile. When the load profile is equal to the one
+        of the previous call, the stored spectrum is returned.
+
+        Parameters
+        ----------
+        load : np.ndarray
+            Load profile
+
+        Returns
+        -------
+        np.ndarray
+            Spectrum of the padded load profile
+        """
+        length = self.padded_length(len(load))
+        if length in self._loads and np.array_equal(self._loads[length], load):
+            return self._spectra[length]
+
+        self._loads[length] = np.array(load, dtype=np.float64)
+        self._spectra[length] = fft.rfft(self._loads[length], length)
+        return self._spectra[length]
+
+    def convolve(self, load: np.ndarray, g_value_differences: np.ndarray) -> np.ndarray:
+        """
+        This function returns the convolution between the load profile and the g-function differences, truncated to
+        the length of the load profile.
+
+        Parameters
+        ----------
+        load : np.ndarray
+            Load profile
+        g_value_differences : np.ndarray
+            Differences of the g-function values, with the same length as the load profile. This can also be a 2D-array
+            with the differences for multiple g-functions on its rows, in which case all the convolutions are
+            calculated at once.
+
+        Returns
+        -------
+        np.ndarray
+            Convolution(s) truncated to the length of the load profile
+        """
+        length = self.padded_length(len(load))
+        spectrum = self.load_spectrum(load) * fft.rfft(g_value_differences, length, axis=-1)
+        return fft.irfft(spectrum, length, axis=-1)[..., :len(load)]
+
+    def clear(self) -> None:
+        """
+        This function removes all the stored load spectra.
+
+        Returns
+        -------
+        None
+        """
+        self._loads = {}
+        self._spectra = {}
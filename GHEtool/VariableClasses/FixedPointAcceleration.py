@@ -0,0 +1,136 @@
+"""
+This file contains the classes which accelerate the convergence of a fixed-point iteration x = F(x).
+They are used for the iteration between the fluid temperatures and the efficiency of a building load.
+"""
+import abc
+from abc import ABC
+
+import numpy as np
+
+
+class _FixedPointAcceleration(ABC):
+    """
+    Base class for the acceleration of a fixed-point iteration. Every iteration, the accelerator gets the current
+    iterate x and its image F(x) and returns the next iterate.
+    """
+
+    @abc.abstractmethod
+    def reset(self) -> None:
+        """
+        This function removes the history of the previous iterations, so a new fixed-point iteration can be started.
+
+        Returns
+        -------
+        None
+        """
+
+    @abc.abstractmethod
+    def __call__(self, x: np.ndarray, fx: np.ndarray) -> np.ndarray:
+        """
+        This function returns the next iterate of the fixed-point iteration.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            Current iterate
+        fx : np.ndarray
+            Image F(x) of the current iterate
+
+        Returns
+        -------
+        np.ndarray
+            Next iterate
+        """
+
+
+class NoAcceleration(_FixedPointAcceleration):
+    """
+    Plain fixed-point iteration, where the next iterate is the image of the current iterate.
+    """
+
+    def reset(self) -> None:
+        return
+
+    def __call__(self, x: np.ndarray, fx: np.ndarray) -> np.ndarray:
+        return fx
+
+
+class AndersonAcceleration(_FixedPointAcceleration):
+    """
+    Anderson mixing (Walker and Ni, 2011) [#WalkerNi]_. The next iterate is the combination of the images of the last
+    iterates, of which the residuals F(x) - x have the smallest least-squares norm.
+
+    References
+    ----------
+    .. [#WalkerNi] Walker, H. F. and Ni, P. (2011) Anderson acceleration for fixed-point iterations. SIAM Journal on Numerical Analysis, 49(4), 1715-1735. https://doi.org/10.1137/10079871X
+    """
+
+    def __init__(self, memory: int = 5):
+        """
+
+        Parameters
+        ----------
+        memory : int
+            Number of previous iterations that are used to calculate the next iterate
+        """
+        self.memory: int = memory
+        self._previous_fx: np.ndarray = None
+        self._previous_residual: np.ndarray = None
+        self._delta_fx: list = []
+        self._delta_residual: list = []
+
+    def reset(self) -> None:
+        self._previous_fx = None
+        self._previous_residual = None
+        self._delta_fx = []
+        self._delta_residual = []
+
+    def __call__(self, x: np.ndarray, fx: np.ndarray) -> np.ndarray:
+        residual = fx - x
+        if self._previous_fx is not None:
+            self._delta_fx.append(fx - self._previous_fx)
+            self._delta_residual.append(residual - self._previous_residual)
+            if len(self._delta_fx) > self.memory:
+                self._delta_fx.pop(0)
+                self._delta_residual.pop(0)
+        self._previous_fx = fx
+        self._previous_residual = residual
+
+        if not self._delta_fx:
+            return fx
+        gamma = np.linalg.lstsq(np.transpose(self._delta_residual), residual, rcond=None)[0]
+        return fx - np.transpose(self._delta_fx) @ gamma
+
+
+class AitkenAcceleration(_FixedPointAcceleration):
+    """
+    Vector version of Aitken's delta-squared method (Irons and Tuck, 1969) [#IronsTuck]_. The next iterate is a
+    relaxation of the current iterate and its image, where the relaxation factor is updated every iteration based on
+    the change in the residual F(x) - x.
+
+    References
+    ----------
+    .. [#IronsTuck] Irons, B. M. and Tuck, R. C. (1969) A version of the Aitken accelerator for computer iteration. International Journal for Numerical Methods in Engineering, 1(3), 275-277. https://doi.org/10.1002/nme.1620010306
+    """
+
+    def __init__(self):
+        self._relaxation: float = 1.
+        self._previous_residual: np.ndarray = None
+
+    def reset(self) -> None:
+        self._relaxation = 1.
+        self._previous_residual = None
+
+    def __call__(self, x: np.ndarray, fx: np.ndarray) -> np.ndarray:
+        residual = fx - x
+        if self._previous_residual is not None:
+            delta_residual = residual - self._previous_residual
+            norm = np.dot(delta_residual, delta_residual)
+            if norm > 0:
+                self._relaxation = -self._relaxation * np.dot(self._previous_residual, delta_residual) / norm
+        self._previous_residual = residual
+        return x + self._relaxation * residual
+
+
+FIXED_POINT_ACCELERATIONS: dict = {'none': NoAcceleration, 'anderson': AndersonAcceleration,
+                                   'aitken': AitkenAcceleration}
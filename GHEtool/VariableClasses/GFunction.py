@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import copy
+import threading
 import warnings
-from typing import List, Tuple, Union
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from typing import Callable, List, Tuple, Union
 
 import numpy as np
 import pygfunction as gt
-from scipy import interpolate
-
-from .CustomGFunction import _time_values
+from .CustomGFunction import _time_values, _calculate_gvalues
+from .GFunctionInterpolator import GFunctionInterpolator
+from .GFunctionStore import GFunctionStore
 
 from GHEtool.VariableClasses.Cylindrical_correction import update_pygfunction
 
@@ -83,11 +87,22 @@ class GFunction:
     Class that contains the functionality to calculate gfunctions and to store
     previously calculated values that can potentially be used for interpolation to save time.
     This is done by storing previously calculated gvalues.
+    Next to the dataset of the current borefield and thermal diffusivity, the datasets of previous borefields and
+    thermal diffusivities are kept in a least-recently-used cache, so they can be used again when switching back.
     """
 
     DEFAULT_TIMESTEPS: np.ndarray = _time_values()
     DEFAULT_NUMBER_OF_TIMESTEPS: int = DEFAULT_TIMESTEPS.size
     DEFAULT_STORE_PREVIOUS_VALUES: bool = True
+    DEFAULT_CACHE_MEMORY_LIMIT: float = 100.  # MB
+    DEFAULT_DIMENSIONLESS_CACHE: bool = False
+    # datasets in the cache with fewer time values (e.g. of an L2 sizing) are only reused for the same time values
+    MIN_NUMBER_OF_TIMESTEPS_INTERPOLATION: int = 24
+    # dimensionless time values at which the g-values are calculated when the cache is dimensionless
+    DIMENSIONLESS_TIME_STEPS_PER_DECADE: int = 15
+    DIMENSIONLESS_TIME_MARGIN: float = 0.5  # decades
+    # parameters of a borehole that are made dimensionless in the key of the cache
+    LENGTH_PARAMETERS: tuple = ('D', 'r_b', 'x', 'y')
 
     def __init__(self):
         self._store_previous_values: bool = GFunction.DEFAULT_STORE_PREVIOUS_VALUES
@@ -98,14 +113,146 @@ class GFunction:
         self.depth_array: np.ndarray = np.array([])
         self.time_array: np.ndarray = np.array([])
         self.previous_gfunctions: np.ndarray = np.array([])
-        self.previous_depth: float = 0.
         self.use_cyl_correction_when_negative: bool = True
 
         self.no_extrapolation: bool = True
         self.threshold_depth_interpolation: float = .25  # %
 
+        # previous depth and fifo_list of the sizing, which are kept per thread, since every thread has its own sizing
+        self._search_state: threading.local = threading.local()
+        self.previous_depth: float = 0.
         self.fifo_list: FIFO = FIFO(8)
 
+        # interpolator in the table of previously calculated gvalues
+        self._interpolator: GFunctionInterpolator = GFunctionInterpolator()
+
+        # datasets of other borefields and thermal diffusivities, with the least recently used one first
+        self._cache: OrderedDict = OrderedDict()
+        self.cache_memory_limit: float = GFunction.DEFAULT_CACHE_MEMORY_LIMIT  # MB
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
+        # True if the cache is indexed in dimensionless coordinates
+        self._dimensionless_cache: bool = GFunction.DEFAULT_DIMENSIONLESS_CACHE
+
+        # optional persistent store on disk, which is shared between processes
+        self.store: GFunctionStore = None
+
+        # background process in which the g-values of the predicted depths are calculated, with for every depth
+        # the future and the borefield, alpha and time values for which it is calculated
+        self._prefetch_executor: ProcessPoolExecutor = None
+        self._prefetched: dict = {}
+
+        # lock around the lookup and the storage of the g-values, so the object can be shared by multiple threads
+        self._lock: threading.RLock = threading.RLock()
+        # g-values that are being calculated by one of the threads, so other threads can wait for them
+        self._in_flight: dict = {}
+
+    def __getstate__(self) -> dict:
+        """
+        This function returns the state of the object when it is pickled. The background process of the prefetch
+        cannot be pickled, so it is left out together with the g-values that are still being calculated. The lock
+        and the g-values that are being calculated by other threads cannot be pickled either, so these are created
+        again when the object is unpickled. Of the previous depth and the fifo_list, only the ones of the current
+        thread are kept.
+
+        Returns
+        -------
+        dict
+            Dictionary with the attributes of the object
+        """
+        state = self.__dict__.copy()
+        state['_prefetch_executor'] = None
+        state['_prefetched'] = {}
+        del state['_lock']
+        del state['_in_flight']
+        del state['_search_state']
+        state['previous_depth'] = self.previous_depth
+        state['fifo_list'] = self.fifo_list
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        This function sets the state of the object when it is unpickled. Attributes that did not exist when the object
+        was pickled, are set to their default value.
+
+        Parameters
+        ----------
+        state : dict
+            Dictionary with the attributes of the pickled object
+
+        Returns
+        -------
+        None
+        """
+        self.__dict__.update(GFunction().__dict__)
+        previous_depth = state.pop('previous_depth', 0.)
+        fifo_list = state.pop('fifo_list', FIFO(8))
+        self.__dict__.update(state)
+        self.previous_depth = previous_depth
+        self.fifo_list = fifo_list
+
+    @property
+    def previous_depth(self) -> float:
+        """
+        This function returns the depth of the previous g-function calculation of the current thread.
+
+        Returns
+        -------
+        float
+            Previous depth [m]
+        """
+        if not hasattr(self._search_state, 'previous_depth'):
+            self._search_state.previous_depth = 0.
+        return self._search_state.previous_depth
+
+    @previous_depth.setter
+    def previous_depth(self, depth: float) -> None:
+        """
+        This function sets the depth of the previous g-function calculation of the current thread.
+
+        Parameters
+        ----------
+        depth : float
+            Previous depth [m]
+
+        Returns
+        -------
+        None
+        """
+        self._search_state.previous_depth = depth
+
+    @property
+    def fifo_list(self) -> FIFO:
+        """
+        This function returns the fifo_list with the previous depths of the current thread, with which the sizing
+        detects that it is stuck in a loop. When multiple threads share this object, the depths of the sizing in
+        one thread do not influence the sizing in another.
+
+        Returns
+        -------
+        FIFO
+            fifo_list of the current thread
+        """
+        if not hasattr(self._search_state, 'fifo_list'):
+            self._search_state.fifo_list = FIFO(8)
+        return self._search_state.fifo_list
+
+    @fifo_list.setter
+    def fifo_list(self, fifo_list: FIFO) -> None:
+        """
+        This function sets the fifo_list of the current thread.
+
+        Parameters
+        ----------
+        fifo_list : FIFO
+            fifo_list with the previous depths
+
+        Returns
+        -------
+        None
+        """
+        self._search_state.fifo_list = fifo_list
+
     @property
     def store_previous_values(self) -> bool:
         """
@@ -135,6 +282,42 @@ class GFunction:
         self._store_previous_values = store
         self._store_previous_values_backup = store
 
+    @property
+    def dimensionless_cache(self) -> bool:
+        """
+        This returns the truth value of the dimensionless_cache attribute.
+
+        Returns
+        -------
+        bool
+            True if the datasets in the cache are reused for other thermal diffusivities and scaled borefields
+        """
+        return self._dimensionless_cache
+
+    @dimensionless_cache.setter
+    def dimensionless_cache(self, dimensionless: bool) -> None:
+        """
+        This function sets the dimensionless_cache attribute. When it is True, the cache is indexed in dimensionless
+        coordinates, so a dataset calculated for a certain thermal diffusivity (or borefield) is reused, by rescaling
+        its time values (and depths), for every other thermal diffusivity (or scaled borefield) with the same
+        dimensionless groups. This is useful when e.g. a large number of ground properties is evaluated.
+        To make this possible, all the g-values are calculated at fixed, logarithmically spaced, dimensionless time
+        values and the requested g-values are interpolated in the logarithm of the time, so the results differ
+        slightly from the ones without this cache.
+        Since the keys of the cache change, the datasets in the cache are removed.
+
+        Parameters
+        ----------
+        dimensionless : bool
+            True if the cache should be indexed in dimensionless coordinates
+
+        Returns
+        -------
+        None
+        """
+        self._dimensionless_cache = dimensionless
+        self._cache.clear()
+
     def calculate(self, time_value: Union[list, float, np.ndarray], borefield: List[gt.boreholes.Borehole],
                   alpha: float, interpolate: bool = None):
         """
@@ -183,60 +366,125 @@ class GFunction:
             gvalues : np.ndarray
                 1D array with all the requested gvalues
             """
-            # check if the value is in the fifo_list
-            # if the value is in self.depth_array, there is no problem, since the interpolation will be exact anyway
-            if self.fifo_list.in_fifo_list(depth) and depth not in self.depth_array:
-                # chances are we are stuck in a loop, so calculate the gfunction and do not iterate
-
-                # calculate the g-values for uniform borehole wall temperature
-                gfunc_calculated = gt.gfunction.gFunction(borefield, alpha, time_values, options=self.options).gFunc
-
-                # store the calculated g-values
-                self.set_new_calculated_data(time_values, depth, gfunc_calculated, borefield, alpha)
-
-                self.fifo_list.add(depth)
-
-                return gfunc_calculated
-
-            # store in fifo_list to make sure we are not stuck in iterations
-            self.fifo_list.add(depth)
-
-            # check if previous depth is close to current one
-            # if so, returns previous gfunction data to speed up sizing convergence
-            if np.abs(self.previous_depth - depth) < 1:
-                depth = self.previous_depth
-            else:
-                self.previous_depth = depth
-            # do interpolation
             interpolate = interpolate if interpolate is not None else self.store_previous_values
-            gfunc_interpolated = self.interpolate_gfunctions(time_values, depth, alpha, borefield) \
-                if interpolate else np.array([])
-
-            # if there are g-values calculated, return them
-            if np.any(gfunc_interpolated):
-                return gfunc_interpolated
+            # g-values of nearby depths that are still being calculated in the background
+            prefetched = {}
+            with self._lock:
+                # check if the value is in the fifo_list
+                # if the value is in self.depth_array, there is no problem, since the interpolation will be exact
+                # anyway
+                if self.fifo_list.in_fifo_list(depth) and depth not in self.depth_array:
+                    # chances are we are stuck in a loop, so calculate the gfunction and do not iterate
+                    self.fifo_list.add(depth)
+                    time_values_calculation = time_values
+                    stuck_in_loop = True
+                else:
+                    # store in fifo_list to make sure we are not stuck in iterations
+                    self.fifo_list.add(depth)
+
+                    # check if previous depth is close to current one
+                    # if so, returns previous gfunction data to speed up sizing convergence
+                    if np.abs(self.previous_depth - depth) < 1:
+                        depth = self.previous_depth
+                    else:
+                        self.previous_depth = depth
+                    # add the g-values that are calculated in the background
+                    if self._prefetched:
+                        self._merge_prefetched(self._take_prefetched())
+
+                    # do interpolation
+                    gfunc_interpolated = self.interpolate_gfunctions(time_values, depth, alpha, borefield) \
+                        if interpolate else np.array([])
+
+                    # if there are g-values calculated, return them
+                    if np.any(gfunc_interpolated):
+                        self.cache_hits += 1
+                        return gfunc_interpolated
+
+                    if interpolate:
+                        prefetched = self._take_prefetched(depth)
+
+                    time_values_calculation = self._calculation_time_values(time_values, borefield, alpha)
+                    stuck_in_loop = False
+
+                # the options are copied, since these can be changed by another thread during the calculation
+                options = dict(self.options)
+
+            # the g-values of the depths that are calculated by other processes are read from the store
+            stored_depths = np.array([])
+            if self.store is not None and interpolate and not stuck_in_loop:
+                stored_depths, stored_gvalues = self.store.load_table(time_values_calculation, borefield, alpha,
+                                                                      options)
+            # wait for the g-values of nearby depths that are still being calculated in the background
+            wait([future for future, *_ in prefetched.values()])
+
+            with self._lock:
+                merged = self._merge_prefetched(prefetched)
+                if stored_depths.size:
+                    for stored_depth, gvalues_depth in zip(stored_depths, stored_gvalues):
+                        if stored_depth not in self.depth_array:
+                            merged = self.set_new_calculated_data(time_values_calculation, stored_depth,
+                                                                  gvalues_depth, borefield, alpha) or merged
+                if merged:
+                    gfunc_interpolated = self.interpolate_gfunctions(time_values, depth, alpha, borefield)
+                    if np.any(gfunc_interpolated):
+                        self.cache_hits += 1
+                        return gfunc_interpolated
+
+                self.cache_misses += 1
+                key = (tuple((borehole.H, borehole.D, borehole.r_b, borehole.x, borehole.y, borehole.tilt,
+                              borehole.orientation) for borehole in borefield), depth, alpha,
+                       time_values_calculation.tobytes(), repr(sorted(options.items())), stuck_in_loop)
+                # the same g-values can already be calculated by another thread
+                future = self._in_flight.get(key)
+                calculating = future is None
+                if calculating:
+                    future = self._in_flight[key] = Future()
+
+            if not calculating:
+                gfunc_calculated = future.result()
+            else:
+                # the g-values are calculated without the lock, so other threads can use the g-function object
+                try:
+                    if stuck_in_loop:
+                        gfunc_calculated = self._load_from_store_or_calculate(
+                            time_values, borefield, alpha, options,
+                            lambda: gt.gfunction.gFunction(borefield, alpha, time_values, options=options).gFunc)
+                    else:
+                        gfunc_calculated = self._load_from_store_or_calculate(
+                            time_values_calculation, borefield, alpha, options,
+                            lambda: calculate_gvalues(time_values_calculation, options))
+                except BaseException as exception:
+                    with self._lock:
+                        del self._in_flight[key]
+                    future.set_exception(exception)
+                    raise
+
+                with self._lock:
+                    del self._in_flight[key]
+                    # store the calculated g-values
+                    self.set_new_calculated_data(time_values_calculation, depth, gfunc_calculated, borefield, alpha)
+                future.set_result(gfunc_calculated)
+
+            if time_values_calculation is not time_values:
+                # return the requested g-values
+                return np.interp(np.log(time_values), np.log(time_values_calculation), gfunc_calculated)
+            return gfunc_calculated
 
+        def calculate_gvalues(time_values: np.ndarray, options: dict) -> np.ndarray:
             # calculate the g-values for uniform borehole wall temperature
-            gfunc_calculated = gt.gfunction.gFunction(borefield, alpha, time_values, options=self.options,
-                                                      method=self.options['method']).gFunc
+            gfunc_calculated = gt.gfunction.gFunction(borefield, alpha, time_values, options=options,
+                                                      method=options['method']).gFunc
             if np.any(gfunc_calculated < 0):
                 warnings.warn('There are negative g-values. This can be caused by a large borehole radius.')
                 if self.use_cyl_correction_when_negative:
                     # there are negative gfunction values
                     warnings.warn('Cylindrical correction is used to correct this large borehole. '
-                                  'You can change this behaviour by setting the use_cyl_correction_when_negative variable '
-                                  'of the Gfunction class to False.')
-
-                    backup = self.options.get('Cylindrical_correction')
-
-                    self.options["cylindrical_correction"] = True
-                    gfunc_calculated = gt.gfunction.gFunction(borefield, alpha, time_values, options=self.options,
-                                                              method=self.options['method']).gFunc
-                    self.options["cylindrical_correction"] = backup
-
-            # store the calculated g-values
-            self.set_new_calculated_data(time_values, depth, gfunc_calculated, borefield, alpha)
-
+                                  'You can change this behaviour by setting the use_cyl_correction_when_negative '
+                                  'variable of the Gfunction class to False.')
+                    gfunc_calculated = gt.gfunction.gFunction(borefield, alpha, time_values,
+                                                              options=dict(options, cylindrical_correction=True),
+                                                              method=options['method']).gFunc
             return gfunc_calculated
 
         # get depth from borefield
@@ -272,6 +520,166 @@ class GFunction:
 
         return gfunc_uniform_T
 
+    def _load_from_store_or_calculate(self, time_values: np.ndarray, borefield: List[gt.boreholes.Borehole],
+                                      alpha: float, options: dict, calculate: Callable[[], np.ndarray]) -> np.ndarray:
+        """
+        This function returns the gvalues from the persistent store. If there is no store or the gvalues are not in
+        it, they are calculated and written to the store.
+
+        Parameters
+        ----------
+        time_values : np.ndarray
+            Array with all the time values [s] for which gvalues should be calculated
+        borefield : list[pygfunction.boreholes.Borehole]
+            Borefield model for which the gvalues should be calculated
+        alpha : float
+            Thermal diffusivity of the ground [m2/s]
+        options : dict
+            Options of the g-function calculation
+        calculate : callable
+            Function that calculates the gvalues
+
+        Returns
+        -------
+        gvalues : np.ndarray
+            1D array with all the requested gvalues
+        """
+        if self.store is None:
+            return calculate()
+
+        gvalues = self.store.load(time_values, borefield, alpha, options)
+        if gvalues is None:
+            gvalues = calculate()
+            self.store.save(time_values, borefield, alpha, options, gvalues)
+        return gvalues
+
+    def prefetch(self, time_value: Union[list, float, np.ndarray], borefield: List[gt.boreholes.Borehole],
+                 alpha: float, depths: Union[list, np.ndarray]) -> None:
+        """
+        This function starts the calculation of the g-values for the given depths in a background process, so that
+        they can be added to the current dataset and used for interpolation later on (e.g. in the next iteration of a
+        sizing). Depths for which this is not useful, because they are already in (or can be interpolated with)
+        the current dataset, are skipped. Only one depth is calculated at the same time.
+
+        Parameters
+        ----------
+        time_value : list, float, np.ndarray
+            Time value(s) [s] for which gvalues will be requested
+        borefield : list[pygfunction.boreholes.Borehole]
+            Borefield model for which the gvalues should be calculated
+        alpha : float
+            Thermal diffusivity of the ground [m2/s]
+        depths : list, np.ndarray
+            Depths [m] for which the g-values should be calculated
+
+        Returns
+        -------
+        None
+        """
+        if not self.store_previous_values or not np.any(self.previous_gfunctions):
+            return
+        if not (self._check_alpha(alpha) and self._check_borefield(borefield)):
+            return
+
+        # the time values are converted in the same way as in the calculate function
+        time_values = np.atleast_1d(np.asarray(time_value, dtype=np.float64))
+        if time_values.size > GFunction.DEFAULT_NUMBER_OF_TIMESTEPS:
+            time_values = _time_values(t_max=time_values[-1])
+        else:
+            time_values = np.unique(time_values)
+        time_values = self._calculation_time_values(time_values, borefield, alpha)
+        # the g-values can only be added to the current dataset if they have the same time values
+        if not np.array_equal(time_values, self.time_array):
+            return
+
+        for depth in depths:
+            if self._prefetched or depth <= 0:
+                return
+            if np.any(np.abs(self.depth_array - depth) < 1) or None not in self._get_nearest_depth_index(depth):
+                continue
+            if self._prefetch_executor is None:
+                self._prefetch_executor = ProcessPoolExecutor(max_workers=1)
+            future = self._prefetch_executor.submit(_calculate_gvalues, copy.deepcopy(borefield), alpha, time_values,
+                                                    dict(self.options), depth)
+            self._prefetched[depth] = (future, copy.deepcopy(borefield), alpha, time_values)
+
+    def _take_prefetched(self, depth: float = None) -> dict:
+        """
+        This function removes the g-values that are calculated in the background from the prefetch, when their
+        calculation is finished or, when a depth is given, when they can be used to interpolate at this depth.
+
+        Parameters
+        ----------
+        depth : float
+            Depth [m] at which the g-values will be interpolated
+
+        Returns
+        -------
+        dict
+            Future, borefield, thermal diffusivity and time values for every removed depth
+        """
+        prefetched = {}
+        for prefetched_depth in list(self._prefetched):
+            future = self._prefetched[prefetched_depth][0]
+            if future.done() or \
+                    (depth is not None and abs(prefetched_depth - depth) < self.threshold_depth_interpolation * depth):
+                prefetched[prefetched_depth] = self._prefetched.pop(prefetched_depth)
+        return prefetched
+
+    def _merge_prefetched(self, prefetched: dict) -> bool:
+        """
+        This function adds the g-values that are calculated in the background to the current dataset, if they are
+        still in line with it. Their calculation should be finished, so the lock is not held while waiting for them.
+
+        Parameters
+        ----------
+        prefetched : dict
+            Future, borefield, thermal diffusivity and time values for every depth, as returned by _take_prefetched
+
+        Returns
+        -------
+        bool
+            True if g-values are added to the current dataset, False otherwise
+        """
+        merged = False
+        for prefetched_depth, (future, borefield, alpha, time_values) in prefetched.items():
+            try:
+                gvalues = future.result()
+            except Exception:
+                # the prefetch is only an optimisation, so the g-values are calculated again when needed
+                continue
+            if np.any(gvalues < 0) or not (self._check_alpha(alpha) and self._check_borefield(borefield)
+                                           and np.array_equal(time_values, self.time_array)):
+                continue
+            if np.any(np.abs(self.depth_array - prefetched_depth) < 1):
+                # this depth is calculated in the meantime
+                continue
+            self.set_new_calculated_data(time_values, prefetched_depth, gvalues, self.borefield, self.alpha)
+            merged = True
+        return merged
+
+    def stop_prefetch(self, shutdown: bool = False) -> None:
+        """
+        This function removes the g-values that are still being calculated in the background. The calculations that
+        have not started yet are cancelled. The background process is kept for the prefetch of the next sizing,
+        since starting it costs more than is gained for small and medium borefields, unless shutdown is True.
+
+        Parameters
+        ----------
+        shutdown : bool
+            True if the background process should be stopped as well
+
+        Returns
+        -------
+        None
+        """
+        for future, *_ in self._prefetched.values():
+            future.cancel()
+        self._prefetched = {}
+        if shutdown and self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+            self._prefetch_executor = None
+
     def interpolate_gfunctions(self, time_value: Union[list, float, np.ndarray], depth: float,
                                alpha: float, borefield: List[gt.boreholes.Borehole]) -> np.ndarray:
         """
@@ -299,7 +707,12 @@ class GFunction:
         # check if interpolation is possible:
         if not (self._check_alpha(alpha) and self._check_borefield(borefield)):
             # the alpha and/or borefield is not in line with the precalculated data
-            return gvalues
+            key = self._cache_key(borefield, alpha)
+            if key not in self._cache and \
+                    not (np.any(self.previous_gfunctions) and key == self._cache_key(self.borefield, self.alpha)):
+                return gvalues
+            # but there is a dataset in the cache
+            self._swap_dataset(borefield, alpha, time_value)
 
         # check if interpolation of all time values can be done based on the available time values
         if not self._check_time_values(time_value):
@@ -314,13 +727,12 @@ class GFunction:
                 return gvalues
 
             # do interpolation
-            if self.depth_array.size == 1:
-                gvalues = interpolate.interpn([self.time_array], self.previous_gfunctions, time_value)
-            else:
-                gvalues = interpolate.interpn((self.depth_array, self.time_array), self.previous_gfunctions,
-                                              np.array([[depth, t] for t in time_value]))
-
-            return gvalues
+            if self.dimensionless_cache:
+                # the time values of the dataset do not coincide with the requested ones, so the interpolation is done
+                # in the logarithm of the time, in which the g-function is almost linear
+                return self._interpolator(self.depth_array, np.log(self.time_array), self.previous_gfunctions, depth,
+                                          np.log(time_value))
+            return self._interpolator(self.depth_array, self.time_array, self.previous_gfunctions, depth, time_value)
 
         # when extrapolation is permitted
         # not yet implemented
@@ -463,15 +875,28 @@ class GFunction:
         # replace options
         self.options = options
 
-    def remove_previous_data(self) -> None:
+    def remove_previous_data(self, store_in_cache: bool = False) -> None:
         """
         This function removes the previous calculated data by setting the depth_array, time_array and
         previous_gfunctions back to empty arrays.
 
+        Parameters
+        ----------
+        store_in_cache : bool
+            True if the previous calculated data should be kept in the cache, so it can be used again later
+            for the same borefield and thermal diffusivity.
+
         Returns
         -------
         None
         """
+        if store_in_cache and np.any(self.previous_gfunctions):
+            key = self._cache_key(self.borefield, self.alpha)
+            self._cache[key] = (self.depth_array, self.time_array, self.previous_gfunctions, self.alpha,
+                                self.borefield[0].r_b)
+            self._cache.move_to_end(key)
+            self._enforce_cache_memory_limit()
+
         self.depth_array = np.array([])
         self.time_array = np.array([])
         self.previous_gfunctions = np.array([])
@@ -551,6 +976,10 @@ class GFunction:
 
             return True
 
+        if self.store_previous_values and not (self._check_alpha(alpha) and self._check_borefield(borefield)):
+            # continue with the dataset of the new borefield and alpha and keep the current one in the cache
+            self._swap_dataset(borefield, alpha, time_values)
+
         # check if the newly calculated data should be saved
         if not check_if_data_should_be_saved():
             return False
@@ -583,6 +1012,164 @@ class GFunction:
 
         return True
 
+    def _cache_key(self, borefield: List[gt.boreholes.Borehole], alpha: float) -> tuple:
+        """
+        This function returns the key of the dataset in the cache for a certain borefield and thermal diffusivity.
+        It is based on all the parameters of the boreholes (neglecting the depth), the thermal diffusivity and the
+        options of the g-function calculation.
+        When the cache is dimensionless, the fact that the g-function only depends on the dimensionless time
+        ln(t/ts) with ts = H²/(9*alpha) and on the ratios B/H, D/H and r_b/H is used. The parameters of the boreholes
+        are then made dimensionless with the borehole radius of the first borehole and the thermal diffusivity is
+        not part of the key.
+
+        Parameters
+        ----------
+        borefield : list[pygfunction.boreholes.Borehole]
+            Borefield model for which the gvalues should be calculated
+        alpha : float
+            Thermal diffusivity of the ground [m2/s]
+
+        Returns
+        -------
+        tuple
+            Key of the dataset
+        """
+        if not self.dimensionless_cache:
+            geometry = tuple(tuple(value for key, value in sorted(borehole.__dict__.items()) if key != "H")
+                             for borehole in borefield)
+            return geometry, alpha, repr(sorted(self.options.items()))
+
+        length = borefield[0].r_b
+        geometry = tuple(tuple(float(f"{value / length:.12g}") if key in GFunction.LENGTH_PARAMETERS else value
+                               for key, value in sorted(borehole.__dict__.items()) if key != "H")
+                         for borehole in borefield)
+        return geometry, repr(sorted(self.options.items()))
+
+    def _swap_dataset(self, borefield: List[gt.boreholes.Borehole], alpha: float,
+                      time_values: np.ndarray = None) -> bool:
+        """
+        This function moves the current dataset to the cache and loads the dataset for the given borefield and
+        thermal diffusivity from the cache, if it exists. When the cached dataset was calculated for another thermal
+        diffusivity or for a scaled borefield, its depths and time values are rescaled so the dimensionless groups
+        are preserved.
+        A cached dataset with fewer than MIN_NUMBER_OF_TIMESTEPS_INTERPOLATION time values, which does not contain
+        all the requested time values (e.g. the dataset of an L2 sizing of another load), is too coarse to interpolate
+        in the time, so it is removed from the cache instead.
+
+        Parameters
+        ----------
+        borefield : list[pygfunction.boreholes.Borehole]
+            Borefield model for which the gvalues should be calculated
+        alpha : float
+            Thermal diffusivity of the ground [m2/s]
+        time_values : np.ndarray
+            Time values [s] for which the gvalues are requested. If None, the dataset is always loaded.
+
+        Returns
+        -------
+        bool
+            True if a dataset is loaded from the cache, False otherwise
+        """
+        self.remove_previous_data(store_in_cache=True)
+
+        key = self._cache_key(borefield, alpha)
+        if key not in self._cache:
+            return False
+
+        depth_array, time_array, self.previous_gfunctions, alpha_cache, length_cache = self._cache.pop(key)
+        length = borefield[0].r_b
+        if alpha_cache != alpha or length_cache != length:
+            # the factors are rounded, so that e.g. doubling alpha does not lead to round-off in the time values
+            depth_array = depth_array * float(f"{length / length_cache:.12g}")
+            time_array = time_array * float(f"{alpha_cache / alpha * (length / length_cache) ** 2:.12g}")
+        if time_values is not None and time_array.size < GFunction.MIN_NUMBER_OF_TIMESTEPS_INTERPOLATION \
+                and not np.all(np.isin(time_values, time_array)):
+            self.previous_gfunctions = np.array([])
+            return False
+        self.depth_array, self.time_array = depth_array, time_array
+        self.borefield = borefield
+        self.alpha = alpha
+        return True
+
+    def _calculation_time_values(self, time_values: np.ndarray, borefield: List[gt.boreholes.Borehole],
+                                 alpha: float) -> np.ndarray:
+        """
+        This function returns the time values for which the g-values should be calculated.
+        Normally, these are the requested time values. When the cache is dimensionless, the g-values are calculated at
+        fixed, logarithmically spaced, dimensionless time values, so that the datasets of all thermal diffusivities
+        share the same dimensionless time values. If the current dataset covers the requested time values, its time
+        values are used, so the newly calculated g-values can be added to it. Otherwise, the dimensionless time values
+        cover the requested ones with a margin, so the dataset can be reused for a range of thermal diffusivities.
+
+        Parameters
+        ----------
+        time_values : np.ndarray
+            Array with all the requested time values [s]
+        borefield : list[pygfunction.boreholes.Borehole]
+            Borefield model for which the gvalues should be calculated
+        alpha : float
+            Thermal diffusivity of the ground [m2/s]
+
+        Returns
+        -------
+        np.ndarray
+            Time values [s] for which the g-values should be calculated
+        """
+        if not self.dimensionless_cache:
+            return time_values
+
+        if np.any(self.previous_gfunctions) and self._check_alpha(alpha) and self._check_borefield(borefield) \
+                and self._check_time_values(time_values):
+            return self.time_array
+
+        # the dimensionless time is alpha * t / r_b ** 2
+        scale = borefield[0].r_b ** 2 / alpha
+        steps = GFunction.DIMENSIONLESS_TIME_STEPS_PER_DECADE
+        margin = GFunction.DIMENSIONLESS_TIME_MARGIN * steps
+        start = np.floor(np.log10(np.min(time_values) / scale) * steps - margin)
+        end = np.ceil(np.log10(np.max(time_values) / scale) * steps + margin)
+        return 10 ** (np.arange(start, end + 1) / steps) * scale
+
+    @property
+    def cache_memory_usage(self) -> float:
+        """
+        This function returns the memory used by the datasets in the cache, including the current one.
+
+        Returns
+        -------
+        float
+            Memory usage [MB]
+        """
+        arrays = [self.depth_array, self.time_array, self.previous_gfunctions]
+        for dataset in self._cache.values():
+            arrays.extend(dataset[:3])
+        return sum(array.nbytes for array in arrays) / 10 ** 6
+
+    def _enforce_cache_memory_limit(self) -> None:
+        """
+        This function removes the least recently used datasets from the cache until the memory limit is met.
+        The current dataset is never removed.
+
+        Returns
+        -------
+        None
+        """
+        while self._cache and self.cache_memory_usage > self.cache_memory_limit:
+            self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """
+        This function removes all the datasets from the cache (but not the current dataset) and resets the
+        hit and miss counters.
+
+        Returns
+        -------
+        None
+        """
+        self._cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
     def _check_borefield(self, borefield: List[gt.boreholes.Borehole]) -> bool:
         """
         This function checks whether the new borefield object is equal to the previous one.
@@ -0,0 +1,174 @@
+"""
+This file contains the GFunctionInterpolator class which is used to interpolate in a table of precalculated g-values.
+"""
+from typing import Tuple, Union
+
+import numpy as np
+
+
+class GFunctionInterpolator:
+    """
+    This class interpolates linearly in a table of g-values with the depths on its rows and the time values on its
+    columns. Since bilinear interpolation is separable, the table is first interpolated along the depth, which results
+    in a single g-function curve, and afterwards this curve is interpolated at all the requested time values at once.
+    The bracketing indices and weights of the last call are stored, so they are not searched again when the same depth
+    or time values are requested (e.g. when only the depth changes during a sizing).
+    """
+
+    def __init__(self):
+        # bracket of the last requested depth
+        self._depth_array: np.ndarray = np.array([])
+        self._depth: float = np.nan
+        self._depth_bracket: Tuple[int, float] = (0, 0.)
+        # brackets of the last requested time values
+        self._time_array: np.ndarray = np.array([])
+        self._time_values: np.ndarray = np.array([])
+        self._time_indices: np.ndarray = np.array([], dtype=int)
+        self._time_weights: np.ndarray = np.array([])
+
+    @staticmethod
+    def _bracket(array: np.ndarray, values: np.ndarray, dimension: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        This function returns, for every value, the index of the lower bracketing value in the array and the
+        weight of the upper bracketing value.
+
+        Parameters
+        ----------
+        array : np.ndarray
+            Sorted array with the grid points
+        values : np.ndarray
+            Values for which the bracket should be searched
+        dimension : int
+            Dimension of the table (0 for the depth, 1 for the time), used in the error message
+
+        Returns
+        -------
+        indices, weights : np.ndarray, np.ndarray
+            Indices of the lower bracketing values and weights of the upper bracketing values
+
+        Raises
+        ------
+        ValueError
+            When one of the values is outside the range of the array
+        """
+        if np.any(values < array[0]) or np.any(values > array[-1]):
+            raise ValueError(f"One of the requested xi is out of bounds in dimension {dimension}")
+        if array.size == 1:
+            return np.zeros(values.shape, dtype=int), np.zeros(values.shape)
+        indices = np.clip(np.searchsorted(array, values, side="right") - 1, 0, array.size - 2)
+        weights = (values - array[indices]) / (array[indices + 1] - array[indices])
+        return indices, weights
+
+    def depth_bracket(self, depth_array: np.ndarray, depth: float) -> Tuple[int, float]:
+        """
+        This function returns the index of the lower bracketing depth and the weight of the upper bracketing depth.
+        When the depth and depth array are equal to those of the previous call, the stored bracket is returned.
+
+        Parameters
+        ----------
+        depth_array : np.ndarray
+            Sorted array with the depths [m] of the table
+        depth : float
+            Requested depth [m]
+
+        Returns
+        -------
+        index, weight : int, float
+            Index of the lower bracketing depth and weight of the upper bracketing depth
+        """
+        if depth == self._depth and np.array_equal(depth_array, self._depth_array):
+            return self._depth_bracket
+
+        indices, weights = self._bracket(np.asarray(depth_array), np.array([depth]), 0)
+        self._depth_array = np.array(depth_array)
+        self._depth = depth
+        self._depth_bracket = (int(indices[0]), float(weights[0]))
+        return self._depth_bracket
+
+    def time_bracket(self, time_array: np.ndarray, time_values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        This function returns the indices of the lower bracketing time values and the weights of the upper
+        bracketing time values. When the time values and time array are equal to those of the previous call,
+        the stored brackets are returned.
+
+        Parameters
+        ----------
+        time_array : np.ndarray
+            Sorted array with the time values [s] of the table
+        time_values : np.ndarray
+            Requested time values [s]
+
+        Returns
+        -------
+        indices, weights : np.ndarray, np.ndarray
+            Indices of the lower bracketing time values and weights of the upper bracketing time values
+        """
+        if np.array_equal(time_values, self._time_values) and np.array_equal(time_array, self._time_array):
+            return self._time_indices, self._time_weights
+
+        self._time_indices, self._time_weights = self._bracket(np.asarray(time_array), time_values, 1)
+        self._time_array = np.array(time_array)
+        self._time_values = np.array(time_values)
+        return self._time_indices, self._time_weights
+
+    def depth_curve(self, depth_array: np.ndarray, gvalues_array: np.ndarray, depth: float) -> np.ndarray:
+        """
+        This function interpolates the table along the depth, which results in the g-function curve at the
+        requested depth.
+
+        Parameters
+        ----------
+        depth_array : np.ndarray
+            Sorted array with the depths [m] of the table
+        gvalues_array : np.ndarray
+            Table with the g-values, with a row for every depth. This can be a 1D-array if there is only one depth.
+        depth : float
+            Requested depth [m]
+
+        Returns
+        -------
+        np.ndarray
+            g-values at the requested depth for every time value of the table
+        """
+        if gvalues_array.ndim == 1:
+            # there is only one depth in the table
+            return np.asarray(gvalues_array)
+        index, weight = self.depth_bracket(depth_array, depth)
+        if weight == 0.:
+            return np.asarray(gvalues_array[index])
+        return (1 - weight) * gvalues_array[index] + weight * gvalues_array[index + 1]
+
+    def __call__(self, depth_array: np.ndarray, time_array: np.ndarray, gvalues_array: np.ndarray, depth: float,
+                 time_values: Union[list, float, np.ndarray]) -> np.ndarray:
+        """
+        This function returns the g-values at the requested depth and time values. The result is equal to a linear
+        interpolation in both the depth and the time.
+
+        Parameters
+        ----------
+        depth_array : np.ndarray
+            Sorted array with the depths [m] of the table
+        time_array : np.ndarray
+            Sorted array with the time values [s] of the table
+        gvalues_array : np.ndarray
+            Table with the g-values, with a row for every depth. This can be a 1D-array if there is only one depth.
+        depth : float
+            Requested depth [m]
+        time_values : list, float, np.ndarray
+            Requested time value(s) [s]
+
+        Returns
+        -------
+        np.ndarray
+            1D array with the requested g-values
+
+        Raises
+        ------
+        ValueError
+            When the depth or one of the time values is outside the range of the table
+        """
+        curve = self.depth_curve(depth_array, gvalues_array, depth)
+        indices, weights = self.time_bracket(time_array, np.atleast_1d(np.asarray(time_values, dtype=np.float64)))
+        if curve.size == 1:
+            return np.full(indices.shape, curve[0], dtype=np.float64)
+        return (1 - weights) * curve[indices] + weights * curve[indices + 1]
@@ -0,0 +1,315 @@
+"""
+This file contains the GFunctionStore class, which stores calculated g-functions on disk so they can be reused
+by other processes.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from typing import Callable, List, Tuple, Union
+
+import numpy as np
+import pygfunction as gt
+
+
+def _write_atomic(path: str, write: Callable) -> None:
+    """
+    This function writes a file by writing to a temporary file in the same directory first and moving it
+    afterwards, so other processes never see a partially written file.
+
+    Parameters
+    ----------
+    path : str
+        Location of the file
+    write : callable
+        Function that writes the content to the given file object
+
+    Returns
+    -------
+    None
+    """
+    file, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(file, "wb") as f:
+            write(f)
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+
+class GFunctionStore:
+    """
+    This class contains a persistent store of calculated g-function values in a directory.
+    For every combination of borefield geometry (neglecting the depth), thermal diffusivity and options of the
+    g-function calculation, there is a subdirectory with a metadata.json file. In this subdirectory, there is a table
+    with the g-values of all the calculated depths for every time array: a directory with an .npy file per depth,
+    which is read with memory mapping. In this way, a process can interpolate between the depths that were calculated
+    by other processes.
+    All files are written to a temporary file first and then moved in place, so that multiple processes can read
+    from and write to the same store at the same time without ever reading a partially written file.
+    """
+
+    SIGNIFICANT_DIGITS: int = 12
+
+    def __init__(self, directory: Union[str, os.PathLike]):
+        """
+
+        Parameters
+        ----------
+        directory : str, os.PathLike
+            Directory of the store. It is created if it does not exist.
+        """
+        self.directory: str = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def _canonicalise(value):
+        """
+        This function rounds all the floats in a (nested) value, so that values that only differ due to round-off
+        lead to the same key.
+
+        Parameters
+        ----------
+        value
+            Float, list, tuple, dict or any other value
+
+        Returns
+        -------
+        Canonicalised value
+        """
+        if isinstance(value, (float, np.floating)):
+            return float(f"{value:.{GFunctionStore.SIGNIFICANT_DIGITS}g}")
+        if isinstance(value, (int, np.integer)) and not isinstance(value, bool):
+            return int(value)
+        if isinstance(value, dict):
+            return {str(key): GFunctionStore._canonicalise(value[key]) for key in sorted(value, key=str)}
+        if isinstance(value, (list, tuple, np.ndarray)):
+            return [GFunctionStore._canonicalise(item) for item in value]
+        if value is None or isinstance(value, (bool, str)):
+            return value
+        return repr(value)
+
+    @staticmethod
+    def _hash(value) -> str:
+        """
+        This function returns a hash of a canonicalised value.
+
+        Parameters
+        ----------
+        value
+            Canonicalised value
+
+        Returns
+        -------
+        str
+            Hash
+        """
+        return hashlib.sha256(json.dumps(value, sort_keys=True).encode()).hexdigest()
+
+    @staticmethod
+    def geometry_hash(borefield: List[gt.boreholes.Borehole]) -> str:
+        """
+        This function returns a hash of the geometry of the borefield, neglecting the depth of the boreholes.
+
+        Parameters
+        ----------
+        borefield : list[pygfunction.boreholes.Borehole]
+            Borefield model
+
+        Returns
+        -------
+        str
+            Hash of the geometry
+        """
+        return GFunctionStore._hash(GFunctionStore._canonicalise(GFunctionStore._geometry(borefield)))
+
+    @staticmethod
+    def _geometry(borefield: List[gt.boreholes.Borehole]) -> list:
+        """
+        This function returns the parameters of all the boreholes, neglecting their depth.
+
+        Parameters
+        ----------
+        borefield : list[pygfunction.boreholes.Borehole]
+            Borefield model
+
+        Returns
+        -------
+        list
+            List with a dictionary with the parameters of every borehole
+        """
+        return [{key: value for key, value in borehole.__dict__.items() if key != "H"} for borehole in borefield]
+
+    def _metadata(self, borefield: List[gt.boreholes.Borehole], alpha: float, options: dict) -> dict:
+        """
+        This function returns the metadata that identifies a dataset in the store.
+
+        Parameters
+        ----------
+        borefield : list[pygfunction.boreholes.Borehole]
+            Borefield model for which the gvalues are calculated
+        alpha : float
+            Thermal diffusivity of the ground [m2/s]
+        options : dict
+            Options of the g-function calculation
+
+        Returns
+        -------
+        dict
+            Metadata with the geometry, the depths of the boreholes relative to the first one, thermal diffusivity and
+            options
+        """
+        return self._canonicalise({"geometry": self._geometry(borefield),
+                                   "relative_depths": [borehole.H / borefield[0].H for borehole in borefield],
+                                   "alpha": alpha, "options": options})
+
+    def _table_directory(self, time_values: np.ndarray, borefield: List[gt.boreholes.Borehole], alpha: float,
+                         options: dict) -> (str, str, dict):
+        """
+        This function returns the directory of the dataset, the directory of the table with the g-values for the
+        given time values and the metadata.
+
+        Parameters
+        ----------
+        time_values : np.ndarray
+            Array with all the time values [s] for which the gvalues are calculated
+        borefield : list[pygfunction.boreholes.Borehole]
+            Borefield model for which the gvalues are calculated
+        alpha : float
+            Thermal diffusivity of the ground [m2/s]
+        options : dict
+            Options of the g-function calculation
+
+        Returns
+        -------
+        str, str, dict
+            Directory of the dataset, directory of the table and metadata of the dataset
+        """
+        metadata = self._metadata(borefield, alpha, options)
+        directory = os.path.join(self.directory, self._hash(metadata))
+        table = self._hash(self._canonicalise(np.asarray(time_values, dtype=np.float64)))
+        return directory, os.path.join(directory, table), metadata
+
+    @staticmethod
+    def _depth_file(depth: float) -> str:
+        """
+        This function returns the name of the file with the g-values of a certain depth.
+
+        Parameters
+        ----------
+        depth : float
+            Depth of the borefield [m]
+
+        Returns
+        -------
+        str
+            Name of the file
+        """
+        return f"{GFunctionStore._canonicalise(float(depth))!r}.npy"
+
+    def load(self, time_values: np.ndarray, borefield: List[gt.boreholes.Borehole], alpha: float,
+             options: dict) -> Union[np.ndarray, None]:
+        """
+        This function returns the stored g-values for the depth of the borefield, if they exist.
+
+        Parameters
+        ----------
+        time_values : np.ndarray
+            Array with all the time values [s] for which the gvalues should be calculated
+        borefield : list[pygfunction.boreholes.Borehole]
+            Borefield model for which the gvalues should be calculated
+        alpha : float
+            Thermal diffusivity of the ground [m2/s]
+        options : dict
+            Options of the g-function calculation
+
+        Returns
+        -------
+        np.ndarray or None
+            Memory-mapped array with the g-values or None if they are not in the store
+        """
+        _, table, _ = self._table_directory(time_values, borefield, alpha, options)
+        try:
+            return np.load(os.path.join(table, self._depth_file(borefield[0].H)), mmap_mode="r")
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def load_table(self, time_values: np.ndarray, borefield: List[gt.boreholes.Borehole], alpha: float,
+                   options: dict) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        This function returns the g-values of all the stored depths of the borefield for the given time values.
+
+        Parameters
+        ----------
+        time_values : np.ndarray
+            Array with all the time values [s] for which the gvalues should be calculated
+        borefield : list[pygfunction.boreholes.Borehole]
+            Borefield model for which the gvalues should be calculated (its depth does not matter)
+        alpha : float
+            Thermal diffusivity of the ground [m2/s]
+        options : dict
+            Options of the g-function calculation
+
+        Returns
+        -------
+        np.ndarray, np.ndarray
+            Sorted array with the stored depths [m] and 2D-array with the g-values for every depth
+        """
+        _, table, _ = self._table_directory(time_values, borefield, alpha, options)
+        try:
+            files = [file for file in os.listdir(table) if file.endswith(".npy")]
+        except FileNotFoundError:
+            files = []
+        depths, gvalues = [], []
+        for file in sorted(files, key=lambda file: float(file[:-4])):
+            try:
+                gvalues.append(np.load(os.path.join(table, file), mmap_mode="r"))
+            except (FileNotFoundError, ValueError):
+                continue
+            depths.append(float(file[:-4]))
+        if not depths:
+            return np.array([]), np.empty((0, len(time_values)))
+        return np.array(depths), np.array(gvalues)
+
+    def save(self, time_values: np.ndarray, borefield: List[gt.boreholes.Borehole], alpha: float, options: dict,
+             gvalues: np.ndarray) -> None:
+        """
+        This function saves the g-values for the depth of the borefield in the store. When the g-values are already
+        in the store, they are not written again.
+
+        Parameters
+        ----------
+        time_values : np.ndarray
+            Array with all the time values [s] for which the gvalues are calculated
+        borefield : list[pygfunction.boreholes.Borehole]
+            Borefield model for which the gvalues are calculated
+        alpha : float
+            Thermal diffusivity of the ground [m2/s]
+        options : dict
+            Options of the g-function calculation
+        gvalues : np.ndarray
+            Calculated g-values
+
+        Returns
+        -------
+        None
+        """
+        directory, table, metadata = self._table_directory(time_values, borefield, alpha, options)
+        path = os.path.join(table, self._depth_file(borefield[0].H))
+        if os.path.exists(path):
+            return
+        os.makedirs(table, exist_ok=True)
+        try:
+            metadata_path = os.path.join(directory, "metadata.json")
+            if not os.path.exists(metadata_path):
+                _write_atomic(metadata_path, lambda f: f.write(json.dumps(metadata, indent=1).encode()))
+            _write_atomic(path, lambda f: np.save(f, np.asarray(gvalues, dtype=np.float64)))
+        except OSError:
+            # on Windows, a file cannot be replaced while another process has it memory-mapped, but then it has
+            # been written by another process already
+            return
+
+    def __len__(self) -> int:
+        return sum(len([file for file in files if file.endswith(".npy")]) for _, _, files in os.walk(self.directory))
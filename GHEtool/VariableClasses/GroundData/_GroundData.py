@@ -1,5 +1,6 @@
 import abc
 import warnings
+from bisect import bisect_right
 
 import numpy as np
 from abc import ABC
@@ -74,7 +75,8 @@ class _GroundData(BaseClass, ABC):
     Contains information regarding the ground data of the borefield.
     """
 
-    __slots__ = 'layers', 'layer_depths', 'variable_Tg', 'Tg', 'last_layer_infinite'
+    __slots__ = 'layers', 'layer_depths', 'variable_Tg', 'Tg', 'last_layer_infinite', '_layer_table'
+    __allow_none__ = ['_layer_table']
 
     def __init__(self, k_s: float = None,
                  volumetric_heat_capacity: float = 2.4 * 10 ** 6):
@@ -93,6 +95,8 @@ class _GroundData(BaseClass, ABC):
         self.variable_Tg: bool = False
         self.Tg: float = 10
         self.last_layer_infinite: bool = True  # assumes that the last ground layer is infinite
+        # cached arrays with the layer properties, see _layer_properties
+        self._layer_table: dict = None
 
         if k_s is not None:
             self.add_layer_on_bottom(GroundLayer(k_s, volumetric_heat_capacity, thickness=None))
@@ -126,6 +130,7 @@ class _GroundData(BaseClass, ABC):
                 raise ValueError('You cannot add a layer on top of another layer if you have an undetermined depth.')
 
         self.layers.insert(0, layer)
+        self._layer_table = None
         self.layer_depths = [0]
         for idx, layer in enumerate(self.layers):
             if layer.thickness is None:
@@ -161,9 +166,50 @@ class _GroundData(BaseClass, ABC):
                 raise ValueError('You cannot add a layer on bottom of a layer which has un undetermined depth.')
 
         self.layers.append(layer)
+        self._layer_table = None
         self.layer_depths.append(0 if len(self.layers) == 1 else self.layers[-2].thickness + self.layer_depths[-1])
 
-    def check_depth(self, H: float) -> bool:
+    def _layer_properties(self) -> dict:
+        """
+        This function returns the arrays with the depth of the top of every layer, the integral of the conductivity
+        and volumetric heat capacity from the surface until the top of every layer and the properties of every layer.
+        These are calculated again only when the layers have changed, which is checked with the values of the layers,
+        so the layers can also be edited in place.
+
+        Returns
+        -------
+        dict
+            Dictionary with the layer tables
+
+        Raises
+        ------
+        ValueError
+            When there are no ground layers
+        """
+        key = [self.layer_depths, [(layer.k_s, layer.volumetric_heat_capacity, layer.thickness)
+                                   for layer in self.layers]]
+        if self._layer_table is not None and self._layer_table['key'] == key:
+            return self._layer_table
+        # copy the depths, so changes to the list itself are noticed as well
+        key[0] = list(self.layer_depths)
+        if not np.any(self.layers):
+            raise ValueError('There is no ground data available.')
+
+        tops = np.array(self.layer_depths, dtype=np.float64)
+        thickness = np.diff(tops)
+        table = {'key': key, 'tops': tops,
+                 'highest_depth': np.inf if self.layers[-1].thickness is None else tops[-1] + self.layers[-1].thickness}
+        for name in ('k_s', 'volumetric_heat_capacity'):
+            values = np.array([getattr(layer, name) for layer in self.layers], dtype=np.float64)
+            table[name] = values
+            table[name + '_integral'] = np.concatenate(([0.], np.cumsum(values[:-1] * thickness)))
+        # lists for a single depth, since indexing numpy arrays is slow for scalars
+        table['lists'] = {key: table[key].tolist() for key in ('tops', 'k_s', 'volumetric_heat_capacity',
+                                                               'k_s_integral', 'volumetric_heat_capacity_integral')}
+        self._layer_table = table
+        return table
+
+    def check_depth(self, H: Union[float, np.ndarray]) -> bool:
         """
         Checks if the depth is correct.
         A depth is False when it is lower than 0 or it exceeds the deepest ground layer and
@@ -171,8 +217,8 @@ class _GroundData(BaseClass, ABC):
 
         Parameters
         ----------
-        H : float
-            Depth [m]
+        H : float or np.ndarray
+            Depth(s) [m]
 
         Returns
         -------
@@ -184,14 +230,9 @@ class _GroundData(BaseClass, ABC):
         ValueError
             When a depth is requested that is either smaller than zero or larger than the maximum depth.
         """
-        if not np.any(self.layers):
-            raise ValueError('There is no ground data available.')
-
-        if self.layers[-1].thickness is None:
-            # last layer is unbounded
-            return True
-
-        highest_depth = self.layer_depths[-1] + self.layers[-1].thickness
+        highest_depth = self._layer_properties()['highest_depth']
+        # the deepest depth is checked, so this also works for arrays
+        H = H if np.isscalar(H) else np.max(H)
         if H <= highest_depth:
             return True
 
@@ -238,63 +279,96 @@ class _GroundData(BaseClass, ABC):
                 H - cumulative_thickness_list[idx_of_layer_in_which_H_falls]) / H
         return result
 
-    def k_s(self, H: float = 100) -> float:
+    def _layer_average(self, name: str, H: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        This function calculates the average value of a layer property over the depth H, weighted with the
+        thickness of the ground layers. The layer in which H falls is found with a binary search in the cached
+        layer tables, so an array of depths is handled at once.
+
+        Parameters
+        ----------
+        name : str
+            Name of the layer property ('k_s' or 'volumetric_heat_capacity')
+        H : float or np.ndarray
+            Depth(s) [m]
+
+        Returns
+        -------
+        float or np.ndarray
+            Calculated value(s) for either k_s or volumetric heat capacity
+        """
+        table = self._layer_properties()
+        if np.isscalar(H):
+            lists = table['lists']
+            values = lists[name]
+            if len(values) == 1 or H <= 0:
+                # for one (infinite) layer or negative values, the first value is returned
+                return values[0]
+            idx = max(bisect_right(lists['tops'], H) - 1, 0)
+            return (lists[name + '_integral'][idx] + values[idx] * (H - lists['tops'][idx])) / H
+
+        values = table[name]
+        if values.size == 1:
+            return np.full(np.shape(H), values[0])
+        depth = np.asarray(H, dtype=np.float64)
+        idx = np.maximum(np.searchsorted(table['tops'], depth, side='right') - 1, 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = (table[name + '_integral'][idx] + values[idx] * (depth - table['tops'][idx])) / depth
+        # for negative values, the first value is returned
+        result = np.where(depth <= 0, values[0], result)
+        return result
+
+    def k_s(self, H: Union[float, np.ndarray] = 100) -> Union[float, np.ndarray]:
         """
         Returns the ground thermal conductivity in W/mK for a given depth.
 
         Parameters
         ----------
-        H : float
-            Depth in meters.
+        H : float or np.ndarray
+            Depth(s) in meters.
 
         Returns
         -------
-        float
-            Ground thermal conductivity in W/mK for a given depth.
+        float or np.ndarray
+            Ground thermal conductivity in W/mK for the given depth(s).
         """
         self.check_depth(H)
-        if len(self.layers) == 1 and (self.layers[0].thickness is None or self.last_layer_infinite):
-            return self.layers[0].k_s
-        return self.calculate_value([0] + [layer.thickness for layer in self.layers], self.layer_depths,
-                                    [layer.k_s for layer in self.layers], H)
+        return self._layer_average('k_s', H)
 
-    def volumetric_heat_capacity(self, H: float = 100) -> float:
+    def volumetric_heat_capacity(self, H: Union[float, np.ndarray] = 100) -> Union[float, np.ndarray]:
         """
         Returns the ground volumetric heat capacity in J/m³K for a given depth.
 
         Parameters
         ----------
-        H : float
-            Depth in meters.
+        H : float or np.ndarray
+            Depth(s) in meters.
 
         Returns
         -------
-        float
-            Ground volumetric heat capacity in J/m³K for a given depth.
+        float or np.ndarray
+            Ground volumetric heat capacity in J/m³K for the given depth(s).
         """
         self.check_depth(H)
-        if len(self.layers) == 1 and (self.layers[0].thickness is None or self.last_layer_infinite):
-            return self.layers[0].volumetric_heat_capacity
-        return self.calculate_value([0] + [layer.thickness for layer in self.layers], self.layer_depths,
-                                    [layer.volumetric_heat_capacity for layer in self.layers], H)
+        return self._layer_average('volumetric_heat_capacity', H)
 
-    def alpha(self, H: float = 100) -> float:
+    def alpha(self, H: Union[float, np.ndarray] = 100) -> Union[float, np.ndarray]:
         """
         Returns the ground thermal diffusivity in m²/s for a given depth.
         If no volumetric heat capacity or conductivity is given, None is returned.
 
         Parameters
         ----------
-        H : float
-            Depth in meters.
+        H : float or np.ndarray
+            Depth(s) in meters.
 
         Returns
         -------
-        float
-            Ground thermal diffusivity in m²/s for a given depth.
+        float or np.ndarray
+            Ground thermal diffusivity in m²/s for the given depth(s).
         """
 
-        if not np.any(self.layers):
+        if not self.layers:
             return None
         else:
             return self.k_s(H) / self.volumetric_heat_capacity(H)  # m2/s
@@ -347,10 +421,31 @@ class _GroundData(BaseClass, ABC):
         """
         return self.calculate_delta_H(max_temp - self.Tg)
 
+    def __setstate__(self, state: tuple) -> None:
+        """
+        This function restores a (pickled or copied) ground data object. The layer tables are not restored, but
+        calculated again, since objects that were pickled with an older version of GHEtool do not have them.
+
+        Parameters
+        ----------
+        state : tuple
+            Tuple with the dictionary and the slots of the pickled object
+
+        Returns
+        -------
+        None
+        """
+        slots = state[1] if isinstance(state, tuple) else state
+        for var, value in slots.items():
+            setattr(self, var, value)
+        self._layer_table = None
+
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
             return False
         for i in self.__slots__:
+            if i == '_layer_table':
+                continue
             if getattr(self, i) != getattr(other, i):
                 return False
         return True
@@ -2,7 +2,7 @@ import abc
 
 import numpy as np
 
-from ._LoadData import _LoadData
+from ._LoadData import _LoadData, _cached_property
 from abc import ABC
 from typing import Tuple
 
@@ -34,7 +34,7 @@ class _HourlyData(_LoadData, ABC):
             Hourly injection values [kWh/h] for the whole simulation period
         """
 
-    @property
+    @_cached_property
     def hourly_injection_load(self) -> np.ndarray:
         """
         This function returns the hourly injection load in kWh/h.
@@ -46,7 +46,7 @@ class _HourlyData(_LoadData, ABC):
         """
         return np.mean(self.hourly_injection_load_simulation_period.reshape((self.simulation_period, 8760)), axis=0)
 
-    @property
+    @_cached_property
     def hourly_extraction_load(self) -> np.ndarray:
         """
         This function returns the hourly extraction load in kWh/h.
@@ -58,7 +58,7 @@ class _HourlyData(_LoadData, ABC):
         """
         return np.mean(self.hourly_extraction_load_simulation_period.reshape((self.simulation_period, 8760)), axis=0)
 
-    @property
+    @_cached_property
     def hourly_net_resulting_injection_power(self) -> np.ndarray:
         """
         This function calculates the net resulting hourly load in kW for the whole simulation period.
@@ -70,7 +70,7 @@ class _HourlyData(_LoadData, ABC):
         """
         return self.hourly_injection_load_simulation_period - self.hourly_extraction_load_simulation_period
 
-    @property
+    @_cached_property
     def monthly_baseload_injection_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly injection baseload in kWh/month for the whole simulation period.
@@ -82,7 +82,7 @@ class _HourlyData(_LoadData, ABC):
         """
         return self.resample_to_monthly(self.hourly_injection_load_simulation_period)[1]
 
-    @property
+    @_cached_property
     def monthly_baseload_extraction_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly extraction baseload in kWh/month for the whole simulation period.
@@ -94,7 +94,7 @@ class _HourlyData(_LoadData, ABC):
         """
         return self.resample_to_monthly(self.hourly_extraction_load_simulation_period)[1]
 
-    @property
+    @_cached_property
     def monthly_peak_injection_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly injection peak in kW/month for the whole simulation period.
@@ -106,7 +106,7 @@ class _HourlyData(_LoadData, ABC):
         """
         return self.resample_to_monthly(self.hourly_injection_load_simulation_period)[0]
 
-    @property
+    @_cached_property
     def monthly_peak_extraction_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly extraction peak in kW/month for the whole simulation period.
@@ -118,7 +118,7 @@ class _HourlyData(_LoadData, ABC):
         """
         return self.resample_to_monthly(self.hourly_extraction_load_simulation_period)[0]
 
-    @property
+    @_cached_property
     def imbalance(self) -> float:
         """
         This function calculates the average yearly ground imbalance.
@@ -131,7 +131,7 @@ class _HourlyData(_LoadData, ABC):
         return np.sum(
             self.hourly_injection_load_simulation_period - self.hourly_extraction_load_simulation_period) / self.simulation_period
 
-    @property
+    @_cached_property
     def max_peak_injection(self) -> float:
         """
         This returns the max peak injection in kW.
@@ -142,7 +142,7 @@ class _HourlyData(_LoadData, ABC):
         """
         return np.max(self.hourly_injection_load_simulation_period)
 
-    @property
+    @_cached_property
     def max_peak_extraction(self) -> float:
         """
         This returns the max peak extraction in kW.
@@ -153,9 +153,32 @@ class _HourlyData(_LoadData, ABC):
         """
         return np.max(self.hourly_extraction_load_simulation_period)
 
+    def _month_boundaries(self, number_of_hours: int) -> np.ndarray:
+        """
+        This function returns the index of the first hour of every month in an hourly load with the given length.
+        The indices are memoised until one of the attributes of the load object is changed.
+
+        Parameters
+        ----------
+        number_of_hours : int
+            Length of the hourly load
+
+        Returns
+        -------
+        np.ndarray
+            Indices of the first hour of every month
+        """
+        cache = self.__dict__.setdefault('_cache', {})
+        key = ('_month_boundaries', number_of_hours)
+        if key not in cache:
+            upm = np.tile(self.UPM, int(number_of_hours / 8760)).astype(int)
+            cache[key] = np.concatenate(([0], np.cumsum(upm)[:-1]))
+        return cache[key]
+
     def resample_to_monthly(self, hourly_load: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
         This function resamples an hourly_load to monthly peaks (kW/month) and baseloads (kWh/month).
+        A 2D-array with an hourly load on every row can be given as well, in which case every row is resampled.
 
         Parameters
         ----------
@@ -166,13 +189,9 @@ class _HourlyData(_LoadData, ABC):
         -------
         peak loads [kW], monthly average loads [kWh/month] : np.ndarray, np.ndarray
         """
-
-        data = np.array_split(hourly_load, np.cumsum(np.tile(self.UPM, int(len(hourly_load) / 8760)))[:-1])
-
-        if self.all_months_equal:
-            return np.max(data, axis=1), np.sum(data, axis=1)
-
-        return np.array([np.max(i) for i in data]), np.array([np.sum(i) for i in data])
+        hourly_load = np.asarray(hourly_load)
+        boundaries = self._month_boundaries(hourly_load.shape[-1])
+        return np.maximum.reduceat(hourly_load, boundaries, axis=-1), np.add.reduceat(hourly_load, boundaries, axis=-1)
 
     @property
     def simulation_period(self) -> int:
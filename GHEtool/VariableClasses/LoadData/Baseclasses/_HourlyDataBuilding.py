@@ -6,6 +6,7 @@ import pandas as pd
 
 from ._HourlyData import _HourlyData
 from ._LoadDataBuilding import _LoadDataBuilding
+from ._LoadData import _cached_property
 from abc import ABC
 from typing import Union
 from GHEtool.logger import ghe_logger
@@ -208,7 +209,7 @@ class _HourlyDataBuilding(_LoadDataBuilding, _HourlyData, ABC):
 
         return self.eer.get_EER(temperature, power=np.nan_to_num(power), month_indices=self.month_indices)
 
-    @property
+    @_cached_property
     def hourly_injection_load_simulation_period(self) -> np.ndarray:
         """
         This function returns the hourly injection load in kWh/h for the whole simulation period.
@@ -223,7 +224,7 @@ class _HourlyDataBuilding(_LoadDataBuilding, _HourlyData, ABC):
             self.hourly_cooling_load_simulation_period,
             self.conversion_factor_secondary_to_primary_cooling(self._get_hourly_eer(part_load)))
 
-    @property
+    @_cached_property
     def hourly_extraction_load_simulation_period(self) -> np.ndarray:
         """
         This function returns the hourly extraction load in kWh/h for the whole simulation period.
@@ -237,7 +238,7 @@ class _HourlyDataBuilding(_LoadDataBuilding, _HourlyData, ABC):
             return self._hourly_extraction_load_heating_simulation_period
         return self._hourly_extraction_load_heating_simulation_period + self._hourly_extraction_load_dhw_simulation_period
 
-    @property
+    @_cached_property
     def _hourly_extraction_load_heating_simulation_period(self) -> np.ndarray:
         """
         This function returns the hourly extraction load for space heating in kWh/h for the whole simulation period.
@@ -252,7 +253,7 @@ class _HourlyDataBuilding(_LoadDataBuilding, _HourlyData, ABC):
             self.hourly_heating_load_simulation_period,
             self.conversion_factor_secondary_to_primary_heating(self._get_hourly_cop(part_load)))
 
-    @property
+    @_cached_property
     def _hourly_extraction_load_dhw_simulation_period(self) -> np.ndarray:
         """
         This function returns the hourly extraction load for DHW in kWh/h for the whole simulation period.
@@ -267,7 +268,7 @@ class _HourlyDataBuilding(_LoadDataBuilding, _HourlyData, ABC):
             self.hourly_dhw_load_simulation_period,
             self.conversion_factor_secondary_to_primary_heating(self._get_hourly_cop_dhw(part_load_dhw)))
 
-    @property
+    @_cached_property
     def monthly_baseload_heating_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly heating baseload in kWh/month for the whole simulation period.
@@ -279,7 +280,7 @@ class _HourlyDataBuilding(_LoadDataBuilding, _HourlyData, ABC):
         """
         return self.resample_to_monthly(self.hourly_heating_load_simulation_period)[1]
 
-    @property
+    @_cached_property
     def monthly_baseload_cooling_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly cooling baseload in kWh/month for the whole simulation period.
@@ -291,7 +292,7 @@ class _HourlyDataBuilding(_LoadDataBuilding, _HourlyData, ABC):
         """
         return self.resample_to_monthly(self.hourly_cooling_load_simulation_period)[1]
 
-    @property
+    @_cached_property
     def monthly_peak_heating_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly heating peak in kW/month for the whole simulation period.
@@ -303,7 +304,7 @@ class _HourlyDataBuilding(_LoadDataBuilding, _HourlyData, ABC):
         """
         return self.resample_to_monthly(self.hourly_heating_load_simulation_period)[0]
 
-    @property
+    @_cached_property
     def monthly_peak_cooling_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly cooling peak in kW/month for the whole simulation period.
@@ -315,7 +316,7 @@ class _HourlyDataBuilding(_LoadDataBuilding, _HourlyData, ABC):
         """
         return self.resample_to_monthly(self.hourly_cooling_load_simulation_period)[0]
 
-    @property
+    @_cached_property
     def monthly_baseload_injection_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly injection baseload in kWh/month for the whole simulation period.
@@ -332,7 +333,7 @@ class _HourlyDataBuilding(_LoadDataBuilding, _HourlyData, ABC):
             return super(_HourlyDataBuilding, self).monthly_baseload_injection_simulation_period
         return self.resample_to_monthly(self.hourly_injection_load_simulation_period)[1]
 
-    @property
+    @_cached_property
     def _monthly_baseload_extraction_heating_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly extraction baseload for space heating.in kWh/month for the whole simulation period.
@@ -346,7 +347,7 @@ class _HourlyDataBuilding(_LoadDataBuilding, _HourlyData, ABC):
             return super(_HourlyDataBuilding, self)._monthly_baseload_extraction_heating_simulation_period
         return self.resample_to_monthly(self._hourly_extraction_load_heating_simulation_period)[1]
 
-    @property
+    @_cached_property
     def _monthly_baseload_extraction_dhw_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly extraction baseload for DHW production in kWh/month for the whole simulation period.
@@ -360,7 +361,7 @@ class _HourlyDataBuilding(_LoadDataBuilding, _HourlyData, ABC):
             return super(_HourlyDataBuilding, self)._monthly_baseload_extraction_dhw_simulation_period
         return self.resample_to_monthly(self._hourly_extraction_load_dhw_simulation_period)[1]
 
-    @property
+    @_cached_property
     def monthly_peak_injection_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly injection peak in kW/month for the whole simulation period.
@@ -377,7 +378,7 @@ class _HourlyDataBuilding(_LoadDataBuilding, _HourlyData, ABC):
             return super(_HourlyDataBuilding, self).monthly_peak_injection_simulation_period
         return self.resample_to_monthly(self.hourly_injection_load_simulation_period)[0]
 
-    @property
+    @_cached_property
     def _monthly_peak_extraction_heating_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly extraction peak of space heating in kW/month for the whole simulation period.
@@ -391,7 +392,7 @@ class _HourlyDataBuilding(_LoadDataBuilding, _HourlyData, ABC):
             return super(_HourlyDataBuilding, self)._monthly_peak_extraction_heating_simulation_period
         return self.resample_to_monthly(self._hourly_extraction_load_heating_simulation_period)[0]
 
-    @property
+    @_cached_property
     def _monthly_peak_extraction_dhw_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly extraction peak of the DHW production in kW/month for the whole simulation period.
@@ -404,7 +405,7 @@ class _HourlyDataBuilding(_LoadDataBuilding, _HourlyData, ABC):
             return super(_HourlyDataBuilding, self)._monthly_peak_extraction_dhw_simulation_period
         return self.resample_to_monthly(self._hourly_extraction_load_dhw_simulation_period)[0]
 
-    @property
+    @_cached_property
     def monthly_baseload_dhw_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly domestic hot water baseload in kWh/month for the whole simulation period.
@@ -416,7 +417,7 @@ class _HourlyDataBuilding(_LoadDataBuilding, _HourlyData, ABC):
         """
         return self.resample_to_monthly(self.hourly_dhw_load_simulation_period)[1]
 
-    @property
+    @_cached_property
     def monthly_peak_dhw_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly peak power coming from the domestic hot water demand
@@ -556,7 +557,7 @@ class _HourlyDataBuilding(_LoadDataBuilding, _HourlyData, ABC):
             return np.max(self.monthly_peak_extraction_simulation_period)
         return np.max(self.hourly_extraction_load_simulation_period)
 
-    @property
+    @_cached_property
     def imbalance(self) -> float:
         """
         This function calculates the average yearly ground imbalance.
@@ -571,7 +572,7 @@ class _HourlyDataBuilding(_LoadDataBuilding, _HourlyData, ABC):
         return np.sum(
             self.hourly_injection_load_simulation_period - self.hourly_extraction_load_simulation_period) / self.simulation_period
 
-    @property
+    @_cached_property
     def month_indices(self) -> np.ndarray:
         """
         This property returns the array of all monthly indices for the simulation period.
@@ -1,10 +1,43 @@
 import abc
+import functools
 
 import numpy as np
 
 from abc import ABC
 from GHEtool.logger.ghe_logger import ghe_logger
 from numpy.typing import ArrayLike
+from typing import Callable
+
+
+def _cached_property(function: Callable) -> property:
+    """
+    This function is a decorator for the derived properties of the load classes. The value of the property is
+    memoised until one of the attributes of the load object is changed (see _LoadData.__setattr__).
+    The returned arrays are shared between the calls, so they should not be modified in place.
+
+    Parameters
+    ----------
+    function : Callable
+        Getter of the property
+
+    Returns
+    -------
+    property
+        Property with a memoised getter
+    """
+    # the qualified name distinguishes a property from the property it overrides
+    key = function.__qualname__
+
+    @functools.wraps(function)
+    def getter(self):
+        cache = self.__dict__.get('_cache')
+        if cache is not None and key in cache:
+            return cache[key]
+        value = function(self)
+        self.__dict__.setdefault('_cache', {})[key] = value
+        return value
+
+    return property(getter)
 
 
 class _LoadData(ABC):
@@ -29,6 +62,33 @@ class _LoadData(ABC):
         self._peak_extraction: np.ndarray = np.zeros(12)
         self._peak_injection: np.ndarray = np.zeros(12)
 
+    def __setattr__(self, key, value) -> None:
+        # every attribute (e.g. the loads, simulation period, start month, efficiencies or temperature results)
+        # can change the derived properties
+        self.__dict__['_cache'] = {}
+        super().__setattr__(key, value)
+
+    def __delattr__(self, key) -> None:
+        self.__dict__['_cache'] = {}
+        super().__delattr__(key)
+
+    def __getstate__(self) -> dict:
+        # the derived properties are not pickled
+        state = self.__dict__.copy()
+        state.pop('_cache', None)
+        return state
+
+    def clear_cache(self) -> None:
+        """
+        This function removes the memoised derived properties. Setting an attribute does this automatically, but
+        this function should be called after an array of the load is modified in place.
+
+        Returns
+        -------
+        None
+        """
+        self.__dict__['_cache'] = {}
+
     @abc.abstractmethod
     def monthly_baseload_injection_simulation_period(self) -> np.ndarray:
         """
@@ -114,7 +174,7 @@ class _LoadData(ABC):
         """
         self._all_months_equal = bool
 
-    @property
+    @_cached_property
     def UPM(self) -> np.ndarray:
         """
         Depending on whether all months are assumed to have equal length, the UPM are either constant
@@ -130,7 +190,7 @@ class _LoadData(ABC):
         else:
             return np.array([744, 672, 744, 720, 744, 720, 744, 744, 720, 744, 720, 744], dtype=np.int64)
 
-    @property
+    @_cached_property
     def monthly_baseload_injection(self) -> np.ndarray:
         """
         This function returns the monthly baseload injection in kWh/month.
@@ -142,7 +202,7 @@ class _LoadData(ABC):
         return np.mean(self.monthly_baseload_injection_simulation_period.reshape((self.simulation_period, 12)),
                        axis=0)
 
-    @property
+    @_cached_property
     def monthly_baseload_extraction(self) -> np.ndarray:
         """
         This function returns the monthly baseload extraction in kWh/month.
@@ -154,7 +214,7 @@ class _LoadData(ABC):
         return np.mean(self.monthly_baseload_extraction_simulation_period.reshape((self.simulation_period, 12)),
                        axis=0)
 
-    @property
+    @_cached_property
     def monthly_peak_injection(self) -> np.ndarray:
         """
         This function returns the monthly peak injection in kW/month.
@@ -166,7 +226,7 @@ class _LoadData(ABC):
         return np.mean(self.monthly_peak_injection_simulation_period.reshape((self.simulation_period, 12)),
                        axis=0)
 
-    @property
+    @_cached_property
     def monthly_peak_extraction(self) -> np.ndarray:
         """
         This function returns the monthly peak extraction in kW/month.
@@ -178,7 +238,7 @@ class _LoadData(ABC):
         return np.mean(self.monthly_peak_extraction_simulation_period.reshape((self.simulation_period, 12)),
                        axis=0)
 
-    @property
+    @_cached_property
     def monthly_baseload_injection_power(self) -> np.ndarray:
         """
         This function returns the monthly injection power due to the baseload injection in kW/month.
@@ -189,7 +249,7 @@ class _LoadData(ABC):
         """
         return np.divide(self.monthly_baseload_injection, self.UPM)
 
-    @property
+    @_cached_property
     def monthly_baseload_extraction_power(self) -> np.ndarray:
         """
         This function returns the monthly extraction power due to the baseload extraction in kW/month.
@@ -200,7 +260,7 @@ class _LoadData(ABC):
         """
         return np.divide(self.monthly_baseload_extraction, self.UPM)
 
-    @property
+    @_cached_property
     def monthly_baseload_injection_power_simulation_period(self) -> np.ndarray:
         """
 
@@ -210,7 +270,7 @@ class _LoadData(ABC):
         """
         return np.divide(self.monthly_baseload_injection_simulation_period, np.tile(self.UPM, self.simulation_period))
 
-    @property
+    @_cached_property
     def monthly_baseload_extraction_power_simulation_period(self) -> np.ndarray:
         """
 
@@ -294,7 +354,7 @@ class _LoadData(ABC):
         """
         return np.max(np.reshape(self.monthly_peak_injection_simulation_period, (self.simulation_period, 12)), axis=1)
 
-    @property
+    @_cached_property
     def imbalance(self) -> float:
         """
         This function calculates the average yearly ground imbalance.
@@ -307,7 +367,7 @@ class _LoadData(ABC):
         return np.sum(
             self.monthly_baseload_injection_simulation_period - self.monthly_baseload_extraction_simulation_period) / self.simulation_period
 
-    @property
+    @_cached_property
     def monthly_average_injection_power(self) -> np.ndarray:
         """
         This function calculates the average monthly injection power in kW.
@@ -320,7 +380,7 @@ class _LoadData(ABC):
         return np.mean(self.monthly_average_injection_power_simulation_period.reshape((self.simulation_period, 12)),
                        axis=0)
 
-    @property
+    @_cached_property
     def monthly_average_injection_power_simulation_period(self) -> np.ndarray:
         """
         This function calculates the average monthly injection power in kW for the whole simulation period.
@@ -425,7 +485,7 @@ class _LoadData(ABC):
         """
         return self.simulation_period * 8760 * 3600
 
-    @property
+    @_cached_property
     def time_L3(self) -> np.ndarray:
         """
         Time for L3 sizing, i.e. an array with monthly the cumulative seconds that have passed.
@@ -437,7 +497,7 @@ class _LoadData(ABC):
         """
         return np.cumsum(np.tile(self.UPM, self.simulation_period) * 3600)
 
-    @property
+    @_cached_property
     def time_L4(self) -> np.ndarray:
         """
         Times for the L4 sizing, i.e. an array with hourly the cumulative seconds that have passed.
@@ -482,7 +542,7 @@ class _LoadData(ABC):
         # if it is constant, the last month is returned
         return np.where(avg_load == np.max(avg_load))[0][-1]
 
-    @property
+    @_cached_property
     def max_peak_injection(self) -> float:
         """
         This returns the max peak injection in kW.
@@ -493,7 +553,7 @@ class _LoadData(ABC):
         """
         return np.max(self.monthly_peak_injection_simulation_period)
 
-    @property
+    @_cached_property
     def max_peak_extraction(self) -> float:
         """
         This returns the max peak extraction in kW.
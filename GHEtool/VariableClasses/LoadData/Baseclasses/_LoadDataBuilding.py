@@ -6,6 +6,7 @@ from abc import ABC
 from GHEtool.logger.ghe_logger import ghe_logger
 from GHEtool.VariableClasses.Efficiency import *
 from GHEtool.VariableClasses.LoadData.Baseclasses import _LoadData
+from GHEtool.VariableClasses.LoadData.Baseclasses._LoadData import _cached_property
 from GHEtool.VariableClasses.Result import ResultsMonthly, ResultsHourly
 from typing import Union
 
@@ -497,7 +498,7 @@ class _LoadDataBuilding(_LoadData, ABC):
         """
         return 1 + 1 / eer_value
 
-    @property
+    @_cached_property
     def monthly_baseload_injection_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly injection baseload in kWh/month for the whole simulation period.
@@ -512,7 +513,7 @@ class _LoadDataBuilding(_LoadData, ABC):
             self.monthly_baseload_cooling_simulation_period,
             self.conversion_factor_secondary_to_primary_cooling(self._get_monthly_eer(False, part_load)))
 
-    @property
+    @_cached_property
     def monthly_baseload_extraction_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly extraction baseload in kWh/month for the whole simulation period.
@@ -527,7 +528,7 @@ class _LoadDataBuilding(_LoadData, ABC):
             return self._monthly_baseload_extraction_heating_simulation_period
         return self._monthly_baseload_extraction_heating_simulation_period + self._monthly_baseload_extraction_dhw_simulation_period
 
-    @property
+    @_cached_property
     def _monthly_baseload_extraction_heating_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly extraction baseload for space heating.in kWh/month for the whole simulation period.
@@ -542,7 +543,7 @@ class _LoadDataBuilding(_LoadData, ABC):
             self.monthly_baseload_heating_simulation_period,
             self.conversion_factor_secondary_to_primary_heating(self._get_monthly_cop(False, part_load)))
 
-    @property
+    @_cached_property
     def _monthly_baseload_extraction_dhw_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly extraction baseload for DHW production in kWh/month for the whole simulation period.
@@ -557,7 +558,7 @@ class _LoadDataBuilding(_LoadData, ABC):
             self.monthly_baseload_dhw_simulation_period,
             self.conversion_factor_secondary_to_primary_heating(self._get_monthly_cop_dhw(False, part_load_dhw)))
 
-    @property
+    @_cached_property
     def monthly_peak_injection_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly injection peak in kW/month for the whole simulation period.
@@ -572,7 +573,7 @@ class _LoadDataBuilding(_LoadData, ABC):
             self.monthly_peak_cooling_simulation_period,
             self.conversion_factor_secondary_to_primary_cooling(self._get_monthly_eer(True, part_load)))
 
-    @property
+    @_cached_property
     def monthly_peak_extraction_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly extraction peak in kW/month for the whole simulation period.
@@ -588,7 +589,7 @@ class _LoadDataBuilding(_LoadData, ABC):
             return self._monthly_peak_extraction_heating_simulation_period
         return self._monthly_peak_extraction_heating_simulation_period + self._monthly_peak_extraction_dhw_simulation_period
 
-    @property
+    @_cached_property
     def _monthly_peak_extraction_heating_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly extraction peak of space heating in kW/month for the whole simulation period.
@@ -603,7 +604,7 @@ class _LoadDataBuilding(_LoadData, ABC):
             self.monthly_peak_heating_simulation_period,
             self.conversion_factor_secondary_to_primary_heating(self._get_monthly_cop(True, part_load)))
 
-    @property
+    @_cached_property
     def _monthly_peak_extraction_dhw_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly extraction peak of the DHW production in kW/month for the whole simulation period.
@@ -782,7 +783,7 @@ class _LoadDataBuilding(_LoadData, ABC):
                              'and cooling array.')
         self._dhw = dhw
 
-    @property
+    @_cached_property
     def monthly_baseload_dhw_power_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly baseload power coming from the domestic hot water demand
@@ -795,7 +796,7 @@ class _LoadDataBuilding(_LoadData, ABC):
         """
         return np.divide(self.monthly_baseload_dhw_simulation_period, np.tile(self.UPM, self.simulation_period))
 
-    @property
+    @_cached_property
     def monthly_peak_dhw_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly peak power coming from the domestic hot water demand
@@ -1014,7 +1015,7 @@ class _LoadDataBuilding(_LoadData, ABC):
         """
         return int(len(self.monthly_baseload_cooling_simulation_period) / 12)
 
-    @property
+    @_cached_property
     def month_indices(self) -> np.ndarray:
         """
         This property returns the array of all month indices for the simulation period.
@@ -10,6 +10,7 @@ from typing import Tuple, TYPE_CHECKING, Union
 
 from GHEtool.VariableClasses.Efficiency import *
 from GHEtool.VariableClasses.LoadData.Baseclasses import _SingleYear, _HourlyDataBuilding
+from GHEtool.VariableClasses.LoadData.Baseclasses._LoadData import _cached_property
 
 if TYPE_CHECKING:
     from numpy.typing import ArrayLike
@@ -176,7 +177,7 @@ class HourlyBuildingLoad(_SingleYear, _HourlyDataBuilding):
         """
         self.hourly_cooling_load = load
 
-    @property
+    @_cached_property
     def hourly_cooling_load_simulation_period(self) -> np.ndarray:
         """
         This function returns the hourly cooling in kWh/h for a whole simulation period.
@@ -188,7 +189,7 @@ class HourlyBuildingLoad(_SingleYear, _HourlyDataBuilding):
         """
         return np.tile(self.hourly_cooling_load, self.simulation_period)
 
-    @property
+    @_cached_property
     def hourly_heating_load_simulation_period(self) -> np.ndarray:
         """
         This function returns the hourly heating in kWh/h for a whole simulation period.
@@ -200,7 +201,7 @@ class HourlyBuildingLoad(_SingleYear, _HourlyDataBuilding):
         """
         return np.tile(self.hourly_heating_load, self.simulation_period)
 
-    @property
+    @_cached_property
     def hourly_dhw_load_simulation_period(self) -> np.ndarray:
         """
         This function returns the hourly DHW load in kWh/h for the whole simulation period.
@@ -249,7 +250,7 @@ class HourlyBuildingLoad(_SingleYear, _HourlyDataBuilding):
             return array
         return np.concatenate((array[self._start_hour:], array[: self._start_hour]))
 
-    @property
+    @_cached_property
     def month_indices(self) -> np.ndarray:
         """
         This property returns the array of all monthly indices for the simulation period.
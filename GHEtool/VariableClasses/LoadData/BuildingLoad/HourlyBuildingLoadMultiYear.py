@@ -3,6 +3,7 @@ from __future__ import annotations
 import numpy as np
 
 from GHEtool.VariableClasses.LoadData.Baseclasses import _HourlyDataBuilding
+from GHEtool.VariableClasses.LoadData.Baseclasses._LoadData import _cached_property
 from GHEtool.VariableClasses.Efficiency import *
 from typing import Union
 from numpy.typing import ArrayLike
@@ -95,7 +96,7 @@ class HourlyBuildingLoadMultiYear(_HourlyDataBuilding):
             return
         raise ValueError
 
-    @property
+    @_cached_property
     def hourly_cooling_load_simulation_period(self) -> np.ndarray:
         """
         This function returns the hourly cooling in kWh/h for a whole simulation period.
@@ -107,7 +108,7 @@ class HourlyBuildingLoadMultiYear(_HourlyDataBuilding):
         """
         return self._hourly_cooling_load
 
-    @property
+    @_cached_property
     def hourly_heating_load_simulation_period(self) -> np.ndarray:
         """
         This function returns the hourly heating in kWh/h for a whole simulation period.
@@ -159,7 +160,7 @@ class HourlyBuildingLoadMultiYear(_HourlyDataBuilding):
         """
         self.hourly_heating_load = load
 
-    @property
+    @_cached_property
     def hourly_dhw_load_simulation_period(self) -> np.ndarray:
         """
         This function returns the hourly DHW load in kWh/h for the whole simulation period.
@@ -4,6 +4,7 @@ import numpy as np
 
 from GHEtool.VariableClasses.Efficiency import *
 from GHEtool.VariableClasses.LoadData.Baseclasses import _SingleYear, _LoadDataBuilding
+from GHEtool.VariableClasses.LoadData.Baseclasses._LoadData import _cached_property
 from GHEtool.VariableClasses.Result import ResultsMonthly, ResultsHourly
 
 from numpy.typing import ArrayLike
@@ -311,7 +312,7 @@ class MonthlyBuildingLoadAbsolute(_SingleYear, _LoadDataBuilding):
         """
         self.peak_heating = np.array(load)
 
-    @property
+    @_cached_property
     def monthly_baseload_heating_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly heating baseload in kWh/month for the whole simulation period.
@@ -323,7 +324,7 @@ class MonthlyBuildingLoadAbsolute(_SingleYear, _LoadDataBuilding):
         """
         return np.tile(self.baseload_heating, self.simulation_period)
 
-    @property
+    @_cached_property
     def monthly_baseload_cooling_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly cooling baseload in kWh/month for the whole simulation period.
@@ -335,7 +336,7 @@ class MonthlyBuildingLoadAbsolute(_SingleYear, _LoadDataBuilding):
         """
         return np.tile(self.baseload_cooling, self.simulation_period)
 
-    @property
+    @_cached_property
     def monthly_peak_heating_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly heating peak in kW/month for the whole simulation period.
@@ -347,7 +348,7 @@ class MonthlyBuildingLoadAbsolute(_SingleYear, _LoadDataBuilding):
         """
         return np.tile(self.peak_heating, self.simulation_period)
 
-    @property
+    @_cached_property
     def monthly_peak_cooling_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly cooling peak in kW/month for the whole simulation period.
@@ -359,7 +360,7 @@ class MonthlyBuildingLoadAbsolute(_SingleYear, _LoadDataBuilding):
         """
         return np.tile(self.peak_cooling, self.simulation_period)
 
-    @property
+    @_cached_property
     def monthly_baseload_dhw_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly domestic hot water baseload in kWh/month for the whole simulation period.
@@ -396,7 +397,7 @@ class MonthlyBuildingLoadAbsolute(_SingleYear, _LoadDataBuilding):
             return array
         return np.concatenate((array[self.start_month - 1:], array[: self.start_month - 1]))
 
-    @property
+    @_cached_property
     def month_indices(self) -> np.ndarray:
         """
         This property returns the array of all monthly indices for the simulation period.
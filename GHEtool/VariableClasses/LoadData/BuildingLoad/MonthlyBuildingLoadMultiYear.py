@@ -4,6 +4,7 @@ import numpy as np
 
 from GHEtool.VariableClasses.Efficiency import *
 from GHEtool.VariableClasses.LoadData.Baseclasses import _LoadDataBuilding
+from GHEtool.VariableClasses.LoadData.Baseclasses._LoadData import _cached_property
 from GHEtool.VariableClasses.Result import ResultsMonthly, ResultsHourly
 
 from numpy.typing import ArrayLike
@@ -64,7 +65,7 @@ class MonthlyBuildingLoadMultiYear(_LoadDataBuilding):
         self.peak_heating = np.zeros(12) if peak_heating is None else peak_heating
         self.peak_cooling = np.zeros(12) if peak_cooling is None else peak_cooling
 
-    @property
+    @_cached_property
     def monthly_baseload_cooling_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly cooling baseload in kWh/month for the whole simulation period.
@@ -76,7 +77,7 @@ class MonthlyBuildingLoadMultiYear(_LoadDataBuilding):
         """
         return self.baseload_cooling
 
-    @property
+    @_cached_property
     def monthly_baseload_heating_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly heating baseload in kWh/month for the whole simulation period.
@@ -88,7 +89,7 @@ class MonthlyBuildingLoadMultiYear(_LoadDataBuilding):
         """
         return self.baseload_heating
 
-    @property
+    @_cached_property
     def monthly_peak_cooling_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly cooling peak in kW/month for the whole simulation period.
@@ -100,7 +101,7 @@ class MonthlyBuildingLoadMultiYear(_LoadDataBuilding):
         """
         return self.peak_cooling
 
-    @property
+    @_cached_property
     def monthly_peak_heating_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly heating peak in kW/month for the whole simulation period.
@@ -266,7 +267,7 @@ class MonthlyBuildingLoadMultiYear(_LoadDataBuilding):
             return
         raise ValueError
 
-    @property
+    @_cached_property
     def monthly_baseload_dhw_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly domestic hot water baseload in kWh/month for the whole simulation period.
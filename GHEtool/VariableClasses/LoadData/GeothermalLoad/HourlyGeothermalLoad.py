@@ -9,6 +9,7 @@ import warnings
 from typing import Tuple, TYPE_CHECKING
 
 from GHEtool.VariableClasses.LoadData.Baseclasses import _SingleYear, _HourlyData
+from GHEtool.VariableClasses.LoadData.Baseclasses._LoadData import _cached_property
 from GHEtool.logger import ghe_logger
 
 if TYPE_CHECKING:
@@ -173,7 +174,7 @@ class HourlyGeothermalLoad(_SingleYear, _HourlyData):
         """
         self.hourly_injection_load = load
 
-    @property
+    @_cached_property
     def hourly_injection_load_simulation_period(self) -> np.ndarray:
         """
         This function returns the hourly cooling in kWh/h for a whole simulation period.
@@ -185,7 +186,7 @@ class HourlyGeothermalLoad(_SingleYear, _HourlyData):
         """
         return np.tile(self.hourly_injection_load, self.simulation_period)
 
-    @property
+    @_cached_property
     def hourly_extraction_load_simulation_period(self) -> np.ndarray:
         """
         This function returns the hourly heating in kWh/h for a whole simulation period.
@@ -6,6 +6,7 @@ import numpy as np
 
 from GHEtool.logger import ghe_logger
 from GHEtool.VariableClasses.LoadData.Baseclasses import _HourlyData
+from GHEtool.VariableClasses.LoadData.Baseclasses._LoadData import _cached_property
 from GHEtool.VariableClasses.LoadData.GeothermalLoad.HourlyGeothermalLoad import HourlyGeothermalLoad
 
 from numpy.typing import ArrayLike
@@ -93,7 +94,7 @@ class HourlyGeothermalLoadMultiYear(_HourlyData):
             return
         raise ValueError
 
-    @property
+    @_cached_property
     def hourly_injection_load_simulation_period(self) -> np.ndarray:
         """
         This function returns the hourly cooling in kWh/h for a whole simulation period.
@@ -105,7 +106,7 @@ class HourlyGeothermalLoadMultiYear(_HourlyData):
         """
         return self._hourly_injection_load
 
-    @property
+    @_cached_property
     def hourly_extraction_load_simulation_period(self) -> np.ndarray:
         """
         This function returns the hourly heating in kWh/h for a whole simulation period.
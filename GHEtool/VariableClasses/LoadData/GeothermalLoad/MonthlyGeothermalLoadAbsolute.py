@@ -3,6 +3,7 @@ import warnings
 import numpy as np
 
 from GHEtool.VariableClasses.LoadData.Baseclasses import _SingleYear, _LoadData
+from GHEtool.VariableClasses.LoadData.Baseclasses._LoadData import _cached_property
 from GHEtool.VariableClasses.LoadData.GeothermalLoad import HourlyGeothermalLoad
 from GHEtool.VariableClasses.LoadData.GeothermalLoad.HourlyGeothermalLoadMultiYear import HourlyGeothermalLoadMultiYear
 from GHEtool.logger.ghe_logger import ghe_logger
@@ -299,7 +300,7 @@ class MonthlyGeothermalLoadAbsolute(_SingleYear, _LoadData):
         """
         self.peak_extraction = np.array(load)
 
-    @property
+    @_cached_property
     def monthly_baseload_injection_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly injection baseload in kWh/month for the whole simulation period.
@@ -311,7 +312,7 @@ class MonthlyGeothermalLoadAbsolute(_SingleYear, _LoadData):
         """
         return np.tile(self.baseload_injection, self.simulation_period)
 
-    @property
+    @_cached_property
     def monthly_baseload_extraction_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly extraction baseload in kWh/month for the whole simulation period.
@@ -323,7 +324,7 @@ class MonthlyGeothermalLoadAbsolute(_SingleYear, _LoadData):
         """
         return np.tile(self.baseload_extraction, self.simulation_period)
 
-    @property
+    @_cached_property
     def monthly_peak_injection_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly injection peak in kW/month for the whole simulation period.
@@ -335,7 +336,7 @@ class MonthlyGeothermalLoadAbsolute(_SingleYear, _LoadData):
         """
         return np.tile(self.peak_injection, self.simulation_period)
 
-    @property
+    @_cached_property
     def monthly_peak_extraction_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly extraction peak in kW/month for the whole simulation period.
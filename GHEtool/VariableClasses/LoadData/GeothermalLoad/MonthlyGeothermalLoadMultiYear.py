@@ -3,6 +3,7 @@ from __future__ import annotations
 import numpy as np
 
 from GHEtool.VariableClasses.LoadData.Baseclasses import _LoadData
+from GHEtool.VariableClasses.LoadData.Baseclasses._LoadData import _cached_property
 
 from numpy.typing import ArrayLike
 
@@ -50,7 +51,7 @@ class MonthlyGeothermalLoadMultiYear(_LoadData):
         self.peak_extraction = np.zeros(12) if peak_extraction is None else peak_extraction
         self.peak_injection = np.zeros(12) if peak_injection is None else peak_injection
 
-    @property
+    @_cached_property
     def monthly_baseload_injection_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly injection baseload in kWh/month for the whole simulation period.
@@ -62,7 +63,7 @@ class MonthlyGeothermalLoadMultiYear(_LoadData):
         """
         return self.baseload_injection
 
-    @property
+    @_cached_property
     def monthly_baseload_extraction_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly extraction baseload in kWh/month for the whole simulation period.
@@ -74,7 +75,7 @@ class MonthlyGeothermalLoadMultiYear(_LoadData):
         """
         return self.baseload_extraction
 
-    @property
+    @_cached_property
     def monthly_peak_injection_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly injection peak in kW/month for the whole simulation period.
@@ -86,7 +87,7 @@ class MonthlyGeothermalLoadMultiYear(_LoadData):
         """
         return self.peak_injection
 
-    @property
+    @_cached_property
     def monthly_peak_extraction_simulation_period(self) -> np.ndarray:
         """
         This function returns the monthly extraction peak in kW/month for the whole simulation period.
@@ -135,3 +135,99 @@ class ResultsHourly(_Results):
     @property
     def peak_injection(self) -> np.ndarray:
         return self.Tf
+
+
+class ResultsMonthlyBatch(ResultsMonthly):
+    """
+    Class which contains the temperatures of the fluid and borehole wall with a monthly resolution for multiple depths.
+    Every temperature array has the shape (number of depths, number of months).
+    """
+
+    def __init__(self,
+                 depths: np.ndarray = np.array([]),
+                 borehole_wall_temp: np.ndarray = np.array([]),
+                 peak_extraction: np.ndarray = np.array([]),
+                 peak_injection: np.ndarray = np.array([]),
+                 monthly_extraction: np.ndarray = np.array([]),
+                 monthly_injection: np.ndarray = np.array([])):
+        """
+
+        Parameters
+        ----------
+        depths : np.ndarray
+            Borehole depths [m] corresponding to the rows of the temperature arrays
+        borehole_wall_temp : np.ndarray
+            Borehole wall temperature [deg C]
+        peak_extraction : np.ndarray
+            Average fluid temperature in peak heating [deg C]
+        peak_injection : np.ndarray
+            Average fluid temperature in peak cooling [deg C]
+        monthly_extraction : np.ndarray
+            Average temperature due to average monthly heating [deg C]
+        monthly_injection : np.ndarray
+            Average temperature due to average monthly cooling [deg C]
+        """
+        super().__init__(borehole_wall_temp, peak_extraction, peak_injection, monthly_extraction, monthly_injection)
+        self.depths = depths
+
+    def __len__(self) -> int:
+        return len(self.depths)
+
+    def __getitem__(self, index: int) -> ResultsMonthly:
+        """
+        This function returns the results for a single depth.
+
+        Parameters
+        ----------
+        index : int
+            Index of the depth in the depths array
+
+        Returns
+        -------
+        ResultsMonthly
+        """
+        return ResultsMonthly(self.Tb[index], self.peak_extraction[index], self.peak_injection[index],
+                              self.monthly_extraction[index], self.monthly_injection[index])
+
+
+class ResultsHourlyBatch(ResultsHourly):
+    """
+    Class which contains the temperatures of the fluid and borehole wall with an hourly resolution for multiple depths.
+    Every temperature array has the shape (number of depths, number of hours).
+    """
+
+    def __init__(self,
+                 depths: np.ndarray = np.array([]),
+                 borehole_wall_temp: np.ndarray = np.array([]),
+                 temperature_fluid: np.ndarray = np.array([])):
+        """
+
+        Parameters
+        ----------
+        depths : np.ndarray
+            Borehole depths [m] corresponding to the rows of the temperature arrays
+        borehole_wall_temp : np.ndarray
+            Borehole wall temperature [deg C]
+        temperature_fluid : np.ndarray
+            Average fluid temperature [deg C]
+        """
+        super().__init__(borehole_wall_temp, temperature_fluid)
+        self.depths = depths
+
+    def __len__(self) -> int:
+        return len(self.depths)
+
+    def __getitem__(self, index: int) -> ResultsHourly:
+        """
+        This function returns the results for a single depth.
+
+        Parameters
+        ----------
+        index : int
+            Index of the depth in the depths array
+
+        Returns
+        -------
+        ResultsHourly
+        """
+        return ResultsHourly(self.Tb[index], self.Tf[index])
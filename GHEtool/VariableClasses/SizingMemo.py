@@ -0,0 +1,217 @@
+"""
+This file contains the SizingMemo class, which remembers the results of previous sizings of a borefield.
+"""
+from __future__ import annotations
+
+import copy
+import hashlib
+from collections import OrderedDict
+from typing import Tuple, Union
+
+import numpy as np
+
+from GHEtool.VariableClasses.Result import ResultsMonthly, ResultsHourly
+
+# attributes with calculated values, which are not an input of the sizing
+_EXCLUDED_ATTRIBUTES = ('_cache', '_results', '_results_fixed', '_backup', '_layer_table', 'borehole_internal_model')
+_SCALARS = frozenset((type(None), bool, int, float, complex, str, bytes))
+
+
+def fingerprint(*values, exclude: tuple = ()) -> str:
+    """
+    This function returns a fingerprint of the given values. Numpy arrays, lists, tuples and dictionaries are
+    fingerprinted element by element and other objects by their type and the values of their attributes (apart from
+    the ones in exclude and the ones that only contain calculated values), so the fingerprint changes as well when an
+    object is altered in place.
+
+    Parameters
+    ----------
+    values
+        Values of which the fingerprint should be calculated
+    exclude : tuple
+        Names of the attributes of the objects that should not be taken into account
+
+    Returns
+    -------
+    str
+        Fingerprint of the values
+    """
+    # the text is hashed at once instead of value by value, since this function is also used for the keys of the Rb*
+    # cache, which are looked up very often
+    digest = hashlib.blake2b(digest_size=16)
+    text = []
+    visited = set()
+
+    def update(value) -> None:
+        if type(value) in _SCALARS or isinstance(value, np.generic):
+            text.append(f'{type(value).__name__}:{value!r};')
+        elif isinstance(value, np.ndarray):
+            text.append(f'array{value.dtype}{value.shape}')
+            digest.update(''.join(text).encode())
+            text.clear()
+            digest.update(np.ascontiguousarray(value).tobytes())
+        elif isinstance(value, (list, tuple)):
+            text.append(f'{type(value).__name__}{len(value)}(')
+            for item in value:
+                if type(item) in _SCALARS:
+                    text.append(f'{type(item).__name__}:{item!r};')
+                else:
+                    update(item)
+            text.append(')')
+        elif isinstance(value, dict):
+            text.append(f'dict{len(value)}(')
+            for key in sorted(value, key=repr):
+                update(key)
+                update(value[key])
+            text.append(')')
+        elif id(value) in visited:
+            # an object that refers to itself
+            text.append('visited;')
+        else:
+            visited.add(id(value))
+            text.append(f'{type(value).__name__}(')
+            attributes = dict.fromkeys(slot for cls in type(value).__mro__ for slot in getattr(cls, '__slots__', ()))
+            attributes.update(dict.fromkeys(sorted(getattr(value, '__dict__', {}))))
+            for attribute in attributes:
+                if attribute in exclude or attribute in _EXCLUDED_ATTRIBUTES or not hasattr(value, attribute):
+                    continue
+                item = getattr(value, attribute)
+                if type(item) in _SCALARS:
+                    text.append(f'{attribute}{type(item).__name__}:{item!r};')
+                else:
+                    text.append(attribute)
+                    update(item)
+            text.append(')')
+
+    for value in values:
+        update(value)
+    digest.update(''.join(text).encode())
+    return digest.hexdigest()
+
+
+class SizingMemo:
+    """
+    Memo of the previous sizings of a borefield. Every sizing is stored under a fingerprint of all its inputs, so a
+    sizing with exactly the same inputs returns the stored result immediately. For the sizings with the same
+    configuration (i.e. with the same inputs apart from the load and the temperature limits), a descriptor of the load
+    and temperature limits is stored as well, so a new sizing of this configuration can start from the depth of the
+    sizing with the most similar load.
+    """
+
+    DEFAULT_MAX_NUMBER_OF_SIZINGS: int = 32
+
+    def __init__(self, max_number_of_sizings: int = DEFAULT_MAX_NUMBER_OF_SIZINGS):
+        """
+
+        Parameters
+        ----------
+        max_number_of_sizings : int
+            Maximum number of sizings that are remembered. When more sizings are stored, the least recently used one
+            is removed.
+        """
+        self.max_number_of_sizings: int = max_number_of_sizings
+        # for every fingerprint of the inputs, the configuration, load descriptor, depth, limiting quadrant, results
+        # and results of the building load
+        self._sizings: OrderedDict = OrderedDict()
+        self.hits: int = 0
+        self.warm_starts: int = 0
+
+    def get(self, key: str) -> Union[Tuple[float, int, Union[ResultsMonthly, ResultsHourly], Union[
+            ResultsMonthly, ResultsHourly, tuple, None]], None]:
+        """
+        This function returns the stored result of the sizing with the given fingerprint of the inputs. The results
+        are copies, so they can be altered without changing the stored sizing.
+
+        Parameters
+        ----------
+        key : str
+            Fingerprint of all the inputs of the sizing
+
+        Returns
+        -------
+        tuple or None
+            Depth [m], limiting quadrant, results and results of the building load of the sizing, or None if this
+            sizing is not stored
+        """
+        if key not in self._sizings:
+            return None
+        self._sizings.move_to_end(key)
+        self.hits += 1
+        depth, limiting_quadrant, results, load_results = self._sizings[key][2:]
+        return depth, limiting_quadrant, copy.deepcopy(results), copy.deepcopy(load_results)
+
+    def nearest_depth(self, configuration: str, descriptor: np.ndarray) -> Union[float, None]:
+        """
+        This function returns the depth of the stored sizing of the same configuration of which the descriptor of the
+        load and temperature limits has the smallest relative difference with the given one.
+
+        Parameters
+        ----------
+        configuration : str
+            Fingerprint of the inputs of the sizing apart from the load and the temperature limits
+        descriptor : np.ndarray
+            Descriptor of the load and the temperature limits
+
+        Returns
+        -------
+        float or None
+            Depth of the most similar sizing [m], or None if no sizing of this configuration is stored
+        """
+        depth, distance = None, np.inf
+        for stored_configuration, stored_descriptor, stored_depth, *_ in self._sizings.values():
+            if stored_configuration != configuration or stored_descriptor.shape != descriptor.shape:
+                continue
+            difference = np.sum(np.abs(stored_descriptor - descriptor)) / max(np.sum(np.abs(descriptor)), 1e-12)
+            if difference < distance:
+                depth, distance = stored_depth, difference
+        if depth is not None:
+            self.warm_starts += 1
+        return depth
+
+    def store(self, key: str, configuration: str, descriptor: np.ndarray, depth: float, limiting_quadrant: int,
+              results: Union[ResultsMonthly, ResultsHourly],
+              load_results: Union[ResultsMonthly, ResultsHourly, tuple] = None) -> None:
+        """
+        This function stores (a copy of) the result of a sizing.
+
+        Parameters
+        ----------
+        key : str
+            Fingerprint of all the inputs of the sizing
+        configuration : str
+            Fingerprint of the inputs of the sizing apart from the load and the temperature limits
+        descriptor : np.ndarray
+            Descriptor of the load and the temperature limits
+        depth : float
+            Resulting depth [m]
+        limiting_quadrant : int
+            Limiting quadrant of the sizing
+        results : ResultsMonthly, ResultsHourly
+            Temperature results of the sizing
+        load_results : ResultsMonthly, ResultsHourly, tuple
+            Temperature results on which the building load depends after the sizing, or None for a geothermal load
+
+        Returns
+        -------
+        None
+        """
+        self._sizings[key] = (configuration, descriptor, depth, limiting_quadrant, copy.deepcopy(results),
+                              copy.deepcopy(load_results))
+        self._sizings.move_to_end(key)
+        while len(self._sizings) > self.max_number_of_sizings:
+            self._sizings.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        This function removes all the stored sizings.
+
+        Returns
+        -------
+        None
+        """
+        self._sizings.clear()
+        self.hits = 0
+        self.warm_starts = 0
+
+    def __len__(self) -> int:
+        return len(self._sizings)
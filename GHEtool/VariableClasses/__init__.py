@@ -3,8 +3,14 @@ from .GroundData import *
 from .LoadData import *
 from .PipeData import *
 from .Efficiency import *
-from .CustomGFunction import CustomGFunction, load_custom_gfunction, _time_values
+from .CustomGFunction import CustomGFunction, load_custom_gfunction, convert_custom_gfunction, _time_values
+from .GFunctionStore import GFunctionStore
+from .GFunctionInterpolator import GFunctionInterpolator
 from .GFunction import GFunction, FIFO
 from .CalculationSetup import CalculationSetup
 from .Borehole import Borehole
-from .Result import ResultsMonthly, ResultsHourly, _Results
+from .Result import ResultsMonthly, ResultsHourly, _Results, ResultsMonthlyBatch, ResultsHourlyBatch
+from .FFTConvolution import FFTConvolution
+from .FixedPointAcceleration import AndersonAcceleration, AitkenAcceleration, NoAcceleration, \
+    FIXED_POINT_ACCELERATIONS
+from .SizingMemo import SizingMemo
@@ -4,3 +4,4 @@ from GHEtool.Borefield import Borefield
 from GHEtool.VariableClasses import *
 FOLDER: pathlib.Path = pathlib.Path(__file__).parent  # solve problem with importing GHEtool from sub-folders
 from GHEtool.logger import ghe_logger
+from GHEtool.Methods.size_many import size_many, SizingScenario
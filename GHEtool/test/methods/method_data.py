@@ -353,30 +353,30 @@ list_of_test_objects.add(
     SizingObject(borefield, L4_output=18602.210559679363, quadrant=3, name='Hourly profile, quadrant 3'))
 hourly_load = HourlyBuildingLoad(efficiency_heating=10 ** 6, efficiency_cooling=10 ** 6)
 hourly_load.load_hourly_profile(FOLDER.joinpath("test\methods\hourly_data\hourly_profile.csv"))
-list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 150, 87.506, 97.012,
-                                                   305.842, 384.204, 230.193, 292.212,
+list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 150, 87.4035, 97.0165,
+                                                   305.126, 384.321, 230.91, 292.0956,
                                                    name='Optimise load profile 1 (power)', power=True, hourly=False))
 
-list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 100, 70.054, 87.899,
-                                                   210.800, 247.186, 325.236, 429.231,
+list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 100, 69.9288, 87.8444,
+                                                   210.241, 246.6987, 325.795, 429.718,
                                                    name='Optimise load profile 2 (power)', power=True, hourly=False))
 
-list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 50, 45.096, 63.799,
-                                                   118.898, 117.804, 417.138, 558.612,
+list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 50, 45.0518, 63.844,
+                                                   118.7523, 117.954, 417.284, 558.462,
                                                    name='Optimise load profile 3 (power)', power=True, hourly=False))
 
-list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 150, 87.506, 96.404,
-                                                   305.842, 368.463, 230.193, 307.954,
+list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 150, 87.4489, 96.412,
+                                                   305.4443, 368.6716, 230.5915, 307.745,
                                                    name='Optimise load profile 1 (power, hourly)', power=True,
                                                    hourly=True))
 
-list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 100, 69.662, 87.022,
-                                                   209.053, 239.590, 326.983, 436.827,
+list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 100, 69.5291, 86.8717,
+                                                   208.46, 238.3335, 327.576, 438.083,
                                                    name='Optimise load profile 2 (power, hourly)', power=True,
                                                    hourly=True))
 
-list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 50, 44.635, 63.467,
-                                                   117.388, 116.699, 418.648, 559.718,
+list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 50, 44.6434, 63.2406,
+                                                   117.4146, 115.9566, 418.6214, 560.46,
                                                    name='Optimise load profile 3 (power, hourly)', power=True,
                                                    hourly=True))
 
@@ -439,12 +439,12 @@ borefield.set_max_avg_fluid_temperature(16)
 borefield.set_min_avg_fluid_temperature(0)
 hourly_load.load_hourly_profile(FOLDER.joinpath("test\methods\hourly_data\hourly_profile.csv"), col_heating=1,
                                 col_cooling=0)
-list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 150, 99.976, 66.492,
-                                                   643.137, 195.331, 33.278, 340.705,
+list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 150, 99.9738, 66.3306,
+                                                   641.585, 194.6677, 34.8306, 341.3686,
                                                    name='Optimise load profile 1, reversed (power)', power=True,
                                                    hourly=False))
-list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 150, 99.971, 66.424,
-                                                   639.283, 195.053, 37.132, 340.983,
+list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 150, 99.971, 66.3156,
+                                                   639.091, 194.6063, 37.32416, 341.43,
                                                    name='Optimise load profile 1, reversed (power, hourly)', power=True,
                                                    hourly=True))
 
@@ -453,23 +453,23 @@ list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 150,
                                                    name='Optimise load profile 1, reversed (energy)', power=False))
 borefield.set_max_avg_fluid_temperature(20)
 borefield.set_min_avg_fluid_temperature(4)
-list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 150, 97.012, 87.506,
-                                                   384.204, 305.842, 292.211, 230.195,
+list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 150, 96.9346, 87.44,
+                                                   382.078, 305.3827, 294.338, 230.6538,
                                                    name='Optimise load profile 2, reversed (power)', power=True,
                                                    hourly=False))
 
-list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 100, 87.899, 70.054,
-                                                   247.186, 210.800, 429.23, 325.236,
+list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 100, 87.8797, 69.8935,
+                                                   247.014, 210.084, 429.402, 325.9524,
                                                    name='Optimise load profile 3, reversed (power)', power=True,
                                                    hourly=False))
 
-list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 150, 96.404, 87.506,
-                                                   368.463, 305.842, 307.953, 230.195,
+list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 150, 96.3077, 87.4922,
+                                                   366.13, 305.748, 310.286, 230.2886,
                                                    name='Optimise load profile 2, reversed (power, hourly)', power=True,
                                                    hourly=True))
 
-list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 100, 87.022, 69.662,
-                                                   239.590, 209.053, 436.826, 326.984,
+list_of_test_objects.add(OptimiseLoadProfileObject(borefield, hourly_load, 100, 86.7993, 69.4656,
+                                                   237.7324, 208.1773, 438.684, 327.859,
                                                    name='Optimise load profile 3, reversed (power, hourly)', power=True,
                                                    hourly=True))
 
@@ -495,12 +495,12 @@ borefield.load = load
 borefield.set_ground_parameters(GroundTemperatureGradient(1.9, 10, gradient=2))
 borefield.set_fluid_parameters(FluidData(0.1, 0.475, 1033, 3930, 0.001))
 borefield.set_pipe_parameters(SingleUTube(1.5, 0.016, 0.02, 0.42, 0.04))
-list_of_test_objects.add(OptimiseLoadProfileObject(borefield, load, 146, 81.5183, 88.0269,
-                                                   22.2353, 39.3994, 55.3678, 58.51623,
+list_of_test_objects.add(OptimiseLoadProfileObject(borefield, load, 146, 81.7313, 88.47,
+                                                   22.34324, 39.9338, 55.2239, 58.00246,
                                                    name='Optimise load profile (stuck in loop) (power)', power=True,
                                                    hourly=False))
-list_of_test_objects.add(OptimiseLoadProfileObject(borefield, load, 146, 80.3414, 84.7223,
-                                                   21.65199, 35.8583, 56.14555, 61.92114,
+list_of_test_objects.add(OptimiseLoadProfileObject(borefield, load, 146, 80.4835, 84.9959,
+                                                   21.72128, 36.1258, 56.05316, 61.66398,
                                                    name='Optimise load profile (stuck in loop) (power, hourly)',
                                                    power=True, hourly=True))
 list_of_test_objects.add(OptimiseLoadProfileObject(borefield, load, 146, 89.31225880363472, 98.37453537405028,
@@ -576,9 +576,9 @@ borefield.load = load
 borefield.set_ground_parameters(GroundTemperatureGradient(1.9, 10, gradient=2))
 borefield.set_fluid_parameters(FluidData(0.1, 0.475, 1033, 3930, 0.001))
 borefield.set_pipe_parameters(SingleUTube(1.5, 0.016, 0.02, 0.42, 0.04))
-list_of_test_objects.add(OptimiseLoadProfileObject(borefield, load, 146, 45.978137699335, 11.029080983424729,
-                                                   52.82586122830533, 28.00877268650213, 605.9817888622596,
-                                                   512.6954920945816,
+list_of_test_objects.add(OptimiseLoadProfileObject(borefield, load, 146, 45.992858699111, 11.041027741787527,
+                                                   52.84993366509492, 28.04222104504707, 605.9496922798735,
+                                                   512.6676184624608,
                                                    name='Optimise load profile (eer combined) (power)', power=True,
                                                    hourly=False))
 list_of_test_objects.add(OptimiseLoadProfileObject(borefield, load, 146, 50.187981717163034, 12.82812330930278,
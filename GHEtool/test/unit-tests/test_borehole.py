@@ -1,4 +1,6 @@
 import copy
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import pygfunction as gt
 import numpy as np
@@ -7,6 +9,9 @@ import pytest
 from GHEtool import FluidData, DoubleUTube, SingleUTube, MultipleUTube
 from GHEtool.VariableClasses import Borehole
 
+# the module, which is shadowed by the class with the same name
+borehole_module = sys.modules['GHEtool.VariableClasses.Borehole']
+
 fluid_data = FluidData(0.2, 0.568, 998, 4180, 1e-3)
 pipe_data = DoubleUTube(1, 0.015, 0.02, 0.4, 0.05)
 
@@ -150,3 +155,70 @@ def test_repr_():
 
     borehole = Borehole()
     assert 'Borehole effective thermal resistance [(m·K)/W]: 0.12' == borehole.__repr__()
+
+
+def test_Rb_cache(monkeypatch):
+    Borehole.clear_Rb_cache()
+    borehole = Borehole(fluid_data, copy.copy(pipe_data))
+    Rb = borehole.calculate_Rb(100, 1, 0.075, 3)
+    # a second calculation with the same parameters does not build the pipe model again
+    calls = []
+    pipe_model = type(borehole.pipe_data).pipe_model
+    monkeypatch.setattr(type(borehole.pipe_data), "pipe_model",
+                        lambda *args: calls.append(args) or pipe_model(*args))
+    assert borehole.calculate_Rb(100, 1, 0.075, 3) == Rb
+    assert borehole.calculate_Rb(100, 1, 0.075, lambda H: 3) == Rb
+    assert len(calls) == 0
+    # other parameters and in place changes of the pipe data are calculated again
+    assert not np.isclose(borehole.calculate_Rb(150, 1, 0.075, 3), Rb)
+    borehole.pipe_data.k_g = 2
+    assert not np.isclose(borehole.calculate_Rb(100, 1, 0.075, 3), Rb)
+    assert len(calls) == 2
+    Borehole.clear_Rb_cache()
+    borehole.calculate_Rb(150, 1, 0.075, 3)
+    assert len(calls) == 3
+
+
+def test_Rb_cache_threads(monkeypatch):
+    Borehole.clear_Rb_cache()
+    monkeypatch.setattr(borehole_module, "_RB_CACHE_SIZE", 4)
+    borehole = Borehole(fluid_data, pipe_data)
+    depths = np.linspace(50, 150, 40)
+    expected = [borehole.calculate_Rb(H, 1, 0.075, 3) for H in depths]
+    Borehole.clear_Rb_cache()
+    # the threads remove the oldest values of the full cache at the same time
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda H: borehole.calculate_Rb(H, 1, 0.075, 3), np.tile(depths, 4)))
+    assert np.allclose(results, np.tile(expected, 4))
+    assert len(borehole_module._RB_CACHE) <= 4
+    Borehole.clear_Rb_cache()
+
+def test_Rb_surrogate():
+    borehole = Borehole(fluid_data, pipe_data)
+    surrogate = borehole.Rb_surrogate(1, 0.075, 3, 1e-4)
+    assert surrogate.error <= 1e-4
+    assert borehole.Rb_surrogate(1, 0.075, 3, 1e-4) is surrogate
+    depths = np.linspace(10, 1000, 100)
+    assert np.allclose([surrogate(H) for H in depths], [borehole.calculate_Rb(H, 1, 0.075, 3) for H in depths],
+                       rtol=0, atol=1e-4)
+    assert 100 in surrogate and 1001 not in surrogate
+
+    # get_Rb only uses the surrogate when the tolerance is set
+    assert borehole.get_Rb(123.4, 1, 0.075, 3) == borehole.calculate_Rb(123.4, 1, 0.075, 3)
+    borehole.Rb_surrogate_tolerance = 1e-4
+    assert borehole.get_Rb(123.4, 1, 0.075, 3) == surrogate(123.4)
+    assert np.isclose(borehole.get_Rb(123.4, 1, 0.075, 3), borehole.calculate_Rb(123.4, 1, 0.075, 3), atol=1e-4)
+    # outside the range of the surrogate, the resistance is calculated
+    assert borehole.get_Rb(1200, 1, 0.075, 3) == borehole.calculate_Rb(1200, 1, 0.075, 3)
+    borehole.Rb = 0.12
+    assert borehole.get_Rb(123.4, 1, 0.075, 3) == 0.12
+
+
+def test_unpickle_older_version():
+    borehole = Borehole(fluid_data, pipe_data)
+    state = borehole.__reduce_ex__(2)[2]
+    del state[1]['Rb_surrogate_tolerance']
+    unpickled = Borehole.__new__(Borehole)
+    unpickled.__setstate__(state)
+    assert unpickled == borehole
+    assert copy.deepcopy(borehole) == borehole
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from GHEtool import *
@@ -66,6 +68,15 @@ def test_error_quadrant():
     CalculationSetup(quadrant_sizing=0)
 
 
+def test_error_fixed_point_acceleration():
+    with pytest.raises(ValueError):
+        CalculationSetup(fixed_point_acceleration='newton')
+    setup = CalculationSetup(fixed_point_acceleration='anderson')
+    with pytest.raises(ValueError):
+        setup.update_variables(fixed_point_acceleration='newton')
+    assert setup.fixed_point_acceleration == 'anderson'
+
+
 def test_equal_unequal():
     setup1 = CalculationSetup(2, False, True, False)
     setup2 = CalculationSetup(2, False, True, False)
@@ -79,3 +90,17 @@ def test_assign_incorrect_variable():
     setup = CalculationSetup()
     with pytest.raises(ValueError):
         setup.update_variables(test='test')
+
+
+def test_pickle_older_version():
+    setup = CalculationSetup(bracketed_sizing=True)
+    assert pickle.loads(pickle.dumps(setup)) == setup
+    # an object pickled with an older version does not have all the slots
+    setup_old = CalculationSetup.__new__(CalculationSetup)
+    setup_old.__setstate__((None, {'_L2_sizing': False, '_L3_sizing': True, '_L4_sizing': False}))
+    assert setup_old.L3_sizing
+    assert not setup_old.bracketed_sizing
+    assert not setup_old.prefetch_gfunctions
+    assert setup_old.fixed_point_acceleration == 'none'
+    assert not setup_old.concurrent_quadrants
+    assert not setup_old.sizing_memo
@@ -1,10 +1,12 @@
 import copy
+import json
+import os
 
 import numpy as np
 import pygfunction as gt
 import pytest
 
-from GHEtool.VariableClasses import CustomGFunction, load_custom_gfunction
+from GHEtool.VariableClasses import CustomGFunction, load_custom_gfunction, convert_custom_gfunction
 
 
 @pytest.fixture
@@ -67,8 +69,81 @@ def test_create_dataset():
     assert not np.any(custom_gfunction.gvalues_array)
 
 
-def test_dump_dataset(custom_gfunction):
-    custom_gfunction.dump_custom_dataset("", "test")
+def test_create_dataset_workers():
+    field = gt.boreholes.rectangle_field(3, 3, 6, 6, 100, 4, 0.075)
+    custom_gfunction = CustomGFunction(depth_array=np.array([50, 100, 150]))
+    custom_gfunction.create_custom_dataset(field, lambda H: 2. * 10 ** -6 * (1 + H / 1000))
+    temp = copy.copy(custom_gfunction.gvalues_array)
+
+    custom_gfunction = CustomGFunction(depth_array=np.array([50, 100, 150]))
+    custom_gfunction.create_custom_dataset(field, lambda H: 2. * 10 ** -6 * (1 + H / 1000), workers=2)
+    assert np.allclose(custom_gfunction.gvalues_array, temp)
+    # the original borefield is not changed
+    assert field[0].H == 100
+
+
+def test_dump_dataset(custom_gfunction, tmp_path):
+    custom_gfunction.dump_custom_dataset(str(tmp_path) + "/", "test")
+    loaded_custom_gfunction = load_custom_gfunction(str(tmp_path / "test.gvd"))
+    assert loaded_custom_gfunction == custom_gfunction
+    assert isinstance(loaded_custom_gfunction.gvalues_array, np.memmap)
+    assert loaded_custom_gfunction.geometry_hash == custom_gfunction.geometry_hash is not None
+
+
+def test_load_incomplete_dataset(tmp_path):
+    os.makedirs(tmp_path / "test.gvd")
+    with pytest.raises(ValueError):
+        load_custom_gfunction(str(tmp_path / "test.gvd"))
+
+    custom_gfunction = CustomGFunction()
+    custom_gfunction.dump_custom_dataset(str(tmp_path) + "/", "test")
+    with open(tmp_path / "test.gvd" / "metadata.json") as f:
+        metadata = json.load(f)
+    metadata["version"] = CustomGFunction.FORMAT_VERSION + 1
+    with open(tmp_path / "test.gvd" / "metadata.json", "w") as f:
+        json.dump(metadata, f)
+    with pytest.raises(ValueError):
+        load_custom_gfunction(str(tmp_path / "test.gvd"))
+
+
+def test_dump_dataset_array_options(tmp_path):
+    custom_gfunction = CustomGFunction(options={"method": "equivalent", "segment_ratios": np.array([0.25, 0.75]),
+                                                "disp": np.bool_(False)})
+    custom_gfunction.dump_custom_dataset(str(tmp_path) + "/", "test")
+    loaded_custom_gfunction = load_custom_gfunction(str(tmp_path / "test.gvd"))
+    assert isinstance(loaded_custom_gfunction.options["segment_ratios"], np.ndarray)
+    assert np.array_equal(loaded_custom_gfunction.options["segment_ratios"], np.array([0.25, 0.75]))
+    assert loaded_custom_gfunction.options["disp"] is False
+
+
+def test_dump_dataset_not_serialisable(tmp_path):
+    custom_gfunction = CustomGFunction(options={"method": "equivalent", "function": lambda x: x})
+    with pytest.raises(ValueError):
+        custom_gfunction.dump_custom_dataset(str(tmp_path) + "/", "test")
+    assert not os.path.exists(tmp_path / "test.gvd" / "metadata.json")
+
+
+def test_dump_dataset_overwrite_loaded(custom_gfunction, tmp_path):
+    custom_gfunction.dump_custom_dataset(str(tmp_path) + "/", "test")
+    loaded_custom_gfunction = load_custom_gfunction(str(tmp_path / "test.gvd"))
+    temp = np.array(loaded_custom_gfunction.gvalues_array)
+
+    custom_gfunction.gvalues_array = custom_gfunction.gvalues_array * 2
+    custom_gfunction.dump_custom_dataset(str(tmp_path) + "/", "test")
+    # the memory mapped arrays of the previously loaded dataset are not overwritten
+    assert np.array_equal(loaded_custom_gfunction.gvalues_array, temp)
+    assert np.allclose(load_custom_gfunction(str(tmp_path / "test.gvd")).gvalues_array, temp * 2)
+    assert not [file for file in os.listdir(tmp_path / "test.gvd") if not file.endswith((".npy", ".json"))]
+
+
+def test_convert_custom_gfunction(tmp_path):
+    custom_gfunction = CustomGFunction(depth_array=np.array([50, 100]), options={"method": "equivalent"})
+    custom_gfunction.create_custom_dataset(gt.boreholes.rectangle_field(2, 2, 6, 6, 100, 4, 0.075), 2. * 10 ** -6)
+    custom_gfunction.dump_custom_dataset(str(tmp_path) + "/", "legacy", legacy=True)
+    convert_custom_gfunction(str(tmp_path / "legacy.gvalues"), str(tmp_path) + "/", "converted")
+    converted = load_custom_gfunction(str(tmp_path / "converted.gvd"))
+    assert converted == custom_gfunction
+    assert np.allclose(converted.calculate_gfunction([4000, 8000], 75), custom_gfunction.calculate_gfunction([4000, 8000], 75))
 
 
 def test_set_options():
@@ -77,8 +152,11 @@ def test_set_options():
     assert custom_gfunction.options["method"] == "equivalentt"
 
 
-def test_load_custom_gfunction():
-    assert isinstance(load_custom_gfunction("test.gvalues"), CustomGFunction)
+def test_load_custom_gfunction(custom_gfunction, tmp_path):
+    custom_gfunction.dump_custom_dataset(str(tmp_path) + "/", "test", legacy=True)
+    loaded_custom_gfunction = load_custom_gfunction(str(tmp_path / "test.gvalues"))
+    assert isinstance(loaded_custom_gfunction, CustomGFunction)
+    assert loaded_custom_gfunction == custom_gfunction
 
 
 def test_check():
@@ -129,10 +207,11 @@ def test_within_range(custom_gfunction):
     assert not custom_gfunction.within_range(time_array, 50)
 
 
-def test_gfunction_calculation(custom_gfunction):
+def test_gfunction_calculation(custom_gfunction, tmp_path):
     assert np.isclose(0.03586207, custom_gfunction.calculate_gfunction(4000, 100, True)[0])
     assert np.allclose(np.array([0.03586207, 0.1343308]), custom_gfunction.calculate_gfunction([4000, 8000], 100, True))
     # test with loading
-    loaded_custom_gfunction = load_custom_gfunction("test.gvalues")
+    custom_gfunction.dump_custom_dataset(str(tmp_path) + "/", "test")
+    loaded_custom_gfunction = load_custom_gfunction(str(tmp_path / "test.gvd"))
     assert np.isclose(0.03586207, loaded_custom_gfunction.calculate_gfunction(4000, 100, True)[0])
     assert np.allclose(np.array([0.03586207, 0.1343308]), loaded_custom_gfunction.calculate_gfunction([4000, 8000], 100, True))
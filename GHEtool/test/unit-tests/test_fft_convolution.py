@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from scipy.signal import convolve
+
+from GHEtool.VariableClasses import FFTConvolution
+
+
+def test_convolve_equal_to_scipy():
+    load = np.random.default_rng(0).uniform(-100, 100, 8760)
+    g_value_differences = np.diff(np.log(np.arange(1, 8762)), prepend=0)[:8760]
+    convolution = FFTConvolution()
+    assert np.allclose(convolution.convolve(load, g_value_differences),
+                       convolve(load, g_value_differences)[:8760])
+
+
+def test_padded_length():
+    assert FFTConvolution.padded_length(12) >= 23
+    assert FFTConvolution.padded_length(8760) >= 2 * 8760 - 1
+
+
+def test_spectrum_is_reused():
+    load = np.arange(24, dtype=np.float64)
+    convolution = FFTConvolution()
+    spectrum = convolution.load_spectrum(load)
+    assert convolution.load_spectrum(np.arange(24, dtype=np.float64)) is spectrum
+    # the stored load is a copy, so changing the original array invalidates the spectrum
+    load[5] = 100
+    assert convolution.load_spectrum(load) is not spectrum
+    assert np.allclose(convolution.convolve(load, np.ones(24)), np.cumsum(load))
+
+
+def test_multiple_lengths():
+    convolution = FFTConvolution()
+    monthly = convolution.load_spectrum(np.ones(12))
+    hourly = convolution.load_spectrum(np.ones(8760))
+    assert convolution.load_spectrum(np.ones(12)) is monthly
+    assert convolution.load_spectrum(np.ones(8760)) is hourly
+    convolution.clear()
+    assert convolution.load_spectrum(np.ones(12)) is not monthly
+
+
+def test_convolve_shorter_g_values():
+    convolution = FFTConvolution()
+    assert np.allclose(convolution.convolve(np.ones(10), np.array([1., 1.])),
+                       convolve(np.ones(10), np.array([1., 1.]))[:10])
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from GHEtool.VariableClasses import AndersonAcceleration, AitkenAcceleration, NoAcceleration, \
+    FIXED_POINT_ACCELERATIONS
+
+# linear contraction F(x) = A x + b with a spectral radius of 0.9
+A = np.array([[0.9, 0.05, 0.], [0., 0.5, 0.1], [0., 0., 0.2]])
+b = np.array([1., 2., 3.])
+solution = np.linalg.solve(np.eye(3) - A, b)
+
+
+def iterate(accelerator, x, atol=1e-10, max_nb_of_iterations=1000) -> int:
+    for i in range(max_nb_of_iterations):
+        fx = A @ x + b
+        if np.max(np.abs(fx - x)) < atol:
+            return i
+        x = accelerator(x, fx)
+    return max_nb_of_iterations
+
+
+def test_no_acceleration():
+    accelerator = NoAcceleration()
+    assert np.array_equal(accelerator(np.zeros(3), b), b)
+    assert iterate(accelerator, np.zeros(3)) > 100
+
+
+@pytest.mark.parametrize("accelerator", [AndersonAcceleration(), AitkenAcceleration()])
+def test_acceleration(accelerator):
+    assert iterate(accelerator, np.zeros(3)) < iterate(NoAcceleration(), np.zeros(3)) / 3
+    # start again from another initial value
+    accelerator.reset()
+    assert iterate(accelerator, np.ones(3) * 50) < 30
+
+
+def test_anderson_linear():
+    # for a linear map in n dimensions, Anderson acceleration with a memory of n converges in n + 1 iterations
+    accelerator = AndersonAcceleration(memory=3)
+    x = np.zeros(3)
+    for _ in range(4):
+        x = accelerator(x, A @ x + b)
+    assert np.allclose(x, solution)
+
+
+def test_aitken_scalar():
+    # for a linear map in one dimension, Aitken's method is exact after the second iteration
+    accelerator = AitkenAcceleration()
+    x = np.array([0.])
+    for _ in range(2):
+        x = accelerator(x, 0.9 * x + 1)
+    assert np.allclose(x, [10])
+
+
+def test_anderson_memory():
+    accelerator = AndersonAcceleration(memory=2)
+    x = np.zeros(3)
+    for _ in range(5):
+        x = accelerator(x, A @ x + b)
+    assert len(accelerator._delta_fx) == 2
+    accelerator.reset()
+    assert accelerator._delta_fx == []
+
+
+def test_names():
+    assert set(FIXED_POINT_ACCELERATIONS) == {'none', 'anderson', 'aitken'}
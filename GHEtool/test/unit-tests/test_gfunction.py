@@ -1,5 +1,7 @@
 import copy
+import pickle
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import numpy as np
 import pygfunction as gt
@@ -458,3 +460,246 @@ def test_negative_values():
     g_func = gfunc.calculate(time, field, 1 / 5000 / 1000, interpolate=False)
     assert np.all(g_func > 0)
     assert np.isclose(np.min(g_func), 0.14299471464245733)
+
+
+def test_cache_alternating_borefields():
+    gfunc = GFunction()
+    alpha = 0.00005
+    time_values = borefield_ghe.load.time_L3
+    field_1 = gt.boreholes.rectangle_field(5, 5, 5, 5, 100, 1, 0.075)
+    field_2 = gt.boreholes.rectangle_field(4, 5, 5, 5, 100, 1, 0.075)
+
+    gfunc_1 = gfunc.calculate(time_values, field_1, alpha)
+    gfunc_2 = gfunc.calculate(time_values, field_2, alpha)
+    assert gfunc.cache_misses == 2
+    assert len(gfunc._cache) == 1
+
+    # switching back should not throw away the data of the second borefield
+    assert np.array_equal(gfunc_1, gfunc.calculate(time_values, field_1, alpha))
+    assert gfunc.cache_hits == 1
+    assert gfunc._check_borefield(field_1)
+    assert np.array_equal(gfunc_2, gfunc.calculate(time_values, field_2, alpha))
+    assert gfunc.cache_hits == 2
+    assert gfunc.cache_misses == 2
+
+    # other alpha
+    gfunc.calculate(time_values, field_2, alpha * 2)
+    assert gfunc.cache_misses == 3
+    assert len(gfunc._cache) == 2
+
+    gfunc.clear_cache()
+    assert len(gfunc._cache) == 0
+    assert gfunc.cache_hits == 0
+    gfunc.calculate(time_values, field_2, alpha)
+    assert gfunc.cache_misses == 1
+
+
+def test_coarse_time_values_not_interpolated():
+    alpha = 2 / 2.4 / 10 ** 6
+    time_values = np.array([3600 * 6, 3600 * 730, 3600 * 8760 * 20])
+    other_time_values = np.array([3600 * 6, 3600 * 730 * 2, 3600 * 8760 * 10])
+    gfunc = GFunction()
+    gfunc.calculate(time_values, borefield, alpha)
+    # the dataset of another load is kept in the cache when the borefield is changed and changed back
+    gfunc.calculate(time_values, borefield_less_deep[:4], alpha)
+    # but it is not used for other time values, since it is too coarse to interpolate in
+    assert np.allclose(gfunc.calculate(other_time_values, borefield, alpha),
+                       GFunction().calculate(other_time_values, borefield, alpha))
+
+
+def test_cache_remove_previous_data():
+    gfunc = GFunction()
+    alpha = 0.00005
+    time_values = borefield_ghe.load.time_L3
+    field = gt.boreholes.rectangle_field(5, 5, 5, 5, 100, 1, 0.075)
+
+    gfunc.calculate(time_values, field, alpha)
+    gfunc.remove_previous_data()
+    assert not np.any(gfunc.depth_array)
+    assert len(gfunc._cache) == 0
+
+    gfunc.calculate(time_values, field, alpha)
+    gfunc.remove_previous_data(store_in_cache=True)
+    assert not np.any(gfunc.depth_array)
+    assert len(gfunc._cache) == 1
+    gfunc.calculate(time_values, field, alpha)
+    assert gfunc.cache_hits == 1
+    assert np.array_equal(gfunc.depth_array, [100])
+
+
+def test_cache_dimensionless():
+    gfunc = GFunction()
+    alpha = 0.00005
+    time_values = borefield_ghe.load.time_L3
+    field = gt.boreholes.rectangle_field(5, 5, 5, 5, 100, 1, 0.075)
+    field_scaled = gt.boreholes.rectangle_field(5, 5, 10, 10, 200, 2, 0.15)
+    assert gfunc._cache_key(field, alpha) != gfunc._cache_key(field_scaled, alpha * 2)
+    gfunc.dimensionless_cache = True
+    assert gfunc._cache_key(field, alpha) == gfunc._cache_key(field_scaled, alpha * 2)
+    assert gfunc._cache_key(field, alpha) != gfunc._cache_key(gt.boreholes.rectangle_field(5, 5, 6, 5, 100, 1, 0.075),
+                                                             alpha)
+
+    gvalues = gfunc.calculate(time_values, field, alpha)
+    # a scaled borefield with the same dimensionless time
+    assert np.allclose(gfunc.calculate(time_values, field_scaled, alpha * 4), gvalues)
+    assert gfunc.cache_misses == 1 and gfunc.cache_hits == 1
+    assert np.array_equal(gfunc.depth_array, [200])
+
+    # other alphas are interpolated in the rescaled dataset
+    for alpha_new in np.linspace(alpha, alpha * 1.5, 5):
+        assert np.allclose(gfunc.calculate(time_values, field, alpha_new),
+                           GFunction().calculate(time_values, field, alpha_new), rtol=1e-3)
+    assert gfunc.cache_misses == 1
+    # the time values are not covered
+    gfunc.calculate(time_values, field, alpha * 10)
+    assert gfunc.cache_misses == 2
+
+
+def test_cache_memory_limit():
+    gfunc = GFunction()
+    alpha = 0.00005
+    time_values = borefield_ghe.load.time_L3
+    field_1 = gt.boreholes.rectangle_field(5, 5, 5, 5, 100, 1, 0.075)
+    field_2 = gt.boreholes.rectangle_field(4, 5, 5, 5, 100, 1, 0.075)
+    field_3 = gt.boreholes.rectangle_field(3, 5, 5, 5, 100, 1, 0.075)
+
+    gfunc.calculate(time_values, field_1, alpha)
+    memory = gfunc.cache_memory_usage
+    assert memory > 0
+    gfunc.cache_memory_limit = memory * 2.5
+    gfunc.calculate(time_values, field_2, alpha)
+    gfunc.calculate(time_values, field_3, alpha)
+    # the least recently used dataset is removed
+    assert len(gfunc._cache) == 1
+    assert gfunc._cache_key(field_2, alpha) in gfunc._cache
+    assert gfunc.cache_memory_usage <= gfunc.cache_memory_limit
+
+
+def test_prefetch():
+    gfunc = GFunction()
+    alpha = 0.00005
+    time_values = borefield_ghe.load.time_L3
+    field = gt.boreholes.rectangle_field(5, 5, 5, 5, 100, 1, 0.075)
+
+    # nothing to add the g-values to
+    gfunc.prefetch(time_values, field, alpha, [90])
+    assert not gfunc._prefetched
+    gfunc.calculate(time_values, field, alpha)
+    gfunc.prefetch(time_values, field, alpha, [90])
+    assert list(gfunc._prefetched) == [90]
+    # only one depth at the same time
+    gfunc.prefetch(time_values, field, alpha, [80])
+    assert list(gfunc._prefetched) == [90]
+    # the prefetched object can be pickled
+    assert not pickle.loads(pickle.dumps(gfunc))._prefetched
+
+    field_95 = gt.boreholes.rectangle_field(5, 5, 5, 5, 95, 1, 0.075)
+    gvalues = gfunc.calculate(time_values, field_95, alpha)
+    assert gfunc.cache_misses == 1
+    assert np.array_equal(gfunc.depth_array, [90, 100])
+    assert np.allclose(gvalues, GFunction().calculate(time_values, field_95, alpha), rtol=1e-3)
+
+    # depths that can already be interpolated are skipped
+    gfunc.prefetch(time_values, field, alpha, [95])
+    assert not gfunc._prefetched
+    gfunc.prefetch(time_values, field, alpha, [70])
+    gfunc.stop_prefetch()
+    # the background process is kept for the next prefetch
+    assert not gfunc._prefetched and gfunc._prefetch_executor is not None
+    gfunc.stop_prefetch(shutdown=True)
+    assert gfunc._prefetch_executor is None
+
+
+def test_prefetch_lock(monkeypatch):
+    gfunc = GFunction()
+    alpha = 0.00005
+    time_values = borefield_ghe.load.time_L3
+    gfunc.calculate(time_values, gt.boreholes.rectangle_field(5, 5, 5, 5, 100, 1, 0.075), alpha)
+    future = Future()
+    gfunc._prefetched[90] = (future, gfunc.borefield, alpha, gfunc.time_array)
+
+    # the g-values of 95 m wait for the prefetch of 90 m, without holding the lock
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        result = executor.submit(gfunc.calculate, time_values, gt.boreholes.rectangle_field(5, 5, 5, 5, 95, 1, 0.075),
+                                 alpha)
+        time.sleep(0.5)
+        assert not result.done()
+        assert gfunc._lock.acquire(timeout=1)
+        gfunc._lock.release()
+        gvalues_90 = GFunction().calculate(gfunc.time_array, gt.boreholes.rectangle_field(5, 5, 5, 5, 90, 1, 0.075),
+                                           alpha)
+        future.set_result(gvalues_90)
+        gvalues = result.result()
+    assert np.array_equal(gfunc.depth_array, [90, 100])
+    assert gfunc.cache_misses == 1
+    assert np.allclose(gvalues, GFunction().calculate(time_values, gt.boreholes.rectangle_field(5, 5, 5, 5, 95, 1,
+                                                                                              0.075), alpha), rtol=1e-3)
+
+
+def test_threads():
+    gfunc = GFunction()
+    alpha = 0.00005
+    time_values = borefield_ghe.load.time_L3
+    fields = [gt.boreholes.rectangle_field(5, 5, 5, 5, depth, 1, 0.075) for depth in (100, 90, 95, 80, 110, 85)]
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(lambda field: gfunc.calculate(time_values, field, alpha), fields))
+    for field, gvalues in zip(fields, results):
+        assert np.allclose(gvalues, GFunction().calculate(time_values, field, alpha), rtol=1e-2)
+    # the lock is not pickled, but a new one is created
+    unpickled = pickle.loads(pickle.dumps(gfunc))
+    assert unpickled._lock is not gfunc._lock
+    assert np.allclose(unpickled.calculate(time_values, fields[0], alpha), results[0])
+    assert copy.deepcopy(gfunc)._lock is not gfunc._lock
+
+
+def test_threads_search_state():
+    gfunc = GFunction()
+    alpha = 0.00005
+    time_values = borefield_ghe.load.time_L3
+    gfunc.calculate(time_values, gt.boreholes.rectangle_field(5, 5, 5, 5, 100, 1, 0.075), alpha)
+    fifo_list_main = list(gfunc.fifo_list.fifo_list)
+    # the previous depth of another thread is not reused
+    field = gt.boreholes.rectangle_field(5, 5, 5, 5, 100.5, 1, 0.075)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        gvalues, previous_depth, fifo_list = executor.submit(
+            lambda: (gfunc.calculate(time_values, field, alpha), gfunc.previous_depth,
+                     list(gfunc.fifo_list.fifo_list))).result()
+    assert previous_depth == 100.5 and fifo_list == [100.5]
+    assert np.array_equal(gvalues, GFunction().calculate(time_values, field, alpha))
+    assert gfunc.previous_depth == 100
+    assert gfunc.fifo_list.fifo_list == fifo_list_main
+    # the search state of the current thread is pickled
+    gfunc.fifo_list.add(90)
+    unpickled = pickle.loads(pickle.dumps(gfunc))
+    assert unpickled.previous_depth == 100
+    assert unpickled.fifo_list.fifo_list == fifo_list_main + [90]
+
+
+def test_threads_in_flight(monkeypatch):
+    calls = []
+    g_function = gt.gfunction.gFunction
+
+    def slow_g_function(*args, **kwargs):
+        calls.append(args)
+        time.sleep(2)
+        return g_function(*args, **kwargs)
+
+    monkeypatch.setattr(gt.gfunction, "gFunction", slow_g_function)
+    alpha = 0.00005
+    time_values = borefield_ghe.load.time_L3
+    gfunc = GFunction()
+    # the same g-values are only calculated once, while the other thread waits for them
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(lambda _: gfunc.calculate(time_values, borefield, alpha), range(2)))
+    assert len(calls) == 1
+    assert np.array_equal(results[0], results[1])
+    assert not gfunc._in_flight
+
+    # other g-values are calculated at the same time, so this takes less than two times the delay
+    fields = [gt.boreholes.rectangle_field(2, 1, 5, 5, 100, 1, 0.075),
+              gt.boreholes.rectangle_field(1, 3, 5, 5, 100, 1, 0.075)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(lambda field: gfunc.calculate(time_values, field, alpha), fields))
+    assert time.perf_counter() - start < 3.5
+    assert len(calls) == 3
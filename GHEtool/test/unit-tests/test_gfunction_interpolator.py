@@ -0,0 +1,65 @@
+import pickle
+
+import numpy as np
+import pytest
+from scipy import interpolate
+
+from GHEtool.VariableClasses import CustomGFunction, GFunctionInterpolator
+
+depth_array = np.array([50., 100., 150., 200.])
+time_array = np.array([3600., 3600 * 24, 3600 * 8760, 3600 * 8760 * 10])
+gvalues_array = np.array([[1., 2., 4., 5.],
+                          [1.5, 3., 5., 7.],
+                          [2., 3.5, 6., 8.],
+                          [2.5, 4., 7., 9.]])
+
+
+@pytest.mark.parametrize("depth", [50, 75.3, 100, 163.2, 200])
+def test_equal_to_interpn(depth):
+    interpolator = GFunctionInterpolator()
+    time_values = np.linspace(3600, 3600 * 8760 * 10, 50)
+    assert np.allclose(interpolator(depth_array, time_array, gvalues_array, depth, time_values),
+                       interpolate.interpn((depth_array, time_array), gvalues_array,
+                                           np.array([[depth, t] for t in time_values])))
+
+
+def test_single_value():
+    interpolator = GFunctionInterpolator()
+    assert np.allclose(interpolator(depth_array, time_array, gvalues_array, 125, 3600 * 24), [3.25])
+    assert interpolator(depth_array, time_array, gvalues_array, 125, 3600 * 24).shape == (1,)
+
+
+def test_one_depth():
+    interpolator = GFunctionInterpolator()
+    assert np.allclose(interpolator(depth_array[:1], time_array, gvalues_array[0], 50, [3600, 3600 * 12.5]),
+                       [1, 1.5])
+
+
+def test_out_of_bounds():
+    interpolator = GFunctionInterpolator()
+    with pytest.raises(ValueError):
+        interpolator(depth_array, time_array, gvalues_array, 210, time_array)
+    with pytest.raises(ValueError):
+        interpolator(depth_array, time_array, gvalues_array, 100, [3600 * 8760 * 11])
+
+
+def test_cached_brackets():
+    interpolator = GFunctionInterpolator()
+    time_values = np.linspace(3600, 3600 * 8760 * 10, 50)
+    interpolator(depth_array, time_array, gvalues_array, 125, time_values)
+    indices, weights = interpolator.time_bracket(time_array, time_values)
+    # the same time values at another depth reuse the brackets
+    interpolator(depth_array, time_array, gvalues_array, 175, time_values)
+    assert interpolator.time_bracket(time_array, time_values)[0] is indices
+    assert interpolator.depth_bracket(depth_array, 175) == (2, 0.5)
+    # other time values are searched again
+    assert interpolator.time_bracket(time_array, time_values[:10])[0] is not indices
+
+
+def test_custom_gfunction_pickle():
+    custom_gfunction = CustomGFunction(time_array, depth_array)
+    custom_gfunction.gvalues_array = gvalues_array
+    assert np.allclose(custom_gfunction.calculate_gfunction([3600, 3600 * 24], 125), [1.75, 3.25])
+    unpickled = pickle.loads(pickle.dumps(custom_gfunction))
+    assert unpickled == custom_gfunction
+    assert np.allclose(unpickled.calculate_gfunction([3600, 3600 * 24], 125), [1.75, 3.25])
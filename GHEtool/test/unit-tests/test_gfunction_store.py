@@ -0,0 +1,143 @@
+import os
+import pickle
+
+import numpy as np
+import pygfunction as gt
+
+from GHEtool import Borefield, GroundConstantTemperature
+from GHEtool.VariableClasses import GFunction, GFunctionStore
+
+time_values = np.array([3600, 3600 * 24, 3600 * 8760, 3600 * 8760 * 10])
+alpha = 0.00005
+
+
+def test_save_load(tmp_path):
+    store = GFunctionStore(tmp_path)
+    borefield = gt.boreholes.rectangle_field(3, 3, 5, 5, 100, 1, 0.075)
+    assert store.load(time_values, borefield, alpha, {'method': 'equivalent'}) is None
+    store.save(time_values, borefield, alpha, {'method': 'equivalent'}, np.array([1., 2., 3., 4.]))
+    assert len(store) == 1
+    assert np.array_equal(store.load(time_values, borefield, alpha, {'method': 'equivalent'}), [1, 2, 3, 4])
+    # another process uses the same directory
+    assert np.array_equal(GFunctionStore(tmp_path).load(time_values, borefield, alpha, {'method': 'equivalent'}),
+                          [1, 2, 3, 4])
+    # no temporary files are left behind
+    assert not [file for _, _, files in os.walk(tmp_path) for file in files if file.endswith(".tmp")]
+
+
+def test_key(tmp_path):
+    store = GFunctionStore(tmp_path)
+    borefield = gt.boreholes.rectangle_field(3, 3, 5, 5, 100, 1, 0.075)
+    store.save(time_values, borefield, alpha, {'method': 'equivalent'}, np.array([1., 2., 3., 4.]))
+
+    # round-off does not matter
+    assert store.load(time_values, borefield, alpha * (1 + 1e-15), {'method': 'equivalent'}) is not None
+    # other depth, alpha, options, time values or geometry
+    assert store.load(time_values, gt.boreholes.rectangle_field(3, 3, 5, 5, 110, 1, 0.075), alpha,
+                      {'method': 'equivalent'}) is None
+    assert store.load(time_values, borefield, alpha * 2, {'method': 'equivalent'}) is None
+    assert store.load(time_values, borefield, alpha, {'method': 'similarities'}) is None
+    assert store.load(time_values[:-1], borefield, alpha, {'method': 'equivalent'}) is None
+    assert store.load(time_values, gt.boreholes.rectangle_field(3, 3, 6, 5, 100, 1, 0.075), alpha,
+                      {'method': 'equivalent'}) is None
+
+
+def test_table(tmp_path):
+    store = GFunctionStore(tmp_path)
+    depths, gvalues = store.load_table(time_values, gt.boreholes.rectangle_field(3, 3, 5, 5, 100, 1, 0.075), alpha,
+                                       {'method': 'equivalent'})
+    assert depths.size == 0 and gvalues.shape == (0, 4)
+    for depth in (110, 100, 90):
+        store.save(time_values, gt.boreholes.rectangle_field(3, 3, 5, 5, depth, 1, 0.075), alpha,
+                   {'method': 'equivalent'}, np.full(4, depth / 10))
+    # the depth of the borefield does not matter for the table
+    depths, gvalues = store.load_table(time_values, gt.boreholes.rectangle_field(3, 3, 5, 5, 105, 1, 0.075), alpha,
+                                       {'method': 'equivalent'})
+    assert np.array_equal(depths, [90, 100, 110])
+    assert np.array_equal(gvalues, [np.full(4, 9), np.full(4, 10), np.full(4, 11)])
+    # the table belongs to the time values, thermal diffusivity, options and geometry
+    assert store.load_table(time_values[:-1], gt.boreholes.rectangle_field(3, 3, 5, 5, 100, 1, 0.075), alpha,
+                            {'method': 'equivalent'})[0].size == 0
+    assert store.load_table(time_values, gt.boreholes.rectangle_field(3, 3, 5, 5, 100, 1, 0.075), alpha,
+                            {'method': 'similarities'})[0].size == 0
+    # boreholes with other relative depths are another borefield
+    borefield = gt.boreholes.rectangle_field(3, 3, 5, 5, 100, 1, 0.075)
+    borefield[0].H = 50
+    assert store.load_table(time_values, borefield, alpha, {'method': 'equivalent'})[0].size == 0
+
+
+def test_save_existing(tmp_path, monkeypatch):
+    store = GFunctionStore(tmp_path)
+    borefield = gt.boreholes.rectangle_field(3, 3, 5, 5, 100, 1, 0.075)
+    store.save(time_values, borefield, alpha, {'method': 'equivalent'}, np.array([1., 2., 3., 4.]))
+    stored = store.load(time_values, borefield, alpha, {'method': 'equivalent'})
+
+    def replace(*args):
+        # like on Windows, where a memory-mapped file cannot be replaced
+        raise PermissionError
+
+    monkeypatch.setattr(os, "replace", replace)
+    # the g-values are already in the store, so they are not written again
+    store.save(time_values, borefield, alpha, {'method': 'equivalent'}, np.array([5., 6., 7., 8.]))
+    assert np.array_equal(stored, [1, 2, 3, 4])
+    # a failing write is skipped without leaving temporary files
+    store.save(time_values, gt.boreholes.rectangle_field(3, 3, 5, 5, 110, 1, 0.075), alpha,
+               {'method': 'equivalent'}, np.array([5., 6., 7., 8.]))
+    assert len(store) == 1
+    assert not [file for _, _, files in os.walk(tmp_path) for file in files if file.endswith(".tmp")]
+
+
+def test_gfunction_interpolates_stored_depths(tmp_path, monkeypatch):
+    gfunc = GFunction()
+    gfunc.store = GFunctionStore(tmp_path)
+    for depth in (100, 110):
+        gfunc.calculate(time_values, gt.boreholes.rectangle_field(3, 3, 5, 5, depth, 1, 0.075), alpha)
+    assert len(gfunc.store) == 2
+    expected = GFunction().calculate(time_values, gt.boreholes.rectangle_field(3, 3, 5, 5, 105, 1, 0.075), alpha)
+
+    # a new process interpolates between the depths that are calculated by another one
+    def g_function(*args, **kwargs):
+        raise AssertionError('the g-values should be interpolated')
+
+    monkeypatch.setattr(gt.gfunction, "gFunction", g_function)
+    gfunc_new = GFunction()
+    gfunc_new.store = GFunctionStore(tmp_path)
+    gvalues = gfunc_new.calculate(time_values, gt.boreholes.rectangle_field(3, 3, 5, 5, 105, 1, 0.075), alpha)
+    assert np.allclose(gvalues, expected, rtol=1e-2)
+    assert gfunc_new.cache_hits == 1 and gfunc_new.cache_misses == 0
+    assert np.array_equal(gfunc_new.depth_array, [100, 110])
+
+
+def test_gfunction_with_store(tmp_path):
+    borefield = gt.boreholes.rectangle_field(3, 3, 5, 5, 100, 1, 0.075)
+    gfunc = GFunction()
+    gfunc.store = GFunctionStore(tmp_path)
+    gvalues = gfunc.calculate(time_values, borefield, alpha)
+    assert len(gfunc.store) == 1
+    assert np.allclose(gvalues, gfunc.store.load(time_values, borefield, alpha, gfunc.options))
+
+    # a new object reads the values from the store
+    gfunc_new = GFunction()
+    gfunc_new.store = GFunctionStore(tmp_path / "other")
+    gfunc_new.store.save(time_values, borefield, alpha, gfunc_new.options, gvalues * 2)
+    assert np.allclose(gfunc_new.calculate(time_values, borefield, alpha), gvalues * 2)
+    assert pickle.loads(pickle.dumps(gfunc_new)).store.directory == gfunc_new.store.directory
+
+
+def test_borefield_set_gfunction_store(tmp_path):
+    borefield = Borefield()
+    borefield.ground_data = GroundConstantTemperature(3, 10)
+    borefield.create_rectangular_borefield(3, 3, 5, 5, 100, 1, 0.075)
+    borefield.set_gfunction_store(tmp_path)
+    gvalues = borefield.gfunction(time_values, 100)
+    assert len(borefield.gfunction_calculation_object.store) == 1
+
+    borefield_new = Borefield()
+    borefield_new.ground_data = GroundConstantTemperature(3, 10)
+    borefield_new.create_rectangular_borefield(3, 3, 5, 5, 100, 1, 0.075)
+    borefield_new.set_gfunction_store(tmp_path)
+    assert np.allclose(borefield_new.gfunction(time_values, 100), gvalues)
+    assert len(borefield_new.gfunction_calculation_object.store) == 1
+
+    borefield_new.set_gfunction_store(None)
+    assert borefield_new.gfunction_calculation_object.store is None
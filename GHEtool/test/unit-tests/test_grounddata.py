@@ -231,6 +231,38 @@ def test_multilayer_values():
     assert 2400000.0 == constant.volumetric_heat_capacity(30)
 
 
+def test_multilayer_arrays():
+    constant = GroundConstantTemperature(3, 10)
+    depths = np.array([-5, 0, 10, 50, 150.])
+    assert np.array_equal(constant.k_s(depths), np.full(5, 3))
+    constant = GroundFluxTemperature(T_g=10)
+    constant.add_layer_on_bottom([GroundLayer(1, 2 * 10 ** 6, 10), GroundLayer(2, 2.2 * 10 ** 6, 15),
+                                  GroundLayer(1.5, 2.4 * 10 ** 6, 20), GroundLayer(3, 2.5 * 10 ** 6, None)])
+    depths = np.linspace(-5, 300, 62)
+    # equal to the average over the layers for a single depth
+    for method in (constant.k_s, constant.volumetric_heat_capacity, constant.alpha, constant.calculate_Tg):
+        assert np.allclose(method(depths), [method(depth) for depth in depths])
+    thickness = [0, 10, 15, 20, None]
+    for name in ('k_s', 'volumetric_heat_capacity'):
+        values = [getattr(layer, name) for layer in constant.layers]
+        assert np.allclose(getattr(constant, name)(depths),
+                           [constant.calculate_value(thickness, constant.layer_depths, values, depth)
+                            for depth in depths])
+    # the layer tables are updated when a layer is added
+    assert np.isclose(constant.k_s(5), 1)
+    constant.add_layer_on_top(GroundLayer(4, thickness=5))
+    assert np.isclose(constant.k_s(5), 4)
+    assert np.isclose(constant.k_s(np.array([5, 15]))[1], (4 * 5 + 1 * 10) / 15)
+    # and when the layers are edited in place
+    constant.layers[0].k_s = 5
+    assert np.isclose(constant.k_s(5), 5)
+    constant.layers[1].volumetric_heat_capacity = 3 * 10 ** 6
+    assert np.isclose(constant.volumetric_heat_capacity(np.array([5, 15]))[1], (2.4 * 5 + 3 * 10) / 15 * 10 ** 6)
+    constant.layers = [GroundLayer(2, thickness=None)]
+    constant.layer_depths = [0]
+    assert np.isclose(constant.k_s(100), 2)
+
+
 def test_repr_():
     ground_flux_temperature = GroundFluxTemperature(3, 11, 2.4 * 10 ** 6, 0.06)
     ground_constant_temperature = GroundConstantTemperature(3, 11)
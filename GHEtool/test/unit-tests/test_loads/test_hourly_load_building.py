@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 import matplotlib.pyplot as plt
@@ -691,3 +693,45 @@ def test_repr_():
            'First month of simulation [-]: 1\n' \
            'DHW demand [kWh/year]: 10000\n' \
            'Efficiency DHW: SCOP [-]: 4' == load.__repr__()
+
+
+def test_cached_properties():
+    load = HourlyBuildingLoad(efficiency_heating=cop_basic, efficiency_cooling=eer_basic)
+    load.hourly_heating_load = test_load
+    load.hourly_cooling_load = test_load
+    load.simulation_period = 10
+    load.set_results(results_hourly_test)
+    extraction = load.hourly_extraction_load_simulation_period
+    # the derived properties are memoised
+    assert load.hourly_extraction_load_simulation_period is extraction
+    assert load.monthly_peak_extraction_simulation_period is load.monthly_peak_extraction_simulation_period
+
+    # other temperature results
+    load.set_results(ResultsHourly(results_hourly_test.Tb + 2, results_hourly_test.Tf + 2))
+    assert not np.allclose(load.hourly_extraction_load_simulation_period, extraction)
+    load.set_results(results_hourly_test)
+    assert np.allclose(load.hourly_extraction_load_simulation_period, extraction)
+
+    # other efficiency
+    load.cop = scop
+    assert np.allclose(load.hourly_extraction_load_simulation_period, test_load_sim_per * (1 - 1 / 6))
+
+    # other start month and simulation period
+    load.start_month = 2
+    fresh = HourlyBuildingLoad(test_load, test_load, 10, scop, eer_basic)
+    fresh.start_month = 2
+    assert np.allclose(load.hourly_heating_load_simulation_period, fresh.hourly_heating_load_simulation_period)
+    assert not np.allclose(load.hourly_heating_load_simulation_period, test_load_sim_per)
+    load.reset_results(0, 10)
+    load.simulation_period = 5
+    assert len(load.hourly_heating_load_simulation_period) == 8760 * 5
+
+    # in-place modification of the load
+    peak = load.max_peak_heating
+    load._hourly_heating_load[0] = peak + 10
+    load.clear_cache()
+    assert load.max_peak_heating == peak + 10
+
+    # the memoised values are not pickled
+    assert '_cache' not in pickle.loads(pickle.dumps(load)).__dict__
+    assert pickle.loads(pickle.dumps(load)) == load
@@ -56,6 +56,25 @@ def test_resample_to_monthly():
                                               275892., 276088., 258920., 276144., 258880., 276200.]))
 
 
+@pytest.mark.parametrize("all_months_equal", [True, False])
+def test_resample_to_monthly_stack(all_months_equal):
+    load = HourlyGeothermalLoad()
+    load.all_months_equal = all_months_equal
+    hourly = np.random.default_rng(0).random((3, 8760 * 5))
+    peak, baseload = load.resample_to_monthly(hourly)
+    assert peak.shape == baseload.shape == (3, 60)
+    for row in range(3):
+        peak_row, baseload_row = load.resample_to_monthly(hourly[row])
+        assert np.array_equal(peak[row], peak_row)
+        assert np.allclose(baseload[row], baseload_row)
+        data = np.array_split(hourly[row], np.cumsum(np.tile(load.UPM, 5))[:-1])
+        assert np.array_equal(peak_row, [np.max(i) for i in data])
+        assert np.allclose(baseload_row, [np.sum(i) for i in data])
+    # the month boundaries are memoised per length
+    assert load._month_boundaries(8760 * 5) is load._month_boundaries(8760 * 5)
+    assert len(load._month_boundaries(8760)) == 12
+
+
 def test_yearly_loads():
     load = HourlyGeothermalLoad(extraction_load=np.linspace(0, 8759, 8760),
                                 injection_load=np.linspace(0, 8759, 8760) * 2,
@@ -413,3 +413,18 @@ def test_repr_():
            'Peak extraction duration [hour]: 6.0\n' \
            'Simulation period [year]: 20\n' \
            'First month of simulation [-]: 1' == load.__repr__()
+
+
+def test_cached_properties():
+    load = MonthlyGeothermalLoadAbsolute(*load_case(1))
+    imbalance = load.imbalance
+    average_power = load.monthly_average_injection_power_simulation_period
+    assert load.monthly_average_injection_power_simulation_period is average_power
+    load.baseload_injection = load.baseload_injection * 2
+    assert load.imbalance > imbalance
+    assert len(load.time_L3) == 240
+    load.simulation_period = 10
+    assert len(load.time_L3) == 120
+    assert len(load.monthly_average_injection_power_simulation_period) == 120
+    load.all_months_equal = False
+    assert load.UPM[1] == 672
@@ -1,5 +1,7 @@
 # noinspection PyPackageRequirements
 import copy
+import os
+import threading
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -7,12 +9,17 @@ import pygfunction as gt
 import pytest
 
 from GHEtool import GroundConstantTemperature, GroundFluxTemperature, FluidData, DoubleUTube, Borefield, \
-    CalculationSetup, FOLDER, MultipleUTube, EERCombined
+    CalculationSetup, FOLDER, MultipleUTube, EERCombined, ResultsMonthly, COP, SCOP
 from GHEtool.logger import ghe_logger
 from GHEtool.Validation.cases import load_case
 from GHEtool.VariableClasses.LoadData import MonthlyGeothermalLoadAbsolute, HourlyGeothermalLoad, HourlyBuildingLoad, \
-    HourlyBuildingLoadMultiYear
-from GHEtool.VariableClasses.BaseClass import UnsolvableDueToTemperatureGradient
+    HourlyBuildingLoadMultiYear, MonthlyBuildingLoadMultiYear
+from GHEtool.Methods.optimise_load_profile import _MonthlyTemperatureSuperposition, _find_peak_limit, \
+    _find_peak_limits
+from GHEtool.VariableClasses.BaseClass import UnsolvableDueToTemperatureGradient, MaximumNumberOfIterations, \
+    SizingStopped
+from GHEtool.VariableClasses.FixedPointAcceleration import FIXED_POINT_ACCELERATIONS, NoAcceleration, \
+    AndersonAcceleration, AitkenAcceleration
 
 data = GroundConstantTemperature(3, 10)
 ground_data_constant = data
@@ -186,19 +193,34 @@ def test_create_custom_dataset():
         borefield_test.create_custom_dataset([100, 1000], [50, 100])
 
 
-def test_load_custom_gfunction():
+def test_create_custom_dataset_workers():
+    borefield = Borefield()
+    borefield.set_ground_parameters(ground_data_constant)
+    borefield.create_rectangular_borefield(3, 3, 6, 6, 100, 1, 0.075)
+    borefield.create_custom_dataset(depth_array=[50, 100, 150], workers=2)
+    assert np.all(borefield.custom_gfunction.gvalues_array > 0)
+    assert np.isclose(borefield.gfunction(3600 * 8760, 100)[0],
+                      borefield.custom_gfunction.calculate_gfunction(3600 * 8760, 100)[0])
+
+
+def test_load_custom_gfunction(tmp_path):
     borefield = Borefield()
     borefield.set_ground_parameters(ground_data_constant)
     borefield.borefield = copy.deepcopy(borefield_gt)
     borefield.create_custom_dataset()
-    borefield.custom_gfunction.dump_custom_dataset("./", "test")
+    borefield.custom_gfunction.dump_custom_dataset(str(tmp_path) + "/", "test")
     dataset = copy.copy(borefield.custom_gfunction)
     borefield.borefield = None
     assert borefield.custom_gfunction is None
     borefield.custom_gfunction = dataset
     borefield.set_borefield(None)
     assert borefield.custom_gfunction is None
-    borefield.load_custom_gfunction("./test.gvalues")
+    borefield.load_custom_gfunction(str(tmp_path / "test.gvd"))
+    assert borefield.custom_gfunction == dataset
+
+    # legacy format
+    borefield.custom_gfunction.dump_custom_dataset(str(tmp_path) + "/", "test", legacy=True)
+    borefield.load_custom_gfunction(str(tmp_path / "test.gvalues"))
     assert borefield.custom_gfunction == dataset
 
 
@@ -445,6 +467,72 @@ def test_size_L2(quadrant, result):
     assert np.isclose(result, borefield.H)
 
 
+def _batch_loads() -> list:
+    loads = [np.array(load_case(case), dtype=np.float64) for case in (1, 2, 3, 4)]
+    return [np.array([load[i] for load in loads]) for i in range(4)]
+
+
+@pytest.mark.parametrize("ground_data", [ground_data_constant, data_ground_flux])
+def test_size_L2_batch(ground_data):
+    loads = _batch_loads()
+    borefield = Borefield()
+    borefield.borefield = copy.deepcopy(borefield_gt)
+    borefield.set_ground_parameters(ground_data)
+    depths = borefield.size_L2_batch(*loads, H_init=100)
+    # the depth of the borefield is not changed
+    assert borefield.H == 110
+    for case in range(4):
+        borefield_single = Borefield()
+        borefield_single.borefield = copy.deepcopy(borefield_gt)
+        borefield_single.set_ground_parameters(ground_data)
+        borefield_single.load = MonthlyGeothermalLoadAbsolute(*[load[case] for load in loads])
+        assert np.isclose(depths[case], borefield_single.size_L2(100), rtol=0.005)
+
+
+@pytest.mark.parametrize("quadrant", [1, 2, 3, 4])
+def test_size_L2_batch_quadrant(quadrant):
+    loads = _batch_loads()
+    borefield = Borefield()
+    borefield.borefield = copy.deepcopy(borefield_gt)
+    borefield.set_ground_parameters(ground_data_constant)
+    depths = borefield.size_L2_batch(*loads, H_init=100, quadrant_sizing=quadrant)
+    borefield.load = MonthlyGeothermalLoadAbsolute(*load_case(2))
+    assert np.isclose(depths[1], borefield.size_L2(100, quadrant_sizing=quadrant), rtol=0.005)
+
+
+def test_size_L2_batch_limits_and_durations():
+    loads = [np.repeat(load, 3, axis=0) for load in _batch_loads()]
+    Tf_max = np.repeat([16, 17, 18], 4)
+    durations = np.tile([6, 8, 10, 12], 3)
+    borefield = Borefield()
+    borefield.borefield = copy.deepcopy(borefield_gt)
+    borefield.set_ground_parameters(ground_data_constant)
+    depths = borefield.size_L2_batch(*loads, peak_extraction_duration=durations, peak_injection_duration=durations,
+                                     Tf_max=Tf_max, Tf_min=0, H_init=100)
+    for i in (0, 5, 10, 11):
+        borefield_single = Borefield()
+        borefield_single.borefield = copy.deepcopy(borefield_gt)
+        borefield_single.set_ground_parameters(ground_data_constant)
+        load = MonthlyGeothermalLoadAbsolute(*[load[i] for load in loads])
+        load.peak_extraction_duration = durations[i]
+        load.peak_injection_duration = durations[i]
+        borefield_single.load = load
+        borefield_single.set_max_avg_fluid_temperature(Tf_max[i])
+        assert np.isclose(depths[i], borefield_single.size_L2(100), rtol=0.005)
+
+
+def test_size_L2_batch_errors():
+    borefield = Borefield()
+    loads = _batch_loads()
+    with pytest.raises(ValueError):
+        borefield.size_L2_batch(*loads)
+    borefield.set_ground_parameters(ground_data_constant)
+    with pytest.raises(ValueError):
+        borefield.size_L2_batch(*loads, quadrant_sizing=5)
+    with pytest.raises(ValueError):
+        borefield.size_L2_batch(loads[0][:, :11], *loads[1:])
+
+
 def test_size_L3_value_errors():
     borefield = Borefield()
     with pytest.raises(ValueError):
@@ -1165,3 +1253,562 @@ def test_repr_():
            'Peak extraction duration [hour]: 6.0\n' \
            'Simulation period [year]: 20\n' \
            'First month of simulation [-]: 1' == borefield.__repr__()
+
+
+def test_load_spectrum_reused_during_sizing():
+    borefield = Borefield()
+    borefield.set_ground_parameters(ground_data_constant)
+    borefield.borefield = copy.deepcopy(borefield_gt)
+    load = HourlyGeothermalLoad()
+    load.load_hourly_profile(FOLDER.joinpath("Examples/hourly_profile.csv"))
+    borefield.load = load
+
+    borefield.calculate_temperatures(hourly=True)
+    spectrum = borefield.convolution_object.load_spectrum(load.hourly_net_resulting_injection_power)
+    results = borefield.results.Tf
+    borefield.calculate_temperatures(hourly=True)
+    assert borefield.convolution_object.load_spectrum(load.hourly_net_resulting_injection_power) is spectrum
+    assert np.allclose(results, borefield.results.Tf)
+
+    # a new load results in a new spectrum
+    load.simulation_period = 10
+    borefield.calculate_temperatures(hourly=True)
+    assert len(borefield.results.Tf) == 8760 * 10
+    assert np.allclose(results[:8760 * 10], borefield.results.Tf)
+
+
+@pytest.mark.parametrize("hourly", [False, True])
+def test_calculate_temperatures_batch(hourly):
+    borefield = Borefield()
+    borefield.set_ground_parameters(ground_data_constant)
+    borefield.borefield = copy.deepcopy(borefield_gt)
+    load = HourlyGeothermalLoad(simulation_period=10)
+    load.load_hourly_profile(FOLDER.joinpath("Examples/hourly_profile.csv"))
+    borefield.load = load
+    borefield.calculate_temperatures(hourly=hourly)
+    results_backup = borefield.results
+
+    depths = [80, 100, 120]
+    results = borefield.calculate_temperatures_batch(depths, hourly=hourly)
+    assert borefield.results == results_backup
+    assert len(results) == 3
+    for idx, depth in enumerate(depths):
+        borefield.calculate_temperatures(depth, hourly=hourly)
+        assert np.allclose(results[idx].Tb, borefield.results.Tb)
+        assert np.allclose(results[idx].peak_injection, borefield.results.peak_injection)
+        assert np.allclose(results[idx].peak_extraction, borefield.results.peak_extraction)
+
+
+def test_calculate_temperatures_batch_building_load():
+    borefield = Borefield()
+    borefield.set_ground_parameters(ground_data_constant)
+    borefield.borefield = copy.deepcopy(borefield_gt)
+    load = HourlyBuildingLoad(efficiency_heating=4, efficiency_cooling=20)
+    load.load_hourly_profile(FOLDER.joinpath("Examples/hourly_profile.csv"))
+    borefield.load = load
+
+    results = borefield.calculate_temperatures_batch([90, 110])
+    assert borefield.results == ResultsMonthly()
+    for idx, depth in enumerate([90, 110]):
+        borefield.calculate_temperatures(depth)
+        assert np.allclose(results[idx].peak_injection, borefield.results.peak_injection)
+
+
+def test_calculate_temperatures_batch_no_hourly_load():
+    borefield = Borefield()
+    borefield.set_ground_parameters(ground_data_constant)
+    borefield.borefield = copy.deepcopy(borefield_gt)
+    borefield.load = MonthlyGeothermalLoadAbsolute(*load_case(1))
+    with pytest.raises(ValueError):
+        borefield.calculate_temperatures_batch([100, 110], hourly=True)
+
+
+@pytest.mark.parametrize("case, result",
+                         zip((1, 2, 3, 4), [131.90418292004594, 0, 139.46239300837794, 131.90418292004594]))
+def test_bracketed_sizing_temperature_gradient(case, result):
+    borefield = Borefield()
+    borefield.ground_data = GroundFluxTemperature(3, 10)
+    borefield.create_rectangular_borefield(10, 5, 7, 7, 100, 0.75)
+    load = MonthlyGeothermalLoadAbsolute(*load_case(case))
+    borefield.load = load
+    borefield.calculation_setup(bracketed_sizing=True)
+
+    depth, _ = borefield._size_based_on_temperature_profile(10)
+    assert np.allclose(result, depth, rtol=0.01)
+    if depth > 0:
+        assert np.isclose(np.max(borefield.results.peak_injection), borefield.Tf_max, atol=0.01)
+
+
+@pytest.mark.parametrize("case", (1, 2, 3, 4))
+def test_bracketed_sizing(case):
+    borefield = Borefield()
+    borefield.set_ground_parameters(ground_data_constant)
+    borefield.borefield = copy.deepcopy(borefield_gt)
+    borefield.load = MonthlyGeothermalLoadAbsolute(*load_case(case))
+
+    depth_L3 = borefield.size_L3(100)
+    quadrant = borefield.limiting_quadrant
+    borefield.calculation_setup(bracketed_sizing=True)
+    assert np.isclose(depth_L3, borefield.size_L3(100), rtol=0.005)
+    assert quadrant == borefield.limiting_quadrant
+    assert np.isclose(depth_L3, borefield.size_L3(100, quadrant_sizing=quadrant), rtol=0.005)
+
+
+def test_bracketed_sizing_L4():
+    borefield = Borefield()
+    borefield.set_ground_parameters(ground_data_constant)
+    borefield.borefield = copy.deepcopy(borefield_gt)
+    load = HourlyGeothermalLoad(simulation_period=10)
+    load.load_hourly_profile(FOLDER.joinpath("Examples/hourly_profile.csv"))
+    borefield.load = load
+
+    depth_L4 = borefield.size_L4(100)
+    borefield.calculation_setup(bracketed_sizing=True)
+    assert np.isclose(depth_L4, borefield.size_L4(100), rtol=0.005)
+
+
+def test_bracketed_sizing_max_nb_of_iterations():
+    borefield = Borefield()
+    borefield.set_ground_parameters(ground_data_constant)
+    borefield.borefield = copy.deepcopy(borefield_gt)
+    borefield.load = MonthlyGeothermalLoadAbsolute(*load_case(1))
+    borefield.calculation_setup(bracketed_sizing=True, max_nb_of_iterations=1)
+    with pytest.raises(MaximumNumberOfIterations):
+        borefield.size_L3(100)
+
+
+def test_gfunction_cache_switching_borefields():
+    borefield = Borefield()
+    borefield.ground_data = ground_data_constant
+    borefield.borefield = gt.boreholes.rectangle_field(6, 5, 6, 6, 100, 1, 0.075)
+    borefield.gfunction([5000, 10000], 100)
+    borefield.borefield = gt.boreholes.rectangle_field(5, 5, 6, 6, 100, 1, 0.075)
+    borefield.gfunction([5000, 10000], 100)
+    assert borefield.gfunction_calculation_object.cache_misses == 2
+
+    borefield.borefield = gt.boreholes.rectangle_field(6, 5, 6, 6, 100, 1, 0.075)
+    assert not np.any(borefield.gfunction_calculation_object.depth_array)
+    borefield.gfunction([5000, 10000], 100)
+    assert borefield.gfunction_calculation_object.cache_misses == 2
+    assert borefield.gfunction_calculation_object.cache_hits == 1
+
+
+def test_gfunction_dimensionless_cache_ground_sweep():
+    borefield = Borefield()
+    borefield.create_rectangular_borefield(10, 10, 6, 6, 110, 1, 0.075)
+    borefield.set_Rb(0.12)
+    borefield.load = MonthlyGeothermalLoadAbsolute(*load_case(1))
+    borefield.gfunction_calculation_object.dimensionless_cache = True
+    depths = []
+    for k_s in np.linspace(2, 3, 5):
+        borefield.ground_data = GroundConstantTemperature(k_s, 10)
+        depths.append(borefield.size_L3(100))
+    misses = borefield.gfunction_calculation_object.cache_misses
+
+    borefield_reference = Borefield()
+    borefield_reference.create_rectangular_borefield(10, 10, 6, 6, 110, 1, 0.075)
+    borefield_reference.set_Rb(0.12)
+    borefield_reference.load = MonthlyGeothermalLoadAbsolute(*load_case(1))
+    for k_s, depth in zip(np.linspace(2, 3, 5), depths):
+        borefield_reference.ground_data = GroundConstantTemperature(k_s, 10)
+        assert np.isclose(borefield_reference.size_L3(100), depth, rtol=1e-2)
+    assert misses < borefield_reference.gfunction_calculation_object.cache_misses
+
+
+def test_prefetch_gfunctions():
+    borefield = Borefield()
+    borefield.create_rectangular_borefield(15, 15, 6, 6, 110, 1, 0.075)
+    borefield.set_Rb(0.12)
+    borefield.ground_data = ground_data_constant
+    borefield.load = MonthlyGeothermalLoadAbsolute(*load_case(4))
+    depth = borefield.size_L3(100)
+    misses = borefield.gfunction_calculation_object.cache_misses
+
+    borefield.gfunction_calculation_object.remove_previous_data()
+    borefield.gfunction_calculation_object.cache_misses = 0
+    borefield.calculation_setup(prefetch_gfunctions=True)
+    assert np.isclose(borefield.size_L3(100), depth, rtol=1e-2)
+    assert borefield.gfunction_calculation_object.cache_misses < misses
+    # the background process is kept for the next sizing
+    executor = borefield.gfunction_calculation_object._prefetch_executor
+    assert executor is not None and not borefield.gfunction_calculation_object._prefetched
+    borefield.load = MonthlyGeothermalLoadAbsolute(*load_case(3))
+    borefield.size_L3(100)
+    assert borefield.gfunction_calculation_object._prefetch_executor is executor
+    borefield.gfunction_calculation_object.stop_prefetch(shutdown=True)
+    assert borefield.gfunction_calculation_object._prefetch_executor is None
+
+
+@pytest.mark.parametrize("case", (1, 2, 3, 4))
+def test_concurrent_quadrants(case, monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+    borefield = Borefield()
+    borefield.set_ground_parameters(ground_data_constant)
+    borefield.borefield = copy.deepcopy(borefield_gt)
+    borefield.load = MonthlyGeothermalLoadAbsolute(*load_case(case))
+
+    depth_L3 = borefield.size_L3(100)
+    quadrant = borefield.limiting_quadrant
+    borefield.calculation_setup(concurrent_quadrants=True)
+    assert np.isclose(depth_L3, borefield.size_L3(100), rtol=0.005)
+    assert quadrant == borefield.limiting_quadrant
+    # the results are the ones of the limiting quadrant
+    if quadrant in (1, 2):
+        assert np.isclose(np.max(borefield.results.peak_injection), borefield.Tf_max, atol=0.1)
+    else:
+        assert np.isclose(np.min(borefield.results.peak_extraction), borefield.Tf_min, atol=0.1)
+
+
+def test_concurrent_quadrants_L4(monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+    borefield = Borefield()
+    borefield.set_ground_parameters(ground_data_constant)
+    borefield.borefield = copy.deepcopy(borefield_gt)
+    load = HourlyGeothermalLoad(simulation_period=10)
+    load.load_hourly_profile(FOLDER.joinpath("Examples/hourly_profile.csv"))
+    borefield.load = load
+
+    depth_L4 = borefield.size_L4(100)
+    quadrant = borefield.limiting_quadrant
+    borefield.calculation_setup(concurrent_quadrants=True)
+    assert np.isclose(depth_L4, borefield.size_L4(100), rtol=0.005)
+    assert quadrant == borefield.limiting_quadrant
+
+
+def test_concurrent_quadrants_temperature_gradient(monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+    borefield = Borefield()
+    borefield.ground_data = GroundFluxTemperature(3, 10)
+    borefield.create_rectangular_borefield(10, 5, 7, 7, 100, 0.75)
+    borefield.load = MonthlyGeothermalLoadAbsolute(*load_case(4))
+    borefield.calculation_setup(concurrent_quadrants=True)
+    depth = borefield.size_L3(100)
+    assert borefield.limiting_quadrant == 4
+    assert np.isclose(np.min(borefield.results.peak_extraction), borefield.Tf_min, atol=0.05)
+    borefield.calculation_setup(concurrent_quadrants=False)
+    assert np.isclose(borefield.size_L3(100), depth, rtol=0.005)
+
+
+def test_concurrent_quadrants_stopped(monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+    stopped = threading.Event()
+    size_based_on_temperature_profile = Borefield._size_based_on_temperature_profile
+
+    def size_min_temp_forever(self, quadrant, hourly=False, deep_sizing=False):
+        if quadrant != 20:
+            return size_based_on_temperature_profile(self, quadrant, hourly, deep_sizing)
+        # the sizing for the minimum temperature never converges
+        self._check_convergence = lambda *args: False
+        try:
+            return size_based_on_temperature_profile(self, quadrant, hourly, deep_sizing)
+        except SizingStopped:
+            stopped.set()
+            raise
+
+    monkeypatch.setattr(Borefield, "_size_based_on_temperature_profile", size_min_temp_forever)
+    borefield = Borefield()
+    borefield.set_ground_parameters(ground_data_constant)
+    borefield.borefield = copy.deepcopy(borefield_gt)
+    borefield.load = MonthlyGeothermalLoadAbsolute(*load_case(1))
+    borefield.calculation_setup(concurrent_quadrants=True)
+    borefield.size_L3(100)
+    assert borefield.limiting_quadrant == 1
+    # the sizing for the minimum temperature is not needed, so it is stopped
+    assert stopped.wait(10)
+    assert not borefield.stop_sizing
+
+
+def test_stop_sizing():
+    borefield = Borefield()
+    borefield.set_ground_parameters(ground_data_constant)
+    borefield.borefield = copy.deepcopy(borefield_gt)
+    borefield.load = MonthlyGeothermalLoadAbsolute(*load_case(1))
+    borefield.stop_sizing = True
+    with pytest.raises(SizingStopped):
+        borefield.size_L3(100)
+    borefield.calculation_setup(bracketed_sizing=True)
+    with pytest.raises(SizingStopped):
+        borefield.size_L3(100)
+
+
+def test_concurrent_quadrants_single_core(monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 1)
+    monkeypatch.setattr(Borefield, "_size_quadrants_concurrently", lambda *args, **kwargs: pytest.fail())
+    borefield = Borefield()
+    borefield.set_ground_parameters(ground_data_constant)
+    borefield.borefield = copy.deepcopy(borefield_gt)
+    borefield.load = MonthlyGeothermalLoadAbsolute(*load_case(1))
+    borefield.calculation_setup(concurrent_quadrants=True)
+    # on a single core, the quadrants are sized one after the other
+    depth = borefield.size_L3(100)
+    borefield.calculation_setup(concurrent_quadrants=False)
+    assert np.isclose(borefield.size_L3(100), depth, rtol=0.005)
+
+
+def test_sizing_memo():
+    borefield = Borefield()
+    borefield.ground_data = GroundFluxTemperature(3, 10)
+    borefield.borefield = copy.deepcopy(borefield_gt)
+    load = MonthlyGeothermalLoadAbsolute(*load_case(1))
+    borefield.load = load
+    borefield.calculation_setup(L3_sizing=True, sizing_memo=True)
+    depth = borefield.size()
+    quadrant, results = borefield.limiting_quadrant, borefield.results
+    assert len(borefield.sizing_memo) == 1
+
+    # an exact hit returns the stored result
+    borefield.H = 100
+    borefield.limiting_quadrant = 0
+    assert borefield.size() == depth
+    assert borefield.sizing_memo.hits == 1
+    assert borefield.H == depth
+    assert borefield.limiting_quadrant == quadrant
+    assert borefield.results == results
+    # the stored results are not shared with the borefield
+    assert borefield.results is not results
+    borefield.results.peak_injection[:] = 0
+    assert borefield.size() == depth
+    assert borefield.results == results
+    assert borefield.sizing_memo.hits == 2
+    # the initial depth is not part of the fingerprint
+    assert borefield.size(H_init=depth) == depth
+    assert borefield.sizing_memo.hits == 3
+
+    # a change in place of the load is a near miss, which starts from the previous depth
+    load.peak_injection = load.peak_injection * 1.02
+    new_depth = borefield.size()
+    assert borefield.sizing_memo.hits == 3
+    assert borefield.sizing_memo.warm_starts == 1
+    assert len(borefield.sizing_memo) == 2
+    reference = Borefield()
+    reference.ground_data = GroundFluxTemperature(3, 10)
+    reference.borefield = copy.deepcopy(borefield_gt)
+    reference.load = MonthlyGeothermalLoadAbsolute(*load_case(1))
+    reference.load.peak_injection = reference.load.peak_injection * 1.02
+    assert np.isclose(new_depth, reference.size_L3(), rtol=0.005)
+
+    # another temperature limit or ground is a new sizing
+    borefield.set_max_avg_fluid_temperature(17)
+    assert borefield.size() < new_depth
+    borefield.ground_data.Tg = 11
+    borefield.size()
+    assert borefield.sizing_memo.hits == 3
+    assert len(borefield.sizing_memo) == 4
+
+    # without the option, the memo is not used
+    borefield.calculation_setup(sizing_memo=False)
+    borefield.size()
+    assert len(borefield.sizing_memo) == 4
+
+
+def test_sizing_memo_building_load():
+    borefield = Borefield()
+    borefield.set_ground_parameters(ground_data_constant)
+    borefield.borefield = copy.deepcopy(borefield_gt)
+    load = HourlyBuildingLoad(efficiency_heating=4, efficiency_cooling=20)
+    load.load_hourly_profile(FOLDER.joinpath("Examples/hourly_profile.csv"))
+    borefield.load = load
+    borefield.calculation_setup(L3_sizing=True, sizing_memo=True)
+    depth = borefield.size()
+    load_results = load.results
+    load.reset_results(0, 17)
+    assert borefield.size() == depth
+    assert borefield.sizing_memo.hits == 1
+    assert load.results == load_results
+
+
+def test_sizing_memo_pickle():
+    borefield = Borefield()
+    del borefield.sizing_memo
+    borefield.__setstate__(borefield.__dict__)
+    assert len(borefield.sizing_memo) == 0
+
+
+def test_gfunction_batch():
+    borefield = Borefield()
+    borefield.create_rectangular_borefield(10, 12, 6, 6, 110, 4, 0.075)
+    borefield.ground_data = ground_data_constant
+    time_values = np.array([3600 * 730, 3600 * 1460, 3600 * 8760])
+    g_values, g_value_peak, g_value_double = borefield.gfunction_batch([time_values, 3600 * 6, [3600 * 6, 3600 * 730]])
+    assert np.array_equal(g_values, borefield.gfunction(np.array([3600 * 6, 3600 * 730, 3600 * 1460, 3600 * 8760]))[1:])
+    assert g_value_peak.shape == (1,)
+    assert np.array_equal(g_value_double, [g_value_peak[0], g_values[0]])
+
+
+def test_monthly_gvalues_memoised():
+    borefield = Borefield()
+    borefield.create_rectangular_borefield(10, 12, 6, 6, 110, 4, 0.075)
+    borefield.set_Rb(0.2)
+    borefield.ground_data = ground_data_constant
+    load = MonthlyGeothermalLoadAbsolute(*load_case(2))
+    load.simulation_period = 5
+    borefield.load = load
+    borefield.calculate_temperatures(100)
+    # the monthly and peak g-values are calculated at once
+    assert borefield.gfunction_calculation_object.cache_misses == 1
+    assert list(borefield._peak_gvalues) == [(100, ground_data_constant.alpha(100), 6 * 3600, 6 * 3600)]
+    results = copy.deepcopy(borefield.results)
+    borefield.calculate_temperatures(100)
+    assert borefield.gfunction_calculation_object.cache_misses == 1
+    assert np.array_equal(borefield.results.peak_injection, results.peak_injection)
+    assert np.array_equal(borefield.results.peak_extraction, results.peak_extraction)
+    # the memoised values are reset when the ground changes
+    borefield.ground_data = GroundConstantTemperature(2, 10)
+    assert borefield._peak_gvalues == {}
+
+
+def test_building_load_fixed_point_acceleration(monkeypatch):
+    cop = COP(np.array([4.42, 5.21, 6.04, 7.52, 9.5, 3.99, 4.58, 5.21, 6.02, 6.83, 3.86, 4.39, 4.97, 5.62, 6.19]),
+              np.array([[-5, 1.06], [0, 1.25], [5, 1.45], [10, 1.66], [15, 1.9], [-5, 2.05], [0, 2.42], [5, 2.81],
+                        [10, 3.2], [15, 3.54], [-5, 3.05], [0, 3.6], [5, 4.17], [10, 4.73], [15, 5.18]]),
+              part_load=True, reference_nominal_power=1, nominal_power=550)
+    iterations = []
+    results = []
+    # the plain iteration is run with the same absolute convergence criterion as the accelerations
+    for acceleration, accelerator in (('anderson', NoAcceleration), ('anderson', AndersonAcceleration),
+                                      ('aitken', AitkenAcceleration)):
+        monkeypatch.setitem(FIXED_POINT_ACCELERATIONS, acceleration, accelerator)
+        borefield = Borefield()
+        borefield.set_ground_parameters(ground_data_constant)
+        borefield.borefield = copy.deepcopy(borefield_gt)
+        borefield.set_Rb(0.12)
+        load = HourlyBuildingLoad(efficiency_heating=cop)
+        load.load_hourly_profile(FOLDER.joinpath("Examples/hourly_profile.csv"), header=True, separator=";")
+        borefield.load = load
+        borefield.calculation_setup(atol=1e-8, fixed_point_acceleration=acceleration)
+        # count the number of iterations
+        set_results = load.set_results
+        counter = []
+        load.set_results = lambda result: counter.append(1) or set_results(result)
+        borefield.calculate_temperatures(60, hourly=True)
+        iterations.append(len(counter))
+        results.append(borefield.results)
+    # all iterations converge to the same solution, but the accelerations need fewer iterations
+    assert np.allclose(results[1].Tf, results[2].Tf, atol=1e-6)
+    assert np.allclose(results[0].Tf, results[1].Tf, atol=1e-6)
+    assert iterations[1] <= iterations[0] - 3
+    assert iterations[2] <= iterations[0] - 3
+
+
+@pytest.mark.parametrize("efficiency_heating", [SCOP(4), COP(np.array([2, 20]), np.array([1, 10]))])
+def test_monthly_temperature_superposition(efficiency_heating):
+    borefield = Borefield()
+    borefield.set_ground_parameters(ground_data_constant)
+    borefield.borefield = copy.deepcopy(borefield_gt)
+    borefield.set_Rb(0.12)
+    hourly_load = HourlyBuildingLoad(efficiency_heating=efficiency_heating, efficiency_cooling=20)
+    hourly_load.load_hourly_profile(FOLDER.joinpath("Examples/hourly_profile.csv"))
+    load = MonthlyBuildingLoadMultiYear(hourly_load.monthly_baseload_heating_simulation_period,
+                                        hourly_load.monthly_baseload_cooling_simulation_period,
+                                        hourly_load.monthly_peak_heating_simulation_period,
+                                        hourly_load.monthly_peak_cooling_simulation_period,
+                                        efficiency_heating, hourly_load._eer)
+    borefield.load = load
+    temperatures = _MonthlyTemperatureSuperposition(borefield, 150)
+    assert borefield.results is temperatures.results
+    # like in the optimisation, the months are updated in order
+    for month in range(32):
+        if month in (0, 5, 6, 30):
+            load._peak_heating[month] *= 0.5
+            load._baseload_heating[month] *= 0.7
+        if month == 31:
+            # the load of an earlier month changes after its update
+            load._baseload_cooling[30] *= 0.5
+        load.clear_cache()
+        temperatures.update(month)
+
+    # the updated months are equal to the converged temperatures of the whole simulation period
+    results = copy.deepcopy(temperatures.results)
+    borefield.calculation_setup(fixed_point_acceleration='anderson', atol=1e-8)
+    borefield.calculate_temperatures(150)
+    for temperature in ('Tb', 'peak_extraction', 'peak_injection', 'monthly_extraction', 'monthly_injection'):
+        assert np.allclose(getattr(results, temperature)[:32], getattr(borefield.results, temperature)[:32])
+
+
+def test_find_peak_limit():
+    evaluations = []
+
+    def margins(peak):
+        evaluations.append(peak)
+        return 5 - 0.05 * peak - 1e-5 * peak ** 2, 1
+
+    # the limit is found within the threshold with a few evaluations
+    peak, (margin, _) = _find_peak_limit(margins, 0, 500, margins(500), 500, 0.05)
+    assert abs(margin) <= 0.05
+    assert np.isclose(peak, 98.04, atol=1)
+    assert len(evaluations) < 10
+    # the maximum peak limit does not exceed the temperature limit
+    assert _find_peak_limit(margins, 0, 20, margins(20), 50, 0.05)[0] == 50
+    # the temperature limit cannot be met
+    assert _find_peak_limit(lambda peak: (-1, 1), 0, 50, (-1, 1), 50, 0.05)[0] == 0.1
+    # the current peak limit is converged
+    evaluations.clear()
+    assert _find_peak_limit(margins, 0, 98, margins(98), 500, 0.05)[0] == 98
+    assert len(evaluations) == 1
+
+
+def test_find_peak_limits_discontinuous():
+    evaluations = []
+
+    def margins(peak_heat_load, peak_cool_load):
+        evaluations.append((peak_heat_load, peak_cool_load))
+        # the margin jumps over the temperature threshold at 50 kW
+        return (1 if peak_heat_load < 50 else -1), 5 - 0.05 * peak_cool_load
+
+    peak_heat_load, peak_cool_load = _find_peak_limits(margins, 500, 500, 0.05, 40)
+    assert np.isclose(peak_heat_load, 50, atol=1e-3) and peak_heat_load < 50
+    assert np.isclose(peak_cool_load, 100, atol=1)
+    # the last evaluation is the one of the found peak limits
+    assert evaluations[-1] == (peak_heat_load, peak_cool_load)
+    assert len(evaluations) < 100
+
+
+def test_find_peak_limits_max_iterations():
+    # every change of the cooling peak limit moves the heating peak limit and vice versa
+    def margins(peak_heat_load, peak_cool_load):
+        return peak_cool_load / 2 - peak_heat_load, peak_heat_load + 10 - peak_cool_load
+
+    with pytest.raises(MaximumNumberOfIterations):
+        _find_peak_limits(margins, 1e6, 1e6, 0.05, 3)
+    assert np.allclose(_find_peak_limits(margins, 1e6, 1e6, 0.05, 40), (10, 20), atol=0.1)
+
+
+def test_optimise_load_profile_lp():
+    borefield = Borefield()
+    borefield.set_ground_parameters(ground_data_constant)
+    borefield.borefield = copy.deepcopy(borefield_gt)
+    borefield.set_Rb(0.2)
+    load = HourlyBuildingLoad(efficiency_heating=4, efficiency_cooling=20)
+    load.load_hourly_profile(FOLDER.joinpath("Examples/hourly_profile.csv"))
+    borefield_load, external_load = borefield.optimise_load_profile_lp(load, 100)
+    assert borefield.load is borefield_load
+    assert borefield_load.simulation_period == external_load.simulation_period == 20
+    assert np.allclose(borefield_load.hourly_heating_load_simulation_period +
+                       external_load.hourly_heating_load_simulation_period, load.hourly_heating_load_simulation_period)
+    # the temperature limits are met
+    borefield.calculate_temperatures(100)
+    assert np.min(borefield.results.peak_extraction) >= borefield.Tf_min - 1e-6
+    assert np.max(borefield.results.peak_injection) <= borefield.Tf_max + 1e-6
+    # the energy is close to the one of the iterative optimisation, which allows a small temperature threshold
+    energy_load, _ = borefield.optimise_load_profile_energy(load, 100)
+    assert np.isclose(np.sum(borefield_load.hourly_heating_load_simulation_period),
+                      np.sum(energy_load.hourly_heating_load_simulation_period), rtol=0.01)
+    assert np.isclose(np.sum(borefield_load.hourly_cooling_load_simulation_period),
+                      np.sum(energy_load.hourly_cooling_load_simulation_period), rtol=0.01)
+    # the peak limits
+    borefield_load, _ = borefield.optimise_load_profile_lp(load, 100, max_peak_heating=100, max_peak_cooling=100)
+    assert borefield_load.max_peak_heating <= 100 + 1e-6
+    assert borefield_load.max_peak_cooling <= 100 + 1e-6
+
+
+def test_optimise_load_profile_lp_errors():
+    borefield = Borefield()
+    borefield.set_ground_parameters(ground_data_constant)
+    borefield.borefield = copy.deepcopy(borefield_gt)
+    with pytest.raises(ValueError):
+        borefield.optimise_load_profile_lp(MonthlyGeothermalLoadAbsolute(*load_case(1)))
+    load = HourlyBuildingLoad(efficiency_heating=4, efficiency_cooling=20, dhw=10 ** 6)
+    load.load_hourly_profile(FOLDER.joinpath("Examples/hourly_profile.csv"))
+    # the DHW demand alone exceeds the minimum temperature
+    with pytest.raises(ValueError):
+        borefield.optimise_load_profile_lp(load, 100)
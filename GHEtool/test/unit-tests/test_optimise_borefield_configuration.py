@@ -0,0 +1,77 @@
+import sys
+
+import numpy as np
+import pygfunction as gt
+import pytest
+
+from GHEtool import Borefield, GroundConstantTemperature
+from GHEtool.VariableClasses.LoadData import MonthlyGeothermalLoadAbsolute
+
+# the module is shadowed by the function with the same name in GHEtool.Methods
+module = sys.modules['GHEtool.Methods.optimise_borefield_configuration']
+
+peak_injection = [0.0, 0, 3.4, 6.9, 13.3, 18.7, 21.3, 24.0, 16.0, 3.7, 0.0, 0.0]
+peak_extraction = [16.0, 14.2, 10.2, 5.5, 0.0, 0.0, 0.0, 0.0, 4.04, 8.5, 11.9, 13.6]
+baseload_extraction = [x * 30 * 10 ** 3 for x in
+                       [0.155, 0.148, 0.125, 0.099, 0.064, 0.0, 0.0, 0.0, 0.061, 0.087, 0.117, 0.144]]
+baseload_injection = [x * 16 * 10 ** 3 for x in
+                      [0.025, 0.05, 0.05, 0.05, 0.075, 0.1, 0.2, 0.2, 0.1, 0.075, 0.05, 0.025]]
+
+
+def create_borefield() -> Borefield:
+    borefield = Borefield(load=MonthlyGeothermalLoadAbsolute(baseload_extraction, baseload_injection,
+                                                             peak_extraction, peak_injection))
+    borefield.set_ground_parameters(GroundConstantTemperature(3, 10))
+    borefield.borefield = gt.boreholes.rectangle_field(2, 2, 6, 6, 100, 4, 0.075)
+    borefield.set_Rb(0.2)
+    return borefield
+
+
+def test_candidate_families():
+    families = module._candidate_families(20, 10, [5], ['rectangle'])
+    # N_1 from 1 to 5 and N_2 from 1 to 3, without the rotated rectangles
+    assert [[(candidate['N_1'], candidate['N_2']) for candidate in family] for family in families] == \
+           [[(1, 1), (1, 2), (1, 3)], [(2, 2), (2, 3)], [(3, 3)], [(4, 1), (4, 2), (4, 3)], [(5, 1), (5, 2), (5, 3)]]
+    families = module._candidate_families(20, 20, [5], ['box', 'circle'])
+    assert all(candidate['N_1'] >= 3 and candidate['N_2'] >= 3 for candidate in families[0])
+    assert [candidate['nb_of_boreholes'] for candidate in families[0]] == [8, 10, 12]
+    assert [candidate['nb_of_boreholes'] for candidate in families[-1]] == list(range(3, 13))
+    assert all(2 * candidate['R'] <= 20 for candidate in families[-1])
+
+
+def test_optimise_borefield_configuration():
+    borefield = create_borefield()
+    results = borefield.optimise_borefield_configuration(30, 20, [6, 10], 150, 40,
+                                                         ['rectangle', 'L', 'U', 'box', 'circle'], 3)
+    assert np.all(np.diff(results['cost']) >= 0)
+    assert np.all((results['depth_L2'] >= 40) & (results['depth_L2'] <= 150))
+    # only the shortlist is sized again, which is the L2 sizing of the calculation setup
+    assert np.array_equal(results['depth'][:3], results['depth_L2'][:3])
+    assert np.all(np.isnan(results['depth'][3:]))
+    # the cheapest configuration is set as borefield
+    best = results.loc[0]
+    assert borefield.number_of_boreholes == best['nb_of_boreholes']
+    assert np.isclose(borefield.H, best['depth'])
+    assert np.isclose(borefield.investment_cost, best['cost'])
+    # the result is the same as sizing the configuration on its own
+    borefield_single = create_borefield()
+    borefield_single.borefield = module._create_field(dict(best, R=None), 100, 4, 0.075)
+    assert np.isclose(borefield_single.size_L2(), best['depth'], rtol=0.005)
+
+
+def test_optimise_borefield_configuration_L3():
+    borefield = create_borefield()
+    borefield.calculation_setup(L3_sizing=True)
+    results = borefield.optimise_borefield_configuration(30, 20, [10], 150, 40, nb_of_candidates=2)
+    assert not np.any(np.isnan(results['depth'][:2]))
+    assert np.all(np.isnan(results['depth'][2:]))
+    assert np.isclose(borefield.H, results['depth'][0])
+    assert np.isclose(borefield.investment_cost, results['cost'][0])
+
+
+def test_optimise_borefield_configuration_errors():
+    borefield = create_borefield()
+    with pytest.raises(ValueError):
+        borefield.optimise_borefield_configuration(30, 20, [6], 150, shapes=['triangle'])
+    with pytest.raises(ValueError):
+        borefield.optimise_borefield_configuration(10, 10, [10], 60)
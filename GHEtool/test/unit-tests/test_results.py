@@ -2,7 +2,7 @@ import pytest
 
 import numpy as np
 
-from GHEtool import ResultsMonthly, ResultsHourly
+from GHEtool import ResultsMonthly, ResultsHourly, ResultsMonthlyBatch, ResultsHourlyBatch
 
 
 def test_monthly():
@@ -51,3 +51,20 @@ def test_eq():
     assert monthly1 != hourly1
     assert monthly2 == monthly3
     assert hourly2 == hourly3
+
+
+def test_monthly_batch():
+    temperatures = np.arange(240).reshape(2, 120)
+    results = ResultsMonthlyBatch(np.array([100, 150]), temperatures, temperatures * 2, temperatures * 3,
+                                  temperatures * 4, temperatures * 5)
+    assert len(results) == 2
+    assert np.array_equal(results.depths, np.array([100, 150]))
+    assert results[1] == ResultsMonthly(temperatures[1], temperatures[1] * 2, temperatures[1] * 3,
+                                        temperatures[1] * 4, temperatures[1] * 5)
+
+
+def test_hourly_batch():
+    results = ResultsHourlyBatch(np.array([100, 150]), np.array([[1, 2, 3], [4, 5, 6]]), np.array([[1, 5, 6], [7, 8, 9]]))
+    assert len(results) == 2
+    assert np.array_equal(results.peak_injection, np.array([[1, 5, 6], [7, 8, 9]]))
+    assert results[0] == ResultsHourly(np.array([1, 2, 3]), np.array([1, 5, 6]))
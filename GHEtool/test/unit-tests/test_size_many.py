@@ -0,0 +1,42 @@
+import numpy as np
+import pygfunction as gt
+
+from GHEtool import size_many, SizingScenario, GroundConstantTemperature, CalculationSetup, FluidData, \
+    DoubleUTube, MonthlyGeothermalLoadAbsolute
+from GHEtool.Validation.cases import load_case
+
+borefield = gt.boreholes.rectangle_field(10, 12, 6, 6, 110, 4, 0.075)
+
+
+def scenarios() -> list:
+    result = [SizingScenario(borefield, GroundConstantTemperature(2 + (i % 3) * 0.5, 10),
+                             MonthlyGeothermalLoadAbsolute(*load_case(1 + i % 4)), Rb=0.2) for i in range(4)]
+    # a scenario that cannot be sized within the maximum number of iterations
+    result.append(SizingScenario(borefield, GroundConstantTemperature(3, 10),
+                                 MonthlyGeothermalLoadAbsolute(*load_case(1)),
+                                 calculation_setup=CalculationSetup(max_nb_of_iterations=1)))
+    result.append(SizingScenario(borefield, GroundConstantTemperature(3, 10),
+                                 MonthlyGeothermalLoadAbsolute(*load_case(2)),
+                                 fluid_data=FluidData(0.2, 0.568, 998, 4180, 1e-3),
+                                 pipe_data=DoubleUTube(1, 0.015, 0.02, 0.4, 0.05), Tf_max=17, Tf_min=3))
+    return result
+
+
+def test_size_many():
+    results = size_many(scenarios())
+    assert list(results.columns) == ['depth', 'error', 'time']
+    # equal to the sizing of every borefield on its own, within the tolerance of the sizing, since the g-values can
+    # be interpolated from the ones of previous scenarios
+    expected = [scenario.create_borefield().size() for scenario in scenarios()[:4]] + [np.nan] + \
+               [scenarios()[-1].create_borefield().size()]
+    assert np.allclose(results['depth'], expected, rtol=0.005, equal_nan=True)
+    assert list(results['error']) == [None] * 4 + ['MaximumNumberOfIterations', None]
+    assert np.all(results['time'] > 0)
+
+
+def test_size_many_workers():
+    results = size_many(scenarios())
+    for chunksize in (None, 3):
+        results_workers = size_many(scenarios(), workers=2, chunksize=chunksize)
+        assert np.allclose(results_workers['depth'], results['depth'], rtol=0.005, equal_nan=True)
+        assert list(results_workers['error']) == list(results['error'])
@@ -0,0 +1,69 @@
+import numpy as np
+
+from GHEtool import GroundConstantTemperature, Borehole
+from GHEtool.VariableClasses import SizingMemo, ResultsMonthly
+from GHEtool.VariableClasses.SizingMemo import fingerprint
+
+
+def test_fingerprint():
+    assert fingerprint(np.array([1., 2.]), 3) == fingerprint(np.array([1., 2.]), 3)
+    assert fingerprint(np.array([1., 2.])) != fingerprint(np.array([1, 2]))
+    assert fingerprint([1, 2]) != fingerprint((1, 2))
+    assert fingerprint({'a': 1, 'b': 2}) == fingerprint({'b': 2, 'a': 1})
+    assert fingerprint(1) != fingerprint(1.)
+
+
+def test_fingerprint_objects():
+    ground_data = GroundConstantTemperature(3, 10)
+    key = fingerprint(ground_data)
+    assert fingerprint(GroundConstantTemperature(3, 10)) == key
+    ground_data.Tg = 11
+    assert fingerprint(ground_data) != key
+
+    borehole = Borehole()
+    key = fingerprint(borehole)
+    borehole.Rb = 0.2
+    assert fingerprint(borehole) != key
+    assert fingerprint(borehole, exclude=('_Rb',)) == fingerprint(Borehole(), exclude=('_Rb',))
+    # the values of the attributes are distinguished as well
+    assert fingerprint(GroundConstantTemperature(3, 10)) != fingerprint(GroundConstantTemperature(3., 10))
+
+
+def test_get_and_store():
+    memo = SizingMemo()
+    results = ResultsMonthly(np.array([1.]))
+    assert memo.get('a') is None
+    memo.store('a', 'config', np.array([1., 2.]), 100, 1, results)
+    assert memo.get('a') == (100, 1, results, None)
+    assert memo.hits == 1
+    # the stored results are copies
+    assert memo.get('a')[2] is not results
+    results.Tb[0] = 10
+    assert memo.get('a')[2] != results
+    memo.clear()
+    assert len(memo) == 0
+    assert memo.hits == 0
+
+
+def test_nearest_depth():
+    memo = SizingMemo()
+    assert memo.nearest_depth('config', np.array([1., 2.])) is None
+    memo.store('a', 'config', np.array([1., 2.]), 100, 1, None)
+    memo.store('b', 'config', np.array([2., 4.]), 150, 1, None)
+    memo.store('c', 'other config', np.array([1.9, 4.1]), 200, 1, None)
+    assert memo.nearest_depth('config', np.array([1.9, 4.1])) == 150
+    assert memo.nearest_depth('config', np.array([1.1, 2.])) == 100
+    assert memo.nearest_depth('config', np.array([1., 2., 3.])) is None
+    assert memo.warm_starts == 2
+
+
+def test_max_number_of_sizings():
+    memo = SizingMemo(2)
+    memo.store('a', 'config', np.array([1.]), 100, 1, None)
+    memo.store('b', 'config', np.array([2.]), 110, 1, None)
+    memo.get('a')
+    memo.store('c', 'config', np.array([3.]), 120, 1, None)
+    # the least recently used sizing is removed
+    assert len(memo) == 2
+    assert memo.get('b') is None
+    assert memo.get('a') is not None